@@ -1,6 +1,6 @@
 import os
+import threading
 from dotenv import load_dotenv
-from langchain_google_genai import ChatGoogleGenerativeAI
 import smtplib
 
 load_dotenv()  
@@ -21,11 +21,118 @@ class Settings:
         "Your-api-key"
     )
 
-    llm: ChatGoogleGenerativeAI = ChatGoogleGenerativeAI(
-        model="gemini-2.5-flash",
-        temperature=0.3,
-        google_api_key=GEMINI_API_KEY,
-    )
+    GEMINI_MODEL: str = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+    GEMINI_TEMPERATURE: float = float(os.getenv("GEMINI_TEMPERATURE", 0.3))
+
+    # Built on first use (see `llm` below) so auth-only workers, scripts and tests
+    # never import langchain_google_genai.
+    _llm = None
+    _llm_lock = threading.Lock()
+
+    @property
+    def llm(self):
+        """
+        Shared ChatGoogleGenerativeAI client, constructed lazily on first access.
+        """
+        if self._llm is None:
+            with self._llm_lock:
+                if self._llm is None:
+                    from langchain_google_genai import ChatGoogleGenerativeAI
+
+                    self._llm = ChatGoogleGenerativeAI(
+                        model=self.GEMINI_MODEL,
+                        temperature=self.GEMINI_TEMPERATURE,
+                        google_api_key=self.GEMINI_API_KEY,
+                        # Retries, deadlines and hedging are handled by llm_client
+                        max_retries=0,
+                    )
+        return self._llm
+
+    @llm.setter
+    def llm(self, client):
+        # Allows swapping the client (fake / cassette) in benchmarks and tests
+        self._llm = client
+
+    # -------------------- LLM ACCOUNTING CONFIG --------------------
+    # USD per 1M tokens (gemini-2.5-flash list price), used for cost estimates
+    LLM_INPUT_COST_PER_1M: float = float(os.getenv("LLM_INPUT_COST_PER_1M", 0.30))
+    LLM_OUTPUT_COST_PER_1M: float = float(os.getenv("LLM_OUTPUT_COST_PER_1M", 2.50))
+    LLM_RECENT_CALLS_KEPT: int = int(os.getenv("LLM_RECENT_CALLS_KEPT", 200))
+    # Per-job buckets kept in the LLM stats (least recently used evicted first)
+    LLM_METRICS_MAX_JOBS: int = int(os.getenv("LLM_METRICS_MAX_JOBS", 500))
+
+    # -------------------- PROMPT TOKEN BUDGETS --------------------
+    # Estimated tokens (~4 chars each) allowed per prompt section; 0 disables truncation
+    RESUME_PROMPT_TOKEN_BUDGET: int = int(os.getenv("RESUME_PROMPT_TOKEN_BUDGET", 3000))
+    REQUIREMENT_PROMPT_TOKEN_BUDGET: int = int(os.getenv("REQUIREMENT_PROMPT_TOKEN_BUDGET", 1500))
+    PARSED_RESUME_PROMPT_TOKEN_BUDGET: int = int(os.getenv("PARSED_RESUME_PROMPT_TOKEN_BUDGET", 2000))
+
+    # -------------------- STRUCTURED OUTPUT --------------------
+    # Ask Gemini for JSON constrained to the output schema (JSON mode + response_schema)
+    LLM_STRUCTURED_OUTPUT: bool = os.getenv("LLM_STRUCTURED_OUTPUT", "True").lower() in ("true", "1")
+    # Extra calls allowed when a reply is not valid JSON or fails schema validation
+    LLM_MAX_REASKS: int = int(os.getenv("LLM_MAX_REASKS", 1))
+
+    # -------------------- JOB PREVIEW --------------------
+    # Generate search keywords from the form in parallel with the job details
+    JOB_PREVIEW_SPECULATIVE_KEYWORDS: bool = os.getenv("JOB_PREVIEW_SPECULATIVE_KEYWORDS", "True").lower() in ("true", "1")
+    JOB_PREVIEW_CACHE_SIZE: int = int(os.getenv("JOB_PREVIEW_CACHE_SIZE", 256))
+    JOB_PREVIEW_CACHE_TTL_SECONDS: float = float(os.getenv("JOB_PREVIEW_CACHE_TTL_SECONDS", 3600))
+
+    # -------------------- RESUME UPLOAD --------------------
+    # Parse and match an uploaded resume in one LLM call instead of two (per-request override: `combined`)
+    COMBINED_PARSE_MATCH: bool = os.getenv("COMBINED_PARSE_MATCH", "False").lower() in ("true", "1")
+    # Reuse stored match results for an unchanged (resume, requirement, prompt version)
+    MATCH_CACHE_ENABLED: bool = os.getenv("MATCH_CACHE_ENABLED", "True").lower() in ("true", "1")
+    # Re-uploads of byte-identical files reuse the stored resume and its parse
+    RESUME_DEDUP_ENABLED: bool = os.getenv("RESUME_DEDUP_ENABLED", "True").lower() in ("true", "1")
+    UPLOAD_CHUNK_SIZE: int = int(os.getenv("UPLOAD_CHUNK_SIZE", 1024 * 1024))
+    # Uploads larger than this are rejected with 413 (checked while streaming)
+    MAX_UPLOAD_SIZE_MB: float = float(os.getenv("MAX_UPLOAD_SIZE_MB", 20))
+
+    # -------------------- CANDIDATE RETRIEVAL --------------------
+    VECTOR_INDEX_DIM: int = int(os.getenv("VECTOR_INDEX_DIM", 512))
+    # Local /candidates/find: LLM-evaluate only the nearest resumes (top_n * factor, at least the minimum)
+    VECTOR_SHORTLIST_ENABLED: bool = os.getenv("VECTOR_SHORTLIST_ENABLED", "True").lower() in ("true", "1")
+    VECTOR_SHORTLIST_FACTOR: int = int(os.getenv("VECTOR_SHORTLIST_FACTOR", 3))
+    VECTOR_SHORTLIST_MIN: int = int(os.getenv("VECTOR_SHORTLIST_MIN", 10))
+    # Resumes matched concurrently per batch by /candidates/find
+    CANDIDATE_EVAL_CONCURRENCY: int = int(os.getenv("CANDIDATE_EVAL_CONCURRENCY", 4))
+    # Vector-shortlist search stops once top_n candidates score at least this
+    # (0 disables early stop; the unranked file-store scan always runs to the end)
+    CANDIDATE_EARLY_STOP_SCORE: float = float(os.getenv("CANDIDATE_EARLY_STOP_SCORE", 80))
+
+    # -------------------- FOLDER INDEXER --------------------
+    # Ingest resumes dropped into RESUME_FOLDER (e.g. SFTP sync) in the background
+    INDEXER_ENABLED: bool = os.getenv("INDEXER_ENABLED", "False").lower() in ("true", "1")
+    INDEXER_POLL_SECONDS: float = float(os.getenv("INDEXER_POLL_SECONDS", 30))
+    # Full rescan interval when inotify is active (catches missed events)
+    INDEXER_RESCAN_SECONDS: float = float(os.getenv("INDEXER_RESCAN_SECONDS", 600))
+    INDEXER_SETTLE_SECONDS: float = float(os.getenv("INDEXER_SETTLE_SECONDS", 2))
+    INDEXER_CONCURRENCY: int = int(os.getenv("INDEXER_CONCURRENCY", 4))
+    # Transient ingest failures (LLM, database) are retried this often with
+    # exponential backoff, then left for the next scan
+    INDEXER_INGEST_ATTEMPTS: int = int(os.getenv("INDEXER_INGEST_ATTEMPTS", 3))
+    INDEXER_RETRY_BASE_SECONDS: float = float(os.getenv("INDEXER_RETRY_BASE_SECONDS", 1))
+
+    # -------------------- LLM RESILIENCE --------------------
+    LLM_TIMEOUT_SECONDS: float = float(os.getenv("LLM_TIMEOUT_SECONDS", 45))  # per attempt
+    LLM_DEADLINE_SECONDS: float = float(os.getenv("LLM_DEADLINE_SECONDS", 90))  # all attempts + backoff
+    LLM_MAX_RETRIES: int = int(os.getenv("LLM_MAX_RETRIES", 3))
+    LLM_BACKOFF_BASE_SECONDS: float = float(os.getenv("LLM_BACKOFF_BASE_SECONDS", 0.5))
+    LLM_BACKOFF_MAX_SECONDS: float = float(os.getenv("LLM_BACKOFF_MAX_SECONDS", 8))
+    # Fire a duplicate request when an interactive call is slower than this; 0 disables hedging
+    LLM_HEDGE_AFTER_SECONDS: float = float(os.getenv("LLM_HEDGE_AFTER_SECONDS", 0))
+    LLM_HEDGE_CALL_SITES: str = os.getenv("LLM_HEDGE_CALL_SITES", "parse_resume,check_match,parse_and_match")
+    LLM_CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("LLM_CIRCUIT_FAILURE_THRESHOLD", 5))
+    LLM_CIRCUIT_RESET_SECONDS: float = float(os.getenv("LLM_CIRCUIT_RESET_SECONDS", 30))
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", 16))
+
+    # -------------------- LLM CASSETTE (RECORD / REPLAY) --------------------
+    LLM_CASSETTE_MODE: str = os.getenv("LLM_CASSETTE_MODE", "off")  # off | record | replay
+    LLM_CASSETTE_PATH: str = os.getenv("LLM_CASSETTE_PATH", "cassettes/llm_cassette.jsonl")
+    LLM_CASSETTE_MISS_POLICY: str = os.getenv("LLM_CASSETTE_MISS_POLICY", "family")  # family | passthrough | error
+    LLM_CASSETTE_LATENCY_SCALE: float = float(os.getenv("LLM_CASSETTE_LATENCY_SCALE", 1.0))
 
     # -------------------- EMAIL CONFIG --------------------
     SMTP_HOST: str = os.getenv("SMTP_HOST", "smtp.gmail.com")
@@ -33,18 +140,41 @@ class Settings:
     SMTP_USER: str = os.getenv("SMTP_USER", "your_gmail")
     SMTP_PASSWORD: str = os.getenv("SMTP_PASSWORD", "your_app_password")
     SMTP_TLS: bool = os.getenv("SMTP_TLS", "True").lower() in ("true", "1")
+    # Status emails: one LLM template per (status, job), filled locally per candidate
+    EMAIL_TEMPLATE_CACHE_TTL_SECONDS: float = float(os.getenv("EMAIL_TEMPLATE_CACHE_TTL_SECONDS", 86400))
+    # Optional one-sentence personal note per candidate, written in batched LLM calls
+    EMAIL_PERSONALIZATION: bool = os.getenv("EMAIL_PERSONALIZATION", "False").lower() in ("true", "1")
+    EMAIL_PERSONALIZATION_BATCH_SIZE: int = int(os.getenv("EMAIL_PERSONALIZATION_BATCH_SIZE", 25))
 
     # -------------------- APOLLO.IO CONFIG --------------------
     APOLLO_API_KEY: str = os.getenv(
         "APOLLO_API_KEY",
         "Your-key"
     )
+    APOLLO_BASE_URL: str = os.getenv("APOLLO_BASE_URL", "https://api.apollo.io")
+    APOLLO_TIMEOUT_SECONDS: float = float(os.getenv("APOLLO_TIMEOUT_SECONDS", 20))
+    # Pooled keep-alive connections shared by all requests
+    APOLLO_MAX_CONNECTIONS: int = int(os.getenv("APOLLO_MAX_CONNECTIONS", 20))
+    APOLLO_PAGE_SIZE: int = int(os.getenv("APOLLO_PAGE_SIZE", 25))
+    APOLLO_MAX_PARALLEL_PAGES: int = int(os.getenv("APOLLO_MAX_PARALLEL_PAGES", 4))
+    APOLLO_CACHE_SIZE: int = int(os.getenv("APOLLO_CACHE_SIZE", 256))
+    APOLLO_CACHE_TTL_SECONDS: float = float(os.getenv("APOLLO_CACHE_TTL_SECONDS", 900))
 
     # -------------------- FOLDER CONFIG --------------------
     UPLOAD_FOLDER: str = os.getenv("UPLOAD_FOLDER", "uploads")
     REQUIREMENT_FOLDER: str = os.path.join(UPLOAD_FOLDER, "requirements")
     RESUME_FOLDER: str = os.path.join(UPLOAD_FOLDER, "resumes")
     MATCH_RESULT: str = os.path.join(UPLOAD_FOLDER,"match_results")
+    PROFILE_FOLDER: str = os.getenv("PROFILE_FOLDER", os.path.join(UPLOAD_FOLDER, "profiles"))
+    VECTOR_INDEX_FOLDER: str = os.getenv("VECTOR_INDEX_FOLDER", os.path.join(UPLOAD_FOLDER, "vector_index"))
+    # Content-addressed store for uploaded resumes and requirement files
+    FILE_STORE_FOLDER: str = os.getenv("FILE_STORE_FOLDER", os.path.join(UPLOAD_FOLDER, "store"))
+    # gzip sidecars of extracted resume text, one per file content hash
+    TEXT_CACHE_FOLDER: str = os.getenv("TEXT_CACHE_FOLDER", os.path.join(UPLOAD_FOLDER, "text_cache"))
+    TEXT_EXTRACTOR_VERSION: str = os.getenv("TEXT_EXTRACTOR_VERSION", "1")
+    INDEXER_CHECKPOINT_PATH: str = os.getenv(
+        "INDEXER_CHECKPOINT_PATH", os.path.join(UPLOAD_FOLDER, "indexer_checkpoint.json")
+    )
 
     # Create folders safely
     for folder in [UPLOAD_FOLDER, REQUIREMENT_FOLDER, RESUME_FOLDER]:
@@ -1,8 +1,12 @@
 import os
 import json
+import asyncio
+import hashlib
+import time
 from datetime import datetime
 from fastapi import UploadFile, File, Form, Body
-from app.repository.job_repository import JobRepository
+from fastapi.responses import StreamingResponse
+from app.repository.job_repository import JOB_SUMMARY_FIELDS, JobRepository
 from app.views.response_formatter import format_response
 from app.repository.resume_repository import ResumeRepository
 from app.repository.match_result_repository import MatchResultRepository
@@ -10,45 +14,121 @@ from app.services.agent import (
     generate_job_details,
     generate_search_keywords,
     parse_resume_with_gemini,
-    check_match, 
-)
-from app.services.agent.candidate_finder_agent import find_candidates,find_candidates_via_apollo,find_local_candidates
-from app.services.agent.resume_parser_agent import (
-    extract_text_from_pdf,
-    extract_text_from_docx
+    check_match,
+    parse_and_match_with_gemini,
 )
+from app.services.agent.candidate_finder_agent import find_candidates_via_apollo
+from app.services.agent.resume_parser_agent import extract_resume_text
 from fastapi import HTTPException
 from app.config.config import settings
 from app.services.utils.log import logger
+from app.services.utils.llm_metrics import llm_context, llm_metrics
+from app.services.utils.ttl_cache import TTLCache
+from app.services.utils.vector_index import index_resume, search_resumes
+from app.services.utils.skill_vocabulary import normalize_skills
+from app.services.utils.upload_utils import UploadTooLargeError, discard_upload
+from app.services.utils.file_store import REQUIREMENT, RESUME, get_file_store
+from app.services.utils.resume_ingest import build_resume_record, sync_resume_index
+from app.services.utils.ranking import TopCandidates, match_score
+from app.services.utils.match_cache import (
+    COMBINED,
+    SEPARATE,
+    cached_check_match,
+    get_cached_match,
+    match_cache_key,
+    resume_cache_key,
+    save_match,
+)
 # # -------------------- PATH SETUP --------------------
 UPLOAD_FOLDER = settings.UPLOAD_FOLDER
 REQUIREMENT_FOLDER = settings.REQUIREMENT_FOLDER
 RESUME_FOLDER = settings.RESUME_FOLDER
 MATCH_RESULT = settings.MATCH_RESULT
 
+# -------------------- 1️⃣ JOB PREVIEW (CACHED, CONCURRENT) --------------------
+# Previews keyed by a hash of the form; HR regenerates the same preview while editing
+_preview_cache = TTLCache(maxsize=settings.JOB_PREVIEW_CACHE_SIZE, ttl=settings.JOB_PREVIEW_CACHE_TTL_SECONDS)
+
+
+def _form_hash(*fields) -> str:
+    return hashlib.sha256(json.dumps([str(f).strip() for f in fields]).encode("utf-8")).hexdigest()
+
+
+async def _cached_preview_part(key: tuple, fn, *args) -> dict:
+    """
+    Runs a blocking agent call in a worker thread, memoized in the preview cache.
+    """
+    cached = _preview_cache.get(key)
+    llm_metrics.record_cache_lookup("job_preview", hit=cached is not None)
+    if cached is not None:
+        return cached
+    result = await asyncio.to_thread(fn, *args)
+    if "raw_response" not in result:
+        _preview_cache.set(key, result)
+    return result
+
+
+async def _preview_stream(details_task, keywords_task, keywords_from_details):
+    """
+    NDJSON events: job_details as soon as it is ready, then search_keywords, then done.
+    """
+    try:
+        job_details = await details_task
+        yield json.dumps({"event": "job_details", "data": job_details}) + "\n"
+        search_data = await (keywords_task or keywords_from_details(job_details))
+        yield json.dumps({"event": "search_keywords", "data": search_data}) + "\n"
+        yield json.dumps({"event": "done"}) + "\n"
+    except Exception as e:
+        if keywords_task:
+            keywords_task.cancel()
+        yield json.dumps({"event": "error", "message": f"Error generating job preview: {str(e)}"}) + "\n"
+
+
 async def create_job_summary_controller(
     title: str,
     summary: str,
     experience: str,
     location: str,
     employment_type: str,
+    stream: bool = False,
 ):
     """
     Generates a detailed job requirement (preview) but does NOT store it in DB.
     Used for frontend preview before posting.
+
+    With JOB_PREVIEW_SPECULATIVE_KEYWORDS, search keywords are generated from the
+    form in parallel with the job details instead of after them. Both parts are
+    cached by form hash. `stream=True` returns NDJSON, job details first.
     """
+    keywords_task = None
     try:
-        # Step 1: Generate job details
-        job_details = generate_job_details(
-            summary_text=summary,
-            title=title,
-            experience=experience,
-            location=location,
-            employment_type=employment_type
-        )
+        # Step 1: Generate job details (and speculatively, search keywords)
+        details_task = asyncio.create_task(_cached_preview_part(
+            ("details", _form_hash(title, summary, experience, location, employment_type)),
+            generate_job_details, summary, title, experience, location, employment_type,
+        ))
+        if settings.JOB_PREVIEW_SPECULATIVE_KEYWORDS:
+            form_context = {"title": title, "summary": summary, "experience": experience, "location": location}
+            keywords_task = asyncio.create_task(_cached_preview_part(
+                ("keywords", _form_hash(title, summary, experience, location)),
+                generate_search_keywords, form_context,
+            ))
+
+        def keywords_from_details(job_details):
+            return _cached_preview_part(
+                ("keywords", _form_hash(json.dumps(job_details, sort_keys=True))),
+                generate_search_keywords, job_details,
+            )
+
+        if stream:
+            return StreamingResponse(
+                _preview_stream(details_task, keywords_task, keywords_from_details),
+                media_type="application/x-ndjson",
+            )
 
-        # Step 2: Generate search keywords
-        search_data = generate_search_keywords(job_details)
+        # Step 2: Generate search keywords (if not already running)
+        job_details = await details_task
+        search_data = await (keywords_task or keywords_from_details(job_details))
         job_details.update(search_data)
 
         # Step 3: Return formatted response
@@ -58,6 +138,8 @@ async def create_job_summary_controller(
         )
 
     except Exception as e:
+        if keywords_task:
+            keywords_task.cancel()
         raise HTTPException(
             status_code=500,
             detail=f"Error generating job preview: {str(e)}"
@@ -90,10 +172,10 @@ async def post_job_to_db_controller(job_data: dict):
     - {"anyKey": {"data": {...}}}
     """
     try:
-        logger.debug(f"{job_data}")
+        logger.debug("Incoming job_data: %s", job_data)
         os.makedirs(REQUIREMENT_FOLDER, exist_ok=True)
 
-        print("DEBUG incoming job_data keys:", list(job_data.keys()))
+        logger.debug("Incoming job_data keys: %s", list(job_data.keys()))
 
         job_info = None
 
@@ -167,6 +249,34 @@ async def post_job_to_db_controller(job_data: dict):
         raise HTTPException(status_code=500, detail=f"Error posting job: {str(e)}")
 
 
+async def search_jobs_controller(
+    q: str = None, prefix: bool = False, is_active: bool = None,
+    limit: int = 20, cursor: str = None, slim: bool = True,
+):
+    """
+    Server-side job search for the job picker: text search on title, skills and
+    description, or title autocomplete with `prefix`. Pages are fetched with
+    the returned `next_cursor`.
+    """
+    start = time.perf_counter()
+    jobs, next_cursor = await JobRepository.search_jobs(
+        q=(q or "").strip() or None,
+        prefix=prefix,
+        is_active=is_active,
+        limit=limit,
+        cursor=cursor,
+        projection=JOB_SUMMARY_FIELDS if slim else None,
+    )
+    return format_response(
+        {
+            "jobs": jobs,
+            "next_cursor": next_cursor,
+            "search_ms": round((time.perf_counter() - start) * 1000, 2),
+        },
+        message=f"✅ {len(jobs)} job(s) found"
+    )
+
+
 async def get_job_details_controller(job_id: str):
     """
     Fetch job requirement by ID.
@@ -261,10 +371,14 @@ def parse_job_text(text: str):
 async def parse_resume_controller(
     resume: UploadFile = File(...),
     job_id: str = Form(...),
+    combined: bool = None,
 ):
     """
     Parses a resume (PDF/DOCX), compares it with a selected existing job requirement
     (chosen from DB or /uploads/requirements), and stores the structured results in MongoDB.
+    With `combined` (default: COMBINED_PARSE_MATCH) parsing and matching share one LLM call.
+    A byte-identical re-upload reuses the stored resume and its parse; a new match
+    result row is only written when the stored one is missing or outdated.
     """
 
     try:
@@ -282,42 +396,90 @@ async def parse_resume_controller(
         if not requirement_path or not os.path.exists(requirement_path):
             return format_response(None, message="Requirement file not found on server")
 
-        # ✅ Save uploaded resume
-        os.makedirs(RESUME_FOLDER, exist_ok=True)
-        resume_path = os.path.join(RESUME_FOLDER, resume.filename)
-        with open(resume_path, "wb") as buffer:
-            buffer.write(await resume.read())
-
-        # ✅ Read requirement file content
-        with open(requirement_path, "r", encoding="utf-8") as f:
-            requirement_text = f.read().strip()
+        # ✅ Stream the upload to disk, hashing it on the way
+        store = get_file_store()
+        temp_path, file_hash, file_size = await store.stream_to_temp(resume)
+        try:
+            # ✅ Read requirement file content
+            with open(requirement_path, "r", encoding="utf-8") as f:
+                requirement_text = f.read().strip()
+
+            existing = None
+            if settings.RESUME_DEDUP_ENABLED:
+                existing = await ResumeRepository.find_by_content_hash(file_hash)
+
+            if not existing:
+                file_ext = os.path.splitext(resume.filename)[1].lower()
+                stored = await store.commit(
+                    temp_path, file_hash, file_size, file_ext, RESUME, os.path.basename(resume.filename)
+                )
+        finally:
+            # No-op once committed; drops the temp file on reuse or failure
+            discard_upload(temp_path)
+
+        if existing:
+            # ✅ Byte-identical file seen before: reuse its stored text and parse
+            resume_id = existing["_id"]
+            parsed_resume = existing.get("parsed_data") or {}
+            with llm_context(job_id=job_id):
+                match_result = await cached_check_match(
+                    requirement_text, parsed_resume, resume_cache_key(existing),
+                    resume_text=existing.get("raw_text", ""), job_id=job_id
+                )
+            linkedin_verified = bool(
+                parsed_resume.get("linkedin_url") and "linkedin.com" in parsed_resume["linkedin_url"].lower()
+            )
+            previous = await MatchResultRepository.find_by_resume_and_job(resume_id, job_id)
+            if previous and previous.get("raw_response") == match_result:
+                return format_response(
+                    data={
+                        "parsed_resume": parsed_resume,
+                        "match_result": match_result,
+                        "linkedin_verified": linkedin_verified,
+                        "resume_id": resume_id,
+                        "job_id": job_id,
+                        "match_result_id": previous["_id"],
+                        "duplicate": True,
+                    },
+                    message="✅ Resume already processed for this job; returning the stored result"
+                )
+        else:
+            resume_path = stored["path"]
 
-        # ✅ Extract and parse resume
-        resume_text = (
-            extract_text_from_pdf(resume_path)
-            if resume.filename.lower().endswith(".pdf")
-            else extract_text_from_docx(resume_path)
-        )
+            # ✅ Extract and parse resume
+            resume_text = await asyncio.to_thread(extract_resume_text, resume_path, file_hash)
 
-        parsed_resume = parse_resume_with_gemini(resume_text)
-        match_result = check_match(requirement_text, parsed_resume)
+            use_combined = settings.COMBINED_PARSE_MATCH if combined is None else combined
+            cache_key = match_cache_key(
+                file_hash, resume_text, requirement_text, job_id, variant=COMBINED if use_combined else SEPARATE
+            )
+            match_result = await get_cached_match(cache_key)
+            with llm_context(job_id=job_id):
+                if match_result is not None:
+                    # Same resume content already scored against this requirement
+                    parsed_resume = await asyncio.to_thread(parse_resume_with_gemini, resume_text)
+                elif use_combined:
+                    result = await asyncio.to_thread(parse_and_match_with_gemini, resume_text, requirement_text)
+                    parsed_resume, match_result = result["parsed_resume"], result["match_result"]
+                    await save_match(cache_key, match_result)
+                else:
+                    parsed_resume = await asyncio.to_thread(parse_resume_with_gemini, resume_text)
+                    match_result = await asyncio.to_thread(check_match, requirement_text, parsed_resume)
+                    await save_match(cache_key, match_result)
 
-        # ✅ Determine LinkedIn verification
-        linkedin_verified = bool(
-            parsed_resume.get("linkedin_url") and "linkedin.com" in parsed_resume["linkedin_url"].lower()
-        )
+            # ✅ Determine LinkedIn verification
+            linkedin_verified = bool(
+                parsed_resume.get("linkedin_url") and "linkedin.com" in parsed_resume["linkedin_url"].lower()
+            )
 
-        # ✅ Save parsed resume to DB
-        resume_record = {
-            "file_name": resume.filename,
-            "file_path": resume_path,
-            "file_type": "pdf" if resume.filename.lower().endswith(".pdf") else "docx",
-            "parsed_data": parsed_resume,
-            "skills": parsed_resume.get("skills", []),
-            "raw_text": resume_text,
-            "uploaded_at": datetime.utcnow(),
-        }
-        resume_id = await ResumeRepository.create_resume(resume_record)
+            # ✅ Save parsed resume to DB
+            resume_record = build_resume_record(os.path.basename(resume.filename), stored, parsed_resume, resume_text)
+            resume_id, created = await ResumeRepository.create_unique_resume(resume_record)
+            if created:
+                await asyncio.to_thread(index_resume, resume_id, resume_record)
+            else:
+                # A concurrent upload of the same file stored it first
+                existing = {"_id": resume_id}
 
         # ✅ Save match result to DB
         match_record = {
@@ -325,12 +487,13 @@ async def parse_resume_controller(
             "job_id": job_id,
             "status": match_result.get("status", "unknown"),
             "reason": match_result.get("reason", ""),
-            "accuracy": match_result.get("accuracy", 0),
+            "score": match_score(match_result),
+            "accuracy": match_score(match_result),
             "raw_response": match_result,
             "linked_verified": linkedin_verified,
             "created_at": datetime.utcnow(),
         }
-        await MatchResultRepository.create_match_result(match_record)
+        match_result_id = await MatchResultRepository.create_match_result(match_record)
 
         return format_response(
             data={
@@ -339,87 +502,202 @@ async def parse_resume_controller(
                 "linkedin_verified": linkedin_verified,
                 "resume_id": resume_id,
                 "job_id": job_id,
+                "match_result_id": match_result_id,
+                "duplicate": bool(existing),
             },
             message="✅ Resume parsed and matched successfully"
         )
 
+    except UploadTooLargeError:
+        raise
     except Exception as e:
         return format_response(None, message=f"❌ Error while parsing resume: {str(e)}")
 
 
        
-def find_local_candidates(job_details: dict, resumes_folder: str = RESUME_FOLDER) -> list:
+async def _rank_candidates(batches, evaluate, top_n: int, early_stop: bool = False) -> list:
     """
-    Matches local resumes from the 'uploads' folder against the given job description.
+    Feeds evaluated candidates into a bounded top-N heap, one concurrent batch
+    at a time. With `early_stop` (only for batches arriving best pre-ranked
+    first) it stops once top_n candidates reach CANDIDATE_EARLY_STOP_SCORE.
     """
-    matched = []
-
-    if not os.path.exists(resumes_folder):
-        return matched
-
-    for file_name in os.listdir(resumes_folder):
-        if not (file_name.lower().endswith(".pdf") or file_name.lower().endswith(".docx")):
-            continue
-
-        file_path = os.path.join(resumes_folder, file_name)
+    top = TopCandidates(top_n)
+    try:
+        async for batch in batches:
+            for result in await asyncio.gather(*(evaluate(item) for item in batch)):
+                if result is not None:
+                    top.push(result, result["match_result"])
+            if early_stop and top.full_above(settings.CANDIDATE_EARLY_STOP_SCORE):
+                break
+    finally:
+        await batches.aclose()
+    logger.info("🎯 Ranked %s evaluated candidates, kept top %s", top.seen, len(top))
+    return top.results()
+
+
+async def find_local_candidates(job_details: dict, top_n: int = 5) -> list:
+    """
+    Matches the resumes in the file store against the given job description
+    and returns the best `top_n` by accuracy score. Resumes dropped into
+    RESUME_FOLDER and not yet stored are imported first.
+    """
+    requirement_text = job_details.get("description", "")
+    imported = await get_file_store().sync_folder(RESUME_FOLDER, RESUME)
+    if imported:
+        logger.info("📥 Imported %s new resume file(s) from %s", imported, RESUME_FOLDER)
+
+    async def batches():
+        batch = []
+        async for stored in get_file_store().iter_files(RESUME):
+            if stored["ext"] not in (".pdf", ".docx"):
+                continue
+            batch.append(stored)
+            if len(batch) >= settings.CANDIDATE_EVAL_CONCURRENCY:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def evaluate(stored):
         try:
-            text = extract_text_from_pdf(file_path) if file_name.lower().endswith(".pdf") else extract_text_from_docx(file_path)
-            parsed_resume = parse_resume_with_gemini(text)
-            match_result = check_match(job_details.get("description", ""), parsed_resume)
-
-            matched.append({
-                "file_name": file_name,
+            text = await asyncio.to_thread(extract_resume_text, stored["path"], stored["content_hash"])
+            parsed_resume = await asyncio.to_thread(parse_resume_with_gemini, text)
+            match_result = await cached_check_match(
+                requirement_text, parsed_resume, stored["content_hash"], resume_text=text
+            )
+            return {
+                "file_name": stored["name"],
                 "parsed_resume": parsed_resume,
                 "match_result": match_result
-            })
+            }
         except Exception as e:
-            print(f"❌ Failed to process local resume {file_name}: {e}")
-
-    matched.sort(
-        key=lambda x: (
-            1 if isinstance(x.get("match_result", {}), dict) and x["match_result"].get("status") == "pass" else 0
-        ),
-        reverse=True
-    )
+            logger.error("❌ Failed to process local resume %s: %s", stored["name"], e)
+            return None
 
-    return matched
+    return await _rank_candidates(batches(), evaluate, top_n)
 
 
-def find_local_candidates(job_details: dict, resumes_folder: str = RESUME_FOLDER) -> list:
+async def find_indexed_candidates(job_details: dict, top_n: int) -> list:
     """
-    Matches local resumes from the 'uploads' folder against the given job description.
+    Matches only the resumes nearest to the job description in the vector index.
+    Stored parses are reused, so each shortlisted resume costs at most one
+    (cached) match call instead of a parse and a match. The shortlist is
+    evaluated in similarity order, so early stopping skips the least relevant.
     """
-    matched = []
-
-    if not os.path.exists(resumes_folder):
-        return matched
-
-    for file_name in os.listdir(resumes_folder):
-        if not (file_name.lower().endswith(".pdf") or file_name.lower().endswith(".docx")):
-            continue
-
-        file_path = os.path.join(resumes_folder, file_name)
+    requirement_text = job_details.get("description", "")
+    shortlist_size = max(top_n * settings.VECTOR_SHORTLIST_FACTOR, settings.VECTOR_SHORTLIST_MIN)
+    shortlist = await asyncio.to_thread(search_resumes, requirement_text, shortlist_size)
+    similarity = dict(shortlist)
+
+    async def batches():
+        size = max(1, settings.CANDIDATE_EVAL_CONCURRENCY)
+        for start in range(0, len(shortlist), size):
+            ids = [resume_id for resume_id, _ in shortlist[start:start + size]]
+            resumes = await ResumeRepository.find_by_ids(ids)
+            # Similarity order within the batch too: on equal scores the earlier push wins
+            yield sorted(resumes, key=lambda r: similarity[r["_id"]], reverse=True)
+
+    async def evaluate(resume):
         try:
-            text = extract_text_from_pdf(file_path) if file_name.lower().endswith(".pdf") else extract_text_from_docx(file_path)
-            parsed_resume = parse_resume_with_gemini(text)
-            match_result = check_match(job_details.get("description", ""), parsed_resume)
-
-            matched.append({
-                "file_name": file_name,
+            parsed_resume = resume.get("parsed_data") or {}
+            match_result = await cached_check_match(
+                requirement_text, parsed_resume, resume_cache_key(resume), resume_text=resume.get("raw_text", "")
+            )
+            return {
+                "file_name": resume.get("file_name"),
+                "resume_id": resume["_id"],
+                "similarity": round(similarity[resume["_id"]], 4),
                 "parsed_resume": parsed_resume,
                 "match_result": match_result
-            })
+            }
         except Exception as e:
-            print(f"❌ Failed to process local resume {file_name}: {e}")
+            logger.error("❌ Failed to match indexed resume %s: %s", resume["_id"], e)
+            return None
+
+    return await _rank_candidates(batches(), evaluate, top_n, early_stop=True)
 
-    matched.sort(
-        key=lambda x: (
-            1 if isinstance(x.get("match_result", {}), dict) and x["match_result"].get("status") == "pass" else 0
-        ),
-        reverse=True
+
+async def search_candidates_controller(description: str = None, job_id: str = None, top_k: int = 10):
+    """
+    Vector-index retrieval only (no LLM): the `top_k` resumes nearest to a job
+    description or to a stored job's requirement.
+    """
+    if job_id:
+        job = await JobRepository.find_by_id(job_id)
+        description = "\n".join(
+            str(part) for part in (
+                job.get("title", ""),
+                job.get("description", ""),
+                " ".join(job.get("skills", []) or []),
+                " ".join(job.get("requirements", []) or []),
+            ) if part
+        )
+    if not description:
+        raise HTTPException(status_code=400, detail="Provide a job description or job_id")
+
+    start = time.perf_counter()
+    hits = await asyncio.to_thread(search_resumes, description, top_k)
+    search_ms = (time.perf_counter() - start) * 1000
+    resumes = await ResumeRepository.find_by_ids(
+        [resume_id for resume_id, _ in hits], {"file_name": 1, "parsed_data.name": 1, "skills": 1}
+    )
+    scores = dict(hits)
+    return format_response(
+        {
+            "total": len(resumes),
+            "search_ms": round(search_ms, 2),
+            "candidates": [
+                {
+                    "resume_id": r["_id"],
+                    "score": round(scores[r["_id"]], 4),
+                    "candidate_name": (r.get("parsed_data") or {}).get("name"),
+                    "file_name": r.get("file_name"),
+                    "skills": r.get("skills", []),
+                }
+                for r in resumes
+            ],
+        },
+        message=f"Top {len(resumes)} candidates by similarity"
     )
 
-    return matched
+
+async def search_by_skills_controller(
+    all_skills: list = None, any_skills: list = None, limit: int = 50, skip: int = 0
+):
+    """
+    Skill filter over the whole resume corpus: every skill in `all_skills` (AND)
+    and at least one in `any_skills` (OR). Query skills go through the same
+    vocabulary as ingestion, so "K8s" finds resumes listing "Kubernetes".
+    """
+    all_normalized = normalize_skills(all_skills or [])
+    any_normalized = normalize_skills(any_skills or [])
+    if not all_normalized and not any_normalized:
+        raise HTTPException(status_code=400, detail="Provide at least one skill in 'all' or 'any'")
+
+    start = time.perf_counter()
+    total, resumes = await ResumeRepository.find_by_skills(
+        all_normalized, any_normalized, limit=limit, skip=skip,
+        projection={"file_name": 1, "parsed_data.name": 1, "parsed_data.email": 1, "skills": 1, "skills_normalized": 1},
+    )
+    return format_response(
+        {
+            "query": {"all": all_normalized, "any": any_normalized},
+            "total": total,
+            "search_ms": round((time.perf_counter() - start) * 1000, 2),
+            "candidates": [
+                {
+                    "resume_id": r["_id"],
+                    "candidate_name": (r.get("parsed_data") or {}).get("name"),
+                    "email": (r.get("parsed_data") or {}).get("email"),
+                    "file_name": r.get("file_name"),
+                    "skills": r.get("skills", []),
+                    "skills_normalized": r.get("skills_normalized", []),
+                }
+                for r in resumes
+            ],
+        },
+        message=f"{total} candidates match the skill filter"
+    )
 
 
 async def find_candidates_controller(
@@ -430,6 +708,8 @@ async def find_candidates_controller(
     """
     Finds best candidate resumes from local 'uploads' folder or global search
     against an uploaded requirement file.
+    With `global_search`, Apollo results are fetched concurrently with the local
+    search and appended after the local candidates.
     """
     try:
         if not requirement_file.filename.endswith(".txt"):
@@ -438,12 +718,9 @@ async def find_candidates_controller(
                 message="Invalid file type. Please upload a .txt requirement file"
             )
 
-        os.makedirs(REQUIREMENT_FOLDER, exist_ok=True)
-        requirement_path = os.path.join(REQUIREMENT_FOLDER, requirement_file.filename)
-
-        # Save uploaded requirement file
-        with open(requirement_path, "wb") as f:
-            f.write(await requirement_file.read())
+        # Stream the uploaded requirement file into the file store
+        stored = await get_file_store().save_upload(requirement_file, REQUIREMENT)
+        requirement_path = stored["path"]
 
         # Read requirement text
         with open(requirement_path, "r", encoding="utf-8") as f:
@@ -451,13 +728,22 @@ async def find_candidates_controller(
 
         job_details = {"description": requirement_text}
 
-        # Decide search type
+        # Local search; with global_search the Apollo lookup runs alongside it
+        if settings.VECTOR_SHORTLIST_ENABLED and await sync_resume_index(RESUME_FOLDER):
+            # Relevance-ordered shortlist from the vector index instead of scanning every
+            # file; only once the index holds every resume, including loose folder files
+            local_search = find_indexed_candidates(job_details, top_n)
+        else:
+            local_search = find_local_candidates(job_details, top_n)
+
         if global_search:
-            candidates = await find_candidates_via_apollo(job_details)
+            candidates, global_candidates = await asyncio.gather(
+                local_search, find_candidates_via_apollo(job_details, top_n)
+            )
         else:
-            candidates = find_local_candidates(job_details)
+            candidates, global_candidates = await local_search, []
 
-        top_candidates = candidates[:top_n]
+        top_candidates = candidates[:top_n] + global_candidates[:top_n]
 
         return format_response(
             {
@@ -467,6 +753,8 @@ async def find_candidates_controller(
             message=f"Top {len(top_candidates)} candidates found successfully"
         )
 
+    except UploadTooLargeError:
+        raise
     except Exception as e:
         return format_response(
             None,
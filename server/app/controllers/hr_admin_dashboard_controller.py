@@ -1,9 +1,22 @@
+import asyncio
+import os
+import shutil
+import time
 from fastapi import HTTPException
+from app.config.config import settings
 from app.repository.resume_repository import ResumeRepository
 from app.repository.match_result_repository import MatchResultRepository
 from app.repository.job_repository import JobRepository
 from app.services.agent.email_automation_agent import EmailAutomationService  # 👈 import this
 from app.services.utils.log import logger
+from app.services.utils.llm_client import circuit_state
+from app.services.utils.llm_metrics import llm_metrics
+from app.services.utils.request_profiler import load_profile
+from app.services.utils.file_store import RESUME, get_file_store
+from app.services.utils.folder_indexer import get_folder_indexer
+from app.services.utils.ranking import match_score
+from app.services.utils.skill_vocabulary import normalize_skills
+from app.services.utils.vector_index import VectorIndex, embed_text, get_vector_index, resume_embedding_text
 
 
 
@@ -14,7 +27,7 @@ async def get_all_candidates_controller():
 
     Sorting:
     - LinkedIn Verified first
-    - Then by highest accuracy
+    - Then by highest match score
 
     (No filters applied here — filtering handled on frontend)
     """
@@ -35,7 +48,7 @@ async def get_all_candidates_controller():
 
             if not resume or not job:
                 continue
-            logger.debug(f"result is {result}")
+            logger.debug("result is %s", result)
 
             candidate_name = (
                 resume.get("parsed_data", {}).get("name")
@@ -50,6 +63,7 @@ async def get_all_candidates_controller():
                 "candidate_name": candidate_name,
                 "requirement": job.get("title", "N/A"),
                 "accuracy_score": raw_response.get("accuracy_score"),
+                "score": result.get("score", match_score(raw_response)),
                 "linkedin_verified": raw_response.get("linkedin_verified", False),
                 "status": raw_response.get("status", "pending"),
                 "resume_path": resume.get("file_path"),
@@ -61,7 +75,7 @@ async def get_all_candidates_controller():
         combined_data.sort(
             key=lambda x: (
                 1 if x.get("linkedin_verified") else 0,
-                x.get("accuracy", 0)
+                x["score"]
             ),
             reverse=True
         )
@@ -75,6 +89,43 @@ async def get_all_candidates_controller():
         raise HTTPException(status_code=500, detail=f"Error fetching candidate list: {str(e)}")
 
 
+# -------------------- 🏆 TOP CANDIDATES FOR A JOB --------------------
+async def get_top_candidates_for_job_controller(job_id: str, limit: int = 10, min_score: float = None):
+    """
+    Best-scoring candidates of one job, read from the (job_id, score) index;
+    only the returned resumes are fetched.
+    """
+    matches = await MatchResultRepository.find_top_by_job(
+        job_id,
+        limit=limit,
+        min_score=min_score,
+        projection={"resume_id": 1, "score": 1, "status": 1, "linked_verified": 1, "created_at": 1},
+    )
+    resumes = await ResumeRepository.find_by_ids(
+        [m.get("resume_id") for m in matches],
+        projection={"file_name": 1, "file_path": 1, "parsed_data.name": 1, "parsed_data.email": 1},
+    )
+    resume_map = {r["_id"]: r for r in resumes}
+
+    candidates = []
+    for match in matches:
+        resume = resume_map.get(match.get("resume_id"))
+        if not resume:
+            continue
+        candidates.append({
+            "match_result_id": match["_id"],
+            "resume_id": resume["_id"],
+            "candidate_name": (resume.get("parsed_data") or {}).get("name") or resume.get("file_name", "Unnamed Candidate"),
+            "email": (resume.get("parsed_data") or {}).get("email"),
+            "score": match.get("score", 0),
+            # match_results store the flag as "linked_verified"
+            "linkedin_verified": match.get("linked_verified", False),
+            "status": match.get("status", "pending"),
+            "resume_path": resume.get("file_path"),
+        })
+    return {"job_id": job_id, "total": len(candidates), "candidates": candidates}
+
+
 # -------------------- 👤 FETCH SINGLE CANDIDATE DETAIL --------------------
 async def get_candidate_detail_controller(match_result_id: str):
     """
@@ -97,6 +148,7 @@ async def get_candidate_detail_controller(match_result_id: str):
             "candidate_name": candidate_name,
             "linkedin_verified": match.get("linked_verified", False),
             "accuracy": match.get("accuracy", 0),
+            "score": match.get("score", match_score(match.get("raw_response"))),
             "status": match.get("status", "pending"),
             "resume_data": resume,
             "job_data": job,
@@ -148,3 +200,185 @@ async def update_candidate_status_controller(match_result_id: str, status: str):
             status_code=500,
             detail=f"Error updating candidate status: {str(e)}"
         )
+
+
+# -------------------- ✅ ❌ BULK ACCEPT / REJECT --------------------
+async def bulk_update_candidate_status_controller(match_result_ids: list, status: str, personalize: bool = None):
+    """
+    Accepts or rejects many candidates at once and emails them using one
+    template per job (plus optional batched personalization).
+    """
+    allowed_status = ["accepted", "rejected"]
+    if status not in allowed_status:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid status. Must be one of {allowed_status}"
+        )
+
+    try:
+        updated_ids, failed = [], {}
+        for match_result_id in match_result_ids:
+            try:
+                await MatchResultRepository.update_match_result(match_result_id, {"status": status})
+                updated_ids.append(match_result_id)
+            except HTTPException as e:
+                failed[match_result_id] = e.detail
+
+        email_report = await EmailAutomationService.send_bulk_status_emails(updated_ids, status, personalize)
+
+        return {
+            "new_status": status,
+            "updated": len(updated_ids),
+            "failed": failed,
+            "email_status": email_report,
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error updating candidate statuses: {str(e)}"
+        )
+
+
+# -------------------- 🧭 VECTOR INDEX --------------------
+async def rebuild_vector_index_controller(batch_size: int = 500):
+    """
+    Re-embeds every stored resume into a fresh vector index (e.g. after changing
+    VECTOR_INDEX_DIM or for resumes ingested before indexing existed).
+    The new index is built next to the live one and swapped in when complete,
+    so searches keep using the old index meanwhile.
+    """
+    live = get_vector_index()
+    start = time.perf_counter()
+    since_row = len(live)
+    staging_folder = os.path.normpath(settings.VECTOR_INDEX_FOLDER) + ".rebuild"
+    await asyncio.to_thread(shutil.rmtree, staging_folder, True)
+    index = await asyncio.to_thread(VectorIndex, staging_folder, settings.VECTOR_INDEX_DIM)
+
+    def embed_batch(batch):
+        return [(r["_id"], embed_text(resume_embedding_text(r))) for r in batch]
+
+    batch, total = [], 0
+    projection = {"raw_text": 1, "skills": 1, "parsed_data": 1}
+    async for resume in ResumeRepository.iter_all(projection, batch_size):
+        batch.append(resume)
+        if len(batch) >= batch_size:
+            await asyncio.to_thread(index.add_many, await asyncio.to_thread(embed_batch, batch))
+            total += len(batch)
+            batch = []
+    if batch:
+        await asyncio.to_thread(index.add_many, await asyncio.to_thread(embed_batch, batch))
+        total += len(batch)
+    await asyncio.to_thread(live.swap_in, index, since_row)
+
+    return {"indexed": total, "elapsed_ms": round((time.perf_counter() - start) * 1000, 2)}
+
+
+# -------------------- 🏷️ SKILL VOCABULARY BACKFILL --------------------
+async def rebuild_skill_index_controller(batch_size: int = 500):
+    """
+    Recomputes `skills_normalized` for every stored resume (for resumes ingested
+    before normalization existed, or after the vocabulary changed).
+    """
+    start = time.perf_counter()
+    updates, scanned, updated = {}, 0, 0
+    async for resume in ResumeRepository.iter_all({"skills": 1, "parsed_data.skills": 1}, batch_size):
+        scanned += 1
+        skills = resume.get("skills") or (resume.get("parsed_data") or {}).get("skills") or []
+        updates[resume["_id"]] = normalize_skills(skills)
+        if len(updates) >= batch_size:
+            updated += await ResumeRepository.set_normalized_skills(updates)
+            updates = {}
+    updated += await ResumeRepository.set_normalized_skills(updates)
+
+    return {"scanned": scanned, "updated": updated, "elapsed_ms": round((time.perf_counter() - start) * 1000, 2)}
+
+
+# -------------------- 🏆 MATCH SCORE BACKFILL --------------------
+async def backfill_match_scores_controller(batch_size: int = 500):
+    """
+    Writes the normalized numeric `score` on match results stored before it existed.
+    """
+    start = time.perf_counter()
+    await MatchResultRepository.ensure_indexes()
+    updated = await MatchResultRepository.backfill_scores(batch_size)
+    return {"updated": updated, "elapsed_ms": round((time.perf_counter() - start) * 1000, 2)}
+
+
+# -------------------- 🗄️ FILE STORE IMPORT --------------------
+async def import_resume_folder_controller(folder: str = None):
+    """
+    Copies loose resume files (e.g. a legacy flat RESUME_FOLDER) into the
+    content-addressed file store. Already stored content is only re-registered.
+    """
+    folder = folder or settings.RESUME_FOLDER
+    store = get_file_store()
+    start = time.perf_counter()
+    scanned, imported = 0, 0
+    if os.path.isdir(folder):
+        for entry in os.scandir(folder):
+            if not entry.is_file() or not entry.name.lower().endswith((".pdf", ".docx")):
+                continue
+            scanned += 1
+            try:
+                stored = await store.import_file(entry.path, RESUME)
+                imported += stored["created"]
+            except Exception as e:
+                logger.error("❌ Failed to import %s into the file store: %s", entry.path, e)
+
+    return {"scanned": scanned, "imported": imported, "elapsed_ms": round((time.perf_counter() - start) * 1000, 2)}
+
+
+# -------------------- 📂 RESUME FOLDER INDEXER --------------------
+async def folder_indexer_controller(action: str = "status"):
+    """
+    Controls the background indexer of RESUME_FOLDER:
+    status | start | stop | scan (one synchronous catch-up pass).
+    """
+    indexer = get_folder_indexer()
+    if action == "start":
+        indexer.start()
+    elif action == "stop":
+        await indexer.stop()
+    elif action == "scan":
+        return {"scan": await indexer.scan(), **indexer.status()}
+    elif action != "status":
+        raise HTTPException(status_code=400, detail=f"Unknown indexer action '{action}'")
+    return indexer.status()
+
+
+# -------------------- 📊 LLM USAGE STATS --------------------
+async def get_llm_stats_controller(include_recent: bool = False, reset: bool = False):
+    """
+    Returns LLM call accounting (tokens, latency, retries, parse failures, cost)
+    aggregated per call site, per endpoint and per job.
+    Optionally resets the counters after taking the snapshot.
+    """
+    stats = llm_metrics.snapshot(include_recent=include_recent)
+    stats["circuit"] = circuit_state()
+    if reset:
+        llm_metrics.reset()
+    return stats
+
+
+# -------------------- 🔬 REQUEST PROFILES --------------------
+async def get_request_profile_controller(profile_id: str):
+    """
+    Returns the stored span summary of a profiled request.
+    """
+    summary, _ = load_profile(profile_id)
+    if not summary:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return summary
+
+
+async def get_request_profile_artifact_controller(profile_id: str):
+    """
+    Returns the path of the flame graph (HTML) of a profiled request.
+    """
+    summary, artifact = load_profile(profile_id)
+    if not summary or not artifact or not os.path.exists(artifact):
+        raise HTTPException(status_code=404, detail="Profile artifact not found")
+    return artifact
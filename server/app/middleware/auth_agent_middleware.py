@@ -167,6 +167,8 @@ from app.config.config import settings
 from app.services.auth.auth_service import AuthService
 from app.repository.user_repository import UserRepository
 from app.services.utils.log import logger
+from app.services.utils.llm_metrics import set_llm_request
+from app.services.utils import request_profiler
 
 
 class AuthAgentMiddleware(BaseHTTPMiddleware):
@@ -175,11 +177,21 @@ class AuthAgentMiddleware(BaseHTTPMiddleware):
     ✅ Verifies JWT tokens
     ✅ Restricts access to /ai/* and /hr-admin/*
     ✅ Ensures upload directories exist
+    ✅ Profiles single requests on demand for admins (X-Profile: 1 or ?profile=1)
     """
 
     async def dispatch(self, request: Request, call_next):
+        # Opt-in profiling: one header/query lookup when the flag is off
+        if request_profiler.wants_profile(request) and self.is_admin_request(request):
+            return await request_profiler.profile_request(
+                request, lambda: self.authorize_and_dispatch(request, call_next)
+            )
+        return await self.authorize_and_dispatch(request, call_next)
+
+    async def authorize_and_dispatch(self, request: Request, call_next):
         path = request.url.path.rstrip("/").lower()
-        logger.debug(f"Incoming Request Path: {path}")
+        logger.debug("Incoming Request Path: %s", path)
+        set_llm_request(request.scope)
 
         # ✅ Allow CORS preflight requests
         if request.method == "OPTIONS":
@@ -217,7 +229,7 @@ class AuthAgentMiddleware(BaseHTTPMiddleware):
             or any(path.endswith(suffix) for suffix in public_suffixes)
             or any(path.endswith(suffix) for suffix in public_ai_suffixes)
         ):
-            logger.debug(f"🟢 Public endpoint accessed: {path}")
+            logger.debug("🟢 Public endpoint accessed: %s", path)
             return await call_next(request)
 
         # -------------------- JWT AUTH CHECK --------------------
@@ -236,7 +248,7 @@ class AuthAgentMiddleware(BaseHTTPMiddleware):
             except jwt.InvalidTokenError:
                 raise HTTPException(status_code=401, detail="Malformed or invalid token")
             
-            logger.debug(f"payload is {payload}")
+            logger.debug("payload is %s", payload)
             email = payload.get("sub")
             token_type = payload.get("type", "user")
 
@@ -245,7 +257,7 @@ class AuthAgentMiddleware(BaseHTTPMiddleware):
 
             # -------------------- ADMIN AUTH --------------------
             if email == settings.ADMIN_EMAIL or token_type == "admin":
-                logger.debug(f"✅ Authenticated as Admin: {email}")
+                logger.debug("✅ Authenticated as Admin: %s", email)
 
                 # Allow Admin on everything
                 if path.startswith("/api/v1/hr-admin/"):
@@ -262,12 +274,12 @@ class AuthAgentMiddleware(BaseHTTPMiddleware):
             if token_type == "user":
                 try:
                     logger.debug("inside user search")
-                    logger.debug(f"email is {email}")
+                    logger.debug("email is %s", email)
                     user = await UserRepository.find_by_email(email)
                 except Exception as e:
-                    logger.error(f"User lookup failed: {str(e)}")
+                    logger.error("User lookup failed: %s", e)
 
-                logger.debug(f"user found! is {user}")
+                logger.debug("user found! is %s", user)
 
                 if not user.get("is_email_verified", False):
                     raise HTTPException(status_code=403, detail="Email not verified")
@@ -279,23 +291,38 @@ class AuthAgentMiddleware(BaseHTTPMiddleware):
                     raise HTTPException(status_code=500, detail="AI configuration missing")
 
                 await self.ensure_upload_folders()
-                logger.debug(f"✅ Verified user accessing AI routes: {email}")
+                logger.debug("✅ Verified user accessing AI routes: %s", email)
 
             # -------------------- HR ADMIN ACCESS CONTROL --------------------
             if path.startswith("/api/v1/hr-admin/"):
                 raise HTTPException(status_code=403, detail="Only admin can access HR dashboard")
 
             request.state.user = user
-            logger.debug(f"{user}")
+            logger.debug("Authenticated user: %s", user)
             await self.ensure_upload_folders()
             return await call_next(request)
 
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"❌ Middleware error: {str(e)}")
+            logger.error("❌ Middleware error: %s", e)
             raise HTTPException(status_code=500, detail="Internal server error")
 
+    # -------------------- HELPER: Admin Token Check --------------------
+    @staticmethod
+    def is_admin_request(request: Request) -> bool:
+        """
+        True when the request carries a valid admin JWT (used to gate profiling).
+        """
+        auth_header = request.headers.get("Authorization", "")
+        if not auth_header.startswith("Bearer "):
+            return False
+        try:
+            payload = jwt.decode(auth_header[len("Bearer "):].strip(), settings.JWT_SECRET, algorithms=["HS256"])
+        except jwt.InvalidTokenError:
+            return False
+        return payload.get("sub") == settings.ADMIN_EMAIL or payload.get("type") == "admin"
+
     # -------------------- HELPER: Ensure Upload Folders --------------------
     @staticmethod
     async def ensure_upload_folders():
@@ -310,4 +337,4 @@ class AuthAgentMiddleware(BaseHTTPMiddleware):
         ]
         for folder in upload_dirs:
             os.makedirs(folder, exist_ok=True)
-            logger.debug(f"Ensured upload folder exists: {folder}")
+            logger.debug("Ensured upload folder exists: %s", folder)
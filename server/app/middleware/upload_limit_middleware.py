@@ -0,0 +1,62 @@
+import json
+
+from app.services.utils.log import logger
+from app.services.utils.upload_utils import UploadTooLargeError, max_request_bytes, max_upload_bytes
+
+
+class UploadLimitMiddleware:
+    """
+    Refuses oversized multipart uploads before the body is read and spooled:
+    ✅ Content-Length above the limit -> 413 straight away
+    ✅ No Content-Length (chunked) -> 413 once the received bytes pass the limit
+
+    Plain ASGI (not BaseHTTPMiddleware) so it can wrap `receive`.
+    """
+
+    def __init__(self, app, max_bytes: int = None):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._is_multipart(scope):
+            return await self.app(scope, receive, send)
+
+        limit = self.max_bytes or max_request_bytes()
+        content_length = self._header(scope, b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+            logger.warning("Rejected %s byte upload to %s", content_length, scope.get("path"))
+            return await self._reject(send, limit)
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise UploadTooLargeError(max_upload_bytes())
+            return message
+
+        return await self.app(scope, limited_receive, send)
+
+    @staticmethod
+    def _header(scope, name: bytes):
+        for key, value in scope.get("headers", []):
+            if key.lower() == name:
+                return value.decode("latin-1").strip()
+        return None
+
+    def _is_multipart(self, scope) -> bool:
+        return (self._header(scope, b"content-type") or "").lower().startswith("multipart/form-data")
+
+    @staticmethod
+    async def _reject(send, limit: int):
+        # The message names the per-file limit, not the framing headroom
+        body = json.dumps({"detail": UploadTooLargeError(max_upload_bytes()).detail}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -1,6 +1,8 @@
 from datetime import datetime
 from app.config.database import db  
+from app.services.utils.request_profiler import profiled
 
+@profiled("repository")
 class AdminSessionRepository:
     @staticmethod
     async def create_session(session_data: dict):
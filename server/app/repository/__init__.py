@@ -5,11 +5,13 @@ from .user_session_repository import UserSessionRepository
 from .job_repository import JobRepository
 from .resume_repository import ResumeRepository
 from .match_result_repository import MatchResultRepository
+from .match_cache_repository import MatchCacheRepository
 
 __all__ = [
     "UserRepository",
     "UserSessionRepository",
     "JobRepository",
     "ResumeRepository",
-    "MatchResultRepository"
+    "MatchResultRepository",
+    "MatchCacheRepository"
 ]
@@ -2,8 +2,11 @@ from datetime import datetime
 from bson import ObjectId
 from fastapi import HTTPException
 from app.config.database import db
+from app.services.utils.ranking import match_score
+from app.services.utils.request_profiler import profiled
 
 
+@profiled("repository")
 class AdminDashboardRepository:
     """
     Repository for fetching and managing combined candidate/job/match data
@@ -59,13 +62,14 @@ class AdminDashboardRepository:
                 job = item.get("job_info", {})
                 resume = item.get("resume_info", {})
                 match = item
+                score = match.get("score", match_score(match.get("raw_response")))
 
                 # --- Filtering ---
                 if job_title and job_title.lower() not in job.get("title", "").lower():
                     continue
                 if linkedin_verified is not None and match.get("linkedin_verified") != linkedin_verified:
                     continue
-                if min_accuracy is not None and match.get("accuracy", 0) < min_accuracy:
+                if min_accuracy is not None and score < min_accuracy:
                     continue
 
                 # --- Formatting ---
@@ -76,6 +80,7 @@ class AdminDashboardRepository:
                     "requirement_file": job.get("file_path"),
                     "match_result": match.get("raw_response", {}),
                     "accuracy": match.get("accuracy"),
+                    "score": score,
                     "linkedin_verified": match.get("linkedin_verified", False),
                     "status": match.get("status"),
                     "reason": match.get("reason"),
@@ -87,7 +92,7 @@ class AdminDashboardRepository:
             filtered.sort(
                 key=lambda x: (
                     1 if x.get("linkedin_verified") else 0,
-                    x.get("accuracy", 0)
+                    x["score"]
                 ),
                 reverse=True
             )
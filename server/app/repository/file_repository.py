@@ -0,0 +1,82 @@
+from datetime import datetime
+from app.config.database import db
+from app.services.utils.request_profiler import profiled
+from fastapi import HTTPException
+
+
+@profiled("repository")
+class FileRepository:
+    """
+    Metadata index of the content-addressed file store ('files' collection).
+    `_id` is the sha256 of the content, so existence checks are primary-key lookups.
+    """
+
+    _indexes_ready = False
+
+    @staticmethod
+    async def ensure_indexes():
+        if FileRepository._indexes_ready:
+            return
+        await db.files.create_index([("kind", 1), ("created_at", 1)])
+        FileRepository._indexes_ready = True
+
+    # -------------------- WRITE --------------------
+    @staticmethod
+    async def register(content_hash: str, kind: str, ext: str, size: int, original_name: str = None) -> bool:
+        """
+        Records a stored file (idempotent). Returns True when the content is new.
+        """
+        try:
+            await FileRepository.ensure_indexes()
+            update = {
+                "$setOnInsert": {"kind": kind, "ext": ext, "size": size, "created_at": datetime.utcnow()},
+            }
+            if original_name:
+                update["$addToSet"] = {"original_names": original_name}
+            result = await db.files.update_one({"_id": content_hash}, update, upsert=True)
+            return result.upserted_id is not None
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to save file metadata: {str(e)}")
+
+    @staticmethod
+    async def delete(content_hash: str) -> bool:
+        try:
+            result = await db.files.delete_one({"_id": content_hash})
+            return result.deleted_count > 0
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to delete file metadata: {str(e)}")
+
+    # -------------------- READ --------------------
+    @staticmethod
+    async def find(content_hash: str):
+        try:
+            return await db.files.find_one({"_id": content_hash})
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to fetch file metadata: {str(e)}")
+
+    @staticmethod
+    async def exists(content_hash: str) -> bool:
+        try:
+            return await db.files.find_one({"_id": content_hash}, {"_id": 1}) is not None
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to fetch file metadata: {str(e)}")
+
+    @staticmethod
+    async def count(kind: str = None, extensions: tuple = None) -> int:
+        query = {"kind": kind} if kind else {}
+        if extensions:
+            query["ext"] = {"$in": list(extensions)}
+        try:
+            return await db.files.count_documents(query)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to count files: {str(e)}")
+
+    @staticmethod
+    async def iter_files(kind: str = None, batch_size: int = 500):
+        """
+        Streams file metadata (oldest first), optionally for one kind only.
+        """
+        query = {"kind": kind} if kind else {}
+        cursor = db.files.find(query).sort("created_at", 1).batch_size(batch_size)
+        async for entry in cursor:
+            yield entry
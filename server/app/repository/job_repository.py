@@ -1,15 +1,98 @@
+import base64
+import json
+import re
 from datetime import datetime
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import UpdateOne
 from fastapi import HTTPException
 from app.config.database import db
+from app.services.utils.log import logger
+from app.services.utils.request_profiler import profiled
 from app.models.job_model import Job
+from app.repository.match_cache_repository import MatchCacheRepository
 
+# Job fields that feed the matcher; changing any of them invalidates cached matches
+REQUIREMENT_FIELDS = {
+    "title", "description", "responsibilities", "requirements", "skills",
+    "qualifications", "experience", "file_path",
+}
 
+# Slim projection for pickers / dropdowns (no descriptions or requirement lists)
+JOB_SUMMARY_FIELDS = {"title": 1, "location": 1, "employment_type": 1, "is_active": 1, "created_at": 1}
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+
+def title_words(title) -> list:
+    """
+    Lower-cased words of a job title, stored as `title_words` for prefix autocomplete.
+    """
+    return list(dict.fromkeys(_WORD.findall(str(title or "").lower())))
+
+
+def _encode_cursor(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> dict:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return data
+
+
+@profiled("repository")
 class JobRepository:
     """
     Repository for handling CRUD operations on the 'jobs' collection.
     """
 
+    _indexes_ready = False
+
+    @staticmethod
+    async def ensure_indexes():
+        """
+        Creates the search indexes once per process. A failing index (e.g. an
+        older text index already on `jobs`) is logged and skipped; search still
+        works, only without that index.
+        """
+        if JobRepository._indexes_ready:
+            return
+        JobRepository._indexes_ready = True
+        indexes = [
+            ([("title", "text"), ("skills", "text"), ("description", "text")],
+             {"weights": {"title": 10, "skills": 5, "description": 1}, "name": "job_text"}),
+            ([("title_words", 1)], {}),
+            ([("created_at", -1), ("_id", -1)], {}),
+            ([("is_active", 1), ("created_at", -1), ("_id", -1)], {}),
+        ]
+        for keys, options in indexes:
+            try:
+                await db.jobs.create_index(keys, **options)
+            except Exception as e:
+                logger.warning("Job index %s creation failed: %s", options.get("name", keys), e)
+
+    @staticmethod
+    async def backfill_title_words(batch_size: int = 500) -> int:
+        """
+        Writes `title_words` on jobs stored before autocomplete existed, in
+        batched bulk writes. Run once at startup, not on the request path.
+        """
+        updated, batch = 0, []
+        cursor = db.jobs.find({"title_words": {"$exists": False}}, {"title": 1}).batch_size(batch_size)
+        async for job in cursor:
+            batch.append(UpdateOne({"_id": job["_id"]}, {"$set": {"title_words": title_words(job.get("title"))}}))
+            if len(batch) >= batch_size:
+                updated += (await db.jobs.bulk_write(batch, ordered=False)).modified_count
+                batch = []
+        if batch:
+            updated += (await db.jobs.bulk_write(batch, ordered=False)).modified_count
+        return updated
+
     @staticmethod
     async def create_job(job_data: dict):
         """
@@ -18,6 +101,8 @@ class JobRepository:
         try:
             job_data["created_at"] = datetime.utcnow()
             job_data["is_active"] = True
+            job_data["title_words"] = title_words(job_data.get("title"))
+            await JobRepository.ensure_indexes()
             result = await db.jobs.insert_one(job_data)
             return str(result.inserted_id)
         except Exception as e:
@@ -50,6 +135,80 @@ class JobRepository:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to fetch jobs: {str(e)}")
 
+    @staticmethod
+    async def search_jobs(
+        q: str = None,
+        prefix: bool = False,
+        is_active: bool = None,
+        limit: int = 20,
+        cursor: str = None,
+        projection: dict = None,
+    ):
+        """
+        Paged job search. Returns (jobs, next_cursor); next_cursor is None on the
+        last page.
+
+        - no `q`: newest first, keyset-paged on (created_at, _id)
+        - `prefix`: autocomplete; every word of `q` must prefix a title word
+          ("sen pyth" -> "Senior Python Developer")
+        - otherwise: text search on title, skills and description, by relevance
+          (the cursor carries an offset, text scores cannot be range-queried)
+        """
+        try:
+            await JobRepository.ensure_indexes()
+            query = {}
+            if is_active is not None:
+                query["is_active"] = is_active
+            position = _decode_cursor(cursor) if cursor else {}
+            projection = dict(projection) if projection else None
+            words = title_words(q)
+
+            if q and not prefix:
+                query["$text"] = {"$search": q}
+                score = {"$meta": "textScore"}
+                if projection is not None:
+                    projection["score"] = score
+                offset = position.get("o", 0)
+                if not isinstance(offset, int) or offset < 0:
+                    raise HTTPException(status_code=400, detail="Invalid cursor")
+                find = (
+                    db.jobs.find(query, projection or {"score": score})
+                    .sort([("score", score), ("_id", -1)])
+                    .skip(offset)
+                )
+            else:
+                if prefix and words:
+                    query["$and"] = [{"title_words": {"$elemMatch": {"$gte": w, "$lt": w + "\uffff"}}} for w in words]
+                if position:
+                    try:
+                        created_at, last_id = datetime.fromisoformat(position["c"]), ObjectId(position["i"])
+                    except (KeyError, TypeError, ValueError, InvalidId):
+                        raise HTTPException(status_code=400, detail="Invalid cursor")
+                    query.setdefault("$and", []).append({"$or": [
+                        {"created_at": {"$lt": created_at}},
+                        {"created_at": created_at, "_id": {"$lt": last_id}},
+                    ]})
+                if projection is not None:
+                    projection["created_at"] = 1
+                find = db.jobs.find(query, projection).sort([("created_at", -1), ("_id", -1)])
+
+            jobs = await find.limit(limit + 1).to_list(length=limit + 1)
+            next_cursor = None
+            if len(jobs) > limit:
+                jobs = jobs[:limit]
+                last = jobs[-1]
+                if "$text" in query:
+                    next_cursor = _encode_cursor({"o": offset + limit})
+                else:
+                    next_cursor = _encode_cursor({"c": last["created_at"].isoformat(), "i": str(last["_id"])})
+            for job in jobs:
+                job["_id"] = str(job["_id"])
+            return jobs, next_cursor
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to search jobs: {str(e)}")
+
     @staticmethod
     async def find_latest():
         """
@@ -70,12 +229,16 @@ class JobRepository:
         Updates an existing job record by ID.
         """
         try:
+            if "title" in update_data:
+                update_data = {**update_data, "title_words": title_words(update_data["title"])}
             result = await db.jobs.update_one(
                 {"_id": ObjectId(job_id)},
                 {"$set": update_data}
             )
             if result.matched_count == 0:
                 raise HTTPException(status_code=404, detail="Job not found")
+            if result.modified_count and REQUIREMENT_FIELDS & set(update_data):
+                await MatchCacheRepository.invalidate_job(job_id)
             return True
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Failed to update job: {str(e)}")
@@ -0,0 +1,83 @@
+from datetime import datetime
+from app.config.database import db
+from app.services.utils.log import logger
+from app.services.utils.request_profiler import profiled
+
+
+@profiled("repository")
+class MatchCacheRepository:
+    """
+    Memoized check_match results in the 'match_cache' collection.
+
+    Entries are keyed on (resume file hash, job id, requirement hash, prompt
+    version): a changed resume, requirement or matcher prompt never hits a stale
+    entry. Cache failures are logged and treated as misses, never raised.
+    """
+
+    _indexes_ready = False
+
+    @staticmethod
+    async def ensure_indexes():
+        if MatchCacheRepository._indexes_ready:
+            return
+        await db.match_cache.create_index(
+            [("resume_hash", 1), ("job_id", 1), ("requirement_hash", 1), ("prompt_version", 1)],
+            unique=True,
+        )
+        await db.match_cache.create_index("job_id")
+        MatchCacheRepository._indexes_ready = True
+
+    @staticmethod
+    def _key(resume_hash: str, job_id: str, requirement_hash: str, prompt_version: str) -> dict:
+        return {
+            "resume_hash": resume_hash,
+            "job_id": job_id,
+            "requirement_hash": requirement_hash,
+            "prompt_version": prompt_version,
+        }
+
+    # -------------------- READ --------------------
+    @staticmethod
+    async def find(resume_hash: str, job_id: str, requirement_hash: str, prompt_version: str):
+        """
+        Returns the cached match result dict, or None on a miss.
+        """
+        try:
+            await MatchCacheRepository.ensure_indexes()
+            entry = await db.match_cache.find_one(
+                MatchCacheRepository._key(resume_hash, job_id, requirement_hash, prompt_version),
+                {"match_result": 1},
+            )
+            return entry["match_result"] if entry else None
+        except Exception as e:
+            logger.warning("Match cache lookup failed: %s", e)
+            return None
+
+    # -------------------- WRITE --------------------
+    @staticmethod
+    async def save(resume_hash: str, job_id: str, requirement_hash: str, prompt_version: str, match_result: dict):
+        """
+        Stores (or refreshes) a match result.
+        """
+        try:
+            await MatchCacheRepository.ensure_indexes()
+            await db.match_cache.update_one(
+                MatchCacheRepository._key(resume_hash, job_id, requirement_hash, prompt_version),
+                {"$set": {"match_result": match_result, "created_at": datetime.utcnow()}},
+                upsert=True,
+            )
+        except Exception as e:
+            logger.warning("Match cache write failed: %s", e)
+
+    # -------------------- INVALIDATE --------------------
+    @staticmethod
+    async def invalidate_job(job_id: str) -> int:
+        """
+        Drops every cached match for a job (called when its requirement changes).
+        """
+        try:
+            result = await db.match_cache.delete_many({"job_id": job_id})
+            return result.deleted_count
+        except Exception as e:
+            logger.warning("Match cache invalidation failed for job %s: %s", job_id, e)
+            return 0
@@ -1,14 +1,30 @@
 from datetime import datetime
 from app.config.database import db
+from app.services.utils.log import logger
+from app.services.utils.ranking import match_score
+from app.services.utils.request_profiler import profiled
 from bson import ObjectId
+from pymongo import UpdateOne
 from fastapi import HTTPException
 
 
+@profiled("repository")
 class MatchResultRepository:
     """
     Handles CRUD operations for match results in MongoDB.
     """
 
+    _indexes_ready = False
+
+    @staticmethod
+    async def ensure_indexes():
+        if MatchResultRepository._indexes_ready:
+            return
+        await db.match_results.create_index([("resume_id", 1), ("job_id", 1)])
+        # Per-job ranking straight from the index (no collection scan, no in-memory sort)
+        await db.match_results.create_index([("job_id", 1), ("score", -1)])
+        MatchResultRepository._indexes_ready = True
+
     # -------------------- CREATE --------------------
     @staticmethod
     async def create_match_result(match_data: dict):
@@ -16,6 +32,11 @@ class MatchResultRepository:
         Saves the match result (comparison between resume & job).
         """
         try:
+            try:
+                await MatchResultRepository.ensure_indexes()
+            except Exception as e:
+                logger.warning("Match result index creation failed: %s", e)
+            match_data.setdefault("score", match_score(match_data.get("raw_response")))
             match_data["created_at"] = datetime.utcnow()
             result = await db.match_results.insert_one(match_data)
             return str(result.inserted_id)
@@ -47,6 +68,68 @@ class MatchResultRepository:
         except Exception:
             raise HTTPException(status_code=400, detail="Invalid job ID format")
 
+    # -------------------- TOP N FOR A JOB --------------------
+    @staticmethod
+    async def find_top_by_job(job_id: str, limit: int = 10, min_score: float = None, projection: dict = None):
+        """
+        Best-scoring match results for a job, read in (job_id, score desc) index
+        order: only the `limit` returned documents are fetched.
+        """
+        try:
+            await MatchResultRepository.ensure_indexes()
+            query = {"job_id": job_id}
+            if min_score is not None:
+                query["score"] = {"$gte": min_score}
+            cursor = (
+                db.match_results.find(query, projection)
+                .sort([("score", -1)])
+                .limit(limit)
+            )
+            results = await cursor.to_list(length=limit)
+            for r in results:
+                r["_id"] = str(r["_id"])
+            return results
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to fetch top match results: {str(e)}")
+
+    # -------------------- BACKFILL SCORE --------------------
+    @staticmethod
+    async def backfill_scores(batch_size: int = 500) -> int:
+        """
+        Writes the normalized numeric `score` on match results stored without one.
+        """
+        try:
+            updated, batch = 0, []
+            cursor = db.match_results.find({"score": {"$exists": False}}, {"raw_response": 1, "accuracy": 1})
+            async for result in cursor.batch_size(batch_size):
+                score = match_score(result.get("raw_response")) or match_score({"accuracy": result.get("accuracy")})
+                batch.append(UpdateOne({"_id": result["_id"]}, {"$set": {"score": score, "accuracy": score}}))
+                if len(batch) >= batch_size:
+                    updated += (await db.match_results.bulk_write(batch, ordered=False)).modified_count
+                    batch = []
+            if batch:
+                updated += (await db.match_results.bulk_write(batch, ordered=False)).modified_count
+            return updated
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to backfill match scores: {str(e)}")
+
+    # -------------------- READ BY RESUME + JOB --------------------
+    @staticmethod
+    async def find_by_resume_and_job(resume_id: str, job_id: str):
+        """
+        Latest match result of a resume against a job, or None.
+        """
+        try:
+            await MatchResultRepository.ensure_indexes()
+            result = await db.match_results.find_one(
+                {"resume_id": resume_id, "job_id": job_id}, sort=[("created_at", -1)]
+            )
+            if result:
+                result["_id"] = str(result["_id"])
+            return result
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Failed to fetch match result: {str(e)}")
+
     # -------------------- READ BY ID (for HR dashboard) --------------------
     @staticmethod
     async def find_by_id(result_id: str):
@@ -1,26 +1,79 @@
 from datetime import datetime
 from app.config.database import db
+from app.services.utils.log import logger
+from app.services.utils.request_profiler import profiled
 from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError, OperationFailure
 from fastapi import HTTPException
 
 
+@profiled("repository")
 class ResumeRepository:
     """
     Handles CRUD operations for resumes in MongoDB.
     """
 
+    _indexes_ready = False
+
+    @staticmethod
+    async def ensure_indexes():
+        """
+        Multikey index on the normalized skill vocabulary used by skill search,
+        and the upload content hash used for de-duplication.
+        """
+        if ResumeRepository._indexes_ready:
+            return
+        await db.resumes.create_index("skills_normalized")
+        try:
+            await db.resumes.create_index("content_hash", unique=True, sparse=True)
+        except OperationFailure as e:
+            # 85/86: the earlier non-unique index on the same key is in the way
+            if e.code not in (85, 86):
+                raise
+            await db.resumes.drop_index("content_hash_1")
+            await db.resumes.create_index("content_hash", unique=True, sparse=True)
+        ResumeRepository._indexes_ready = True
+
     @staticmethod
     async def create_resume(resume_data: dict):
         """
         Saves parsed resume data to the 'resumes' collection.
         """
         try:
+            try:
+                await ResumeRepository.ensure_indexes()
+            except Exception as e:
+                logger.warning("Resume index creation failed: %s", e)
             resume_data["uploaded_at"] = datetime.utcnow()
             result = await db.resumes.insert_one(resume_data)
             return str(result.inserted_id)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to save resume: {str(e)}")
 
+    @staticmethod
+    async def create_unique_resume(resume_data: dict):
+        """
+        Saves a resume unless one with the same `content_hash` exists (the unique
+        index settles concurrent uploads of the same file).
+        Returns (resume_id, created).
+        """
+        try:
+            try:
+                await ResumeRepository.ensure_indexes()
+            except Exception as e:
+                logger.warning("Resume index creation failed: %s", e)
+            resume_data["uploaded_at"] = datetime.utcnow()
+            result = await db.resumes.insert_one(resume_data)
+            return str(result.inserted_id), True
+        except DuplicateKeyError:
+            existing = await db.resumes.find_one({"content_hash": resume_data.get("content_hash")}, {"_id": 1})
+            if not existing:
+                raise HTTPException(status_code=500, detail="Failed to save resume: duplicate key")
+            return str(existing["_id"]), False
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to save resume: {str(e)}")
+
     @staticmethod
     async def find_all(limit: int = 100):
         """
@@ -51,6 +104,102 @@ class ResumeRepository:
             raise HTTPException(status_code=400, detail=f"Invalid resume ID or database error: {str(e)}")
 
 
+    @staticmethod
+    async def find_by_ids(resume_ids: list, projection: dict = None):
+        """
+        Fetches several resumes in one query, returned in the order of `resume_ids`.
+        Unknown or malformed IDs are skipped.
+        """
+        try:
+            object_ids = [ObjectId(i) for i in resume_ids if ObjectId.is_valid(i)]
+            resumes = await db.resumes.find({"_id": {"$in": object_ids}}, projection).to_list(length=len(object_ids))
+            by_id = {}
+            for r in resumes:
+                r["_id"] = str(r["_id"])
+                by_id[r["_id"]] = r
+            return [by_id[i] for i in resume_ids if i in by_id]
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to fetch resumes: {str(e)}")
+
+    @staticmethod
+    async def count(query: dict = None) -> int:
+        try:
+            return await db.resumes.count_documents(query or {})
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to count resumes: {str(e)}")
+
+    @staticmethod
+    async def iter_all(projection: dict = None, batch_size: int = 500):
+        """
+        Streams every resume (for index rebuilds) without loading the collection at once.
+        """
+        cursor = db.resumes.find({}, projection).batch_size(batch_size)
+        async for resume in cursor:
+            resume["_id"] = str(resume["_id"])
+            yield resume
+
+    @staticmethod
+    async def find_by_skills(
+        all_skills: list = None, any_skills: list = None, limit: int = 50, skip: int = 0, projection: dict = None
+    ):
+        """
+        Resumes having every skill in `all_skills` (AND) and at least one of
+        `any_skills` (OR). Skills must already be normalized; both clauses are
+        answered by the multikey index on `skills_normalized`.
+        Returns (total, resumes).
+        """
+        try:
+            await ResumeRepository.ensure_indexes()
+            clauses = []
+            if all_skills:
+                clauses.append({"skills_normalized": {"$all": list(all_skills)}})
+            if any_skills:
+                clauses.append({"skills_normalized": {"$in": list(any_skills)}})
+            if not clauses:
+                return 0, []
+            query = clauses[0] if len(clauses) == 1 else {"$and": clauses}
+            total = await db.resumes.count_documents(query)
+            cursor = db.resumes.find(query, projection).sort("uploaded_at", -1).skip(skip).limit(limit)
+            resumes = await cursor.to_list(length=limit)
+            for r in resumes:
+                r["_id"] = str(r["_id"])
+            return total, resumes
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to search resumes by skills: {str(e)}")
+
+    @staticmethod
+    async def set_normalized_skills(updates: dict) -> int:
+        """
+        Bulk-writes `skills_normalized` for {resume_id: skills} (backfill).
+        """
+        if not updates:
+            return 0
+        try:
+            result = await db.resumes.bulk_write(
+                [UpdateOne({"_id": ObjectId(i)}, {"$set": {"skills_normalized": s}}) for i, s in updates.items()],
+                ordered=False,
+            )
+            return result.modified_count
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to update resume skills: {str(e)}")
+
+    @staticmethod
+    async def find_by_content_hash(content_hash: str):
+        """
+        Finds the resume stored for a file's sha256, or None.
+        """
+        try:
+            try:
+                await ResumeRepository.ensure_indexes()
+            except Exception as e:
+                logger.warning("Resume index creation failed: %s", e)
+            resume = await db.resumes.find_one({"content_hash": content_hash})
+            if resume:
+                resume["_id"] = str(resume["_id"])
+            return resume
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Failed to fetch resume: {str(e)}")
+
     @staticmethod
     async def find_by_email(email: str):
         """
@@ -1,9 +1,11 @@
 from datetime import datetime, timedelta
 from app.config.database import db
+from app.services.utils.request_profiler import profiled
 from bson import ObjectId
 from bson.errors import InvalidId
 from fastapi import HTTPException
 
+@profiled("repository")
 class UserRepository:
     @staticmethod
     async def find_by_email(email: str):
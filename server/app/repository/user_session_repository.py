@@ -1,9 +1,11 @@
 from datetime import datetime
 
 from app.config.database import db  
+from app.services.utils.request_profiler import profiled
 from bson import ObjectId
 
 
+@profiled("repository")
 class UserSessionRepository:
     @staticmethod
     async def create_session(session_data: dict):
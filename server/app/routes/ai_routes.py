@@ -1,7 +1,10 @@
-from fastapi import APIRouter, UploadFile, File, Form, Body , Path
+from typing import List, Optional
+from fastapi import APIRouter, UploadFile, File, Form, Body , Path, Query
 from app.controllers.ai_controller import (
     parse_resume_controller,
-    find_candidates_controller
+    find_candidates_controller,
+    search_candidates_controller,
+    search_by_skills_controller
 )
 from app.views.response_formatter import format_response
 from app.repository.job_repository import JobRepository
@@ -9,7 +12,9 @@ from app.controllers.ai_controller import (
     create_job_summary_controller,
     get_job_details_controller,
     post_job_to_db_controller,
+    search_jobs_controller,
 )
+from app.services.utils.apollo_client import get_apollo_client
 from app.services.utils.log import logger
 
 # Create Router
@@ -25,17 +30,20 @@ async def generate_job_summary(
     experience: str = Form(...),
     location: str = Form(...),
     employment_type: str = Form(...),
+    stream: bool = Form(False),
 ):
     """
     Generates a detailed job requirement (without saving to DB).
-    Used for frontend preview.
+    Used for frontend preview. `stream=true` returns NDJSON events
+    (job_details first, then search_keywords).
     """
     return await create_job_summary_controller(
         title=title,
         summary=summary,
         experience=experience,
         location=location,
-        employment_type=employment_type
+        employment_type=employment_type,
+        stream=stream
     )
 
 # 3️⃣ Post job to DB (when HR clicks 'Post')
@@ -46,7 +54,7 @@ async def post_job_to_db(
     """
     Saves generated job requirement to DB and file.
     """
-    logger.debug(f"data:{job_data}")
+    logger.debug("data: %s", job_data)
     return await post_job_to_db_controller(job_data)
 
 
@@ -63,8 +71,8 @@ async def get_job_details(job_id: str = Path(..., description="MongoDB Job ID"))
 @router.get("/jobs/list")
 async def list_all_jobs():
     """
-    Fetch all job listings from the database.
-    Used by frontend to populate the dropdown for selecting requirement file.
+    Fetch the 100 newest job listings (full documents).
+    For the requirement dropdown prefer /jobs/search, which pages and stays slim.
     """
     try:
         jobs = await JobRepository.find_all()
@@ -76,18 +84,56 @@ async def list_all_jobs():
         return format_response(None, message=f"❌ Error fetching jobs: {str(e)}")
 
 
+@router.get("/jobs/search")
+async def search_jobs(
+    q: Optional[str] = Query(None, description="Search text; empty lists the newest jobs"),
+    prefix: bool = Query(False, description="Autocomplete on title words ('sen pyth' -> 'Senior Python ...')"),
+    is_active: Optional[bool] = Query(None, description="Only active (true) or inactive (false) jobs"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    slim: bool = Query(True, description="Only title, location, employment type and status"),
+):
+    """
+    Search job requisitions for the requirement picker, e.g.
+    /jobs/search?q=pyth&prefix=true&is_active=true.
+    """
+    return await search_jobs_controller(
+        q=q, prefix=prefix, is_active=is_active, limit=limit, cursor=cursor, slim=slim
+    )
+
+
+async def _prepare_job_search():
+    """
+    Job search indexes and the `title_words` backfill run at startup, so the
+    first /jobs/search does not pay for them.
+    """
+    try:
+        await JobRepository.ensure_indexes()
+        updated = await JobRepository.backfill_title_words()
+        if updated:
+            logger.info("🔎 Backfilled title_words on %s job(s)", updated)
+    except Exception as e:
+        logger.warning("Job search preparation failed: %s", e)
+
+
+router.add_event_handler("startup", _prepare_job_search)
+
+
 # -------------------- 3️⃣ RESUME PARSING --------------------
 @router.post("/resume/parse")
 async def parse_resume(
     resume: UploadFile = File(...),
-    job_id: str = Form(...)
+    job_id: str = Form(...),
+    combined: Optional[bool] = Form(None)
 ):
     """
     Upload a resume (PDF/DOCX) and match it with a selected job requirement (by job_id).
+    `combined=true` parses and matches in a single LLM call.
     """
     result = await parse_resume_controller(
         resume=resume,
-        job_id=job_id
+        job_id=job_id,
+        combined=combined
     )
     return result
 
@@ -108,3 +154,39 @@ async def find_candidates(
         top_n=top_n
     )
     return result
+
+
+async def _close_apollo_client():
+    await get_apollo_client().aclose()
+
+
+router.add_event_handler("shutdown", _close_apollo_client)
+
+
+# -------------------- 5️⃣ SEMANTIC CANDIDATE SEARCH --------------------
+@router.post("/candidates/search")
+async def search_candidates(
+    description: Optional[str] = Body(None, description="Job description text"),
+    job_id: Optional[str] = Body(None, description="Use a stored job's requirement instead"),
+    top_k: int = Body(10, ge=1, le=500)
+):
+    """
+    Returns the resumes nearest to a job description from the local vector index
+    (no LLM calls), ordered by similarity.
+    """
+    return await search_candidates_controller(description=description, job_id=job_id, top_k=top_k)
+
+
+@router.get("/candidates/skills")
+async def search_candidates_by_skills(
+    all_skills: Optional[List[str]] = Query(None, alias="all", description="Candidate must have every one of these skills"),
+    any_skills: Optional[List[str]] = Query(None, alias="any", description="Candidate must have at least one of these skills"),
+    limit: int = Query(50, ge=1, le=500),
+    skip: int = Query(0, ge=0)
+):
+    """
+    Skill search over all stored resumes, e.g.
+    /candidates/skills?all=k8s&all=golang&any=aws&any=gcp.
+    Synonyms and casing are normalized ("K8s" == "kubernetes").
+    """
+    return await search_by_skills_controller(all_skills=all_skills, any_skills=any_skills, limit=limit, skip=skip)
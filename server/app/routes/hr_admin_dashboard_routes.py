@@ -1,9 +1,23 @@
-from fastapi import APIRouter, HTTPException, Path, Query
+import os
+from fastapi import APIRouter, Body, HTTPException, Path, Query
+from fastapi.responses import FileResponse
+from app.config.config import settings
 from app.views.response_formatter import format_response
+from app.schemas.admin_dashboard_schema import BulkStatusUpdateRequest
 from app.controllers.hr_admin_dashboard_controller import (
     get_all_candidates_controller,
     get_candidate_detail_controller,
+    get_top_candidates_for_job_controller,
     update_candidate_status_controller,
+    bulk_update_candidate_status_controller,
+    get_llm_stats_controller,
+    rebuild_vector_index_controller,
+    rebuild_skill_index_controller,
+    backfill_match_scores_controller,
+    import_resume_folder_controller,
+    folder_indexer_controller,
+    get_request_profile_controller,
+    get_request_profile_artifact_controller,
 )
 
 router = APIRouter(prefix="/hr-admin", tags=["HR Admin Dashboard"])
@@ -40,6 +54,27 @@ async def get_all_candidates():
         raise HTTPException(status_code=500, detail=f"Error fetching candidates: {str(e)}")
 
 
+# -------------------- 🏆 TOP CANDIDATES FOR A JOB --------------------
+@router.get("/jobs/{job_id}/top-candidates")
+async def get_top_candidates_for_job(
+    job_id: str = Path(..., description="MongoDB ID of the job"),
+    limit: int = Query(10, ge=1, le=100),
+    min_score: float = Query(None, ge=0, le=100, description="Only candidates scoring at least this"),
+):
+    """
+    🏆 Best-scoring candidates of one job, highest match score first.
+
+    💡 Served from the (job_id, score) index instead of sorting every match result.
+    """
+    try:
+        data = await get_top_candidates_for_job_controller(job_id, limit=limit, min_score=min_score)
+        return format_response(data, message="✅ Top candidates fetched successfully")
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching top candidates: {str(e)}")
+
+
 # -------------------- 👤 FETCH SINGLE CANDIDATE DETAIL --------------------
 @router.get("/candidates/{match_result_id}")
 async def get_candidate_detail(
@@ -65,6 +100,27 @@ async def get_candidate_detail(
         raise HTTPException(status_code=500, detail=f"Error fetching candidate detail: {str(e)}")
 
 
+# -------------------- ✅ ❌ BULK ACCEPT / REJECT --------------------
+@router.put("/candidates/status/bulk")
+async def bulk_update_candidate_status(payload: BulkStatusUpdateRequest = Body(...)):
+    """
+    🔄 Accept or reject many candidates at once (e.g. mass rejections).
+
+    Emails are built from one AI-written template per job and filled in per
+    candidate; `personalize=true` adds a short per-candidate note written in
+    batched LLM calls. All emails go out over a single SMTP connection.
+    """
+    try:
+        data = await bulk_update_candidate_status_controller(
+            payload.match_result_ids, payload.status, payload.personalize
+        )
+        return format_response(data, message=f"✅ {data['updated']} candidates marked as {payload.status}")
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error updating candidate statuses: {str(e)}")
+
+
 # -------------------- ✅ ACCEPT / ❌ REJECT CANDIDATE --------------------
 @router.put("/candidates/{matchResultId}/status")
 async def update_candidate_status(
@@ -99,3 +155,129 @@ async def update_candidate_status(
         raise e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error updating candidate status: {str(e)}")
+
+
+# -------------------- 🧭 VECTOR INDEX REBUILD --------------------
+@router.post("/vector-index/rebuild")
+async def rebuild_vector_index():
+    """
+    Re-embeds all stored resumes into the local vector index used by
+    /ai/candidates/search and the /ai/candidates/find shortlist.
+    """
+    try:
+        data = await rebuild_vector_index_controller()
+        return format_response(data, message=f"✅ Indexed {data['indexed']} resumes")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error rebuilding vector index: {str(e)}")
+
+
+# -------------------- 🏷️ SKILL INDEX REBUILD --------------------
+@router.post("/skills/rebuild")
+async def rebuild_skill_index():
+    """
+    Re-normalizes the skills of all stored resumes for /ai/candidates/skills.
+    """
+    try:
+        data = await rebuild_skill_index_controller()
+        return format_response(data, message=f"✅ Normalized skills for {data['scanned']} resumes")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error rebuilding skill index: {str(e)}")
+
+
+# -------------------- 🏆 MATCH SCORE BACKFILL --------------------
+@router.post("/match-results/backfill-scores")
+async def backfill_match_scores():
+    """
+    Writes the numeric `score` on match results created before it existed.
+    """
+    try:
+        data = await backfill_match_scores_controller()
+        return format_response(data, message=f"✅ Backfilled score on {data['updated']} match results")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error backfilling match scores: {str(e)}")
+
+
+# -------------------- 🗄️ FILE STORE IMPORT --------------------
+@router.post("/file-store/import")
+async def import_resume_folder():
+    """
+    Imports resume files dropped into RESUME_FOLDER into the content-addressed
+    file store searched by /ai/candidates/find.
+    """
+    try:
+        data = await import_resume_folder_controller()
+        return format_response(data, message=f"✅ Imported {data['imported']} new resumes")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error importing resumes: {str(e)}")
+
+
+# -------------------- 📂 RESUME FOLDER INDEXER --------------------
+@router.get("/indexer")
+async def get_folder_indexer_status():
+    """
+    Status and counters of the background RESUME_FOLDER indexer.
+    """
+    return format_response(await folder_indexer_controller("status"), message="Folder indexer status")
+
+
+@router.post("/indexer/{action}")
+async def control_folder_indexer(action: str = Path(..., description="start | stop | scan")):
+    """
+    Starts or stops the background indexer, or runs one catch-up scan now.
+    """
+    data = await folder_indexer_controller(action)
+    return format_response(data, message=f"✅ Folder indexer {action} done")
+
+
+async def _start_folder_indexer():
+    if settings.INDEXER_ENABLED:
+        await folder_indexer_controller("start")
+
+
+async def _stop_folder_indexer():
+    await folder_indexer_controller("stop")
+
+
+router.add_event_handler("startup", _start_folder_indexer)
+router.add_event_handler("shutdown", _stop_folder_indexer)
+
+
+# -------------------- 📊 LLM USAGE STATS --------------------
+@router.get("/llm/stats")
+async def get_llm_stats(
+    include_recent: bool = Query(False, description="Include the most recent individual calls"),
+    reset: bool = Query(False, description="Reset counters after reading them"),
+):
+    """
+    📊 LLM call accounting for admins.
+
+    Per call site, endpoint and job:
+    - Call count, errors and JSON parse failures
+    - Prompt / completion tokens and estimated cost (USD)
+    - Average / max latency and retry count
+
+    💡 Use it to see which prompt is burning the budget.
+    """
+    data = await get_llm_stats_controller(include_recent=include_recent, reset=reset)
+    return format_response(data, message="✅ LLM usage stats fetched successfully")
+
+
+# -------------------- 🔬 REQUEST PROFILES --------------------
+@router.get("/profiles/{profile_id}")
+async def get_request_profile(profile_id: str = Path(..., description="Value of the X-Profile-Id response header")):
+    """
+    🔬 Span summary of a request profiled with `X-Profile: 1` (or `?profile=1`).
+
+    Includes total time and await time per repository method and LLM call site.
+    """
+    data = await get_request_profile_controller(profile_id)
+    return format_response(data, message="✅ Request profile fetched successfully")
+
+
+@router.get("/profiles/{profile_id}/artifact")
+async def get_request_profile_artifact(profile_id: str = Path(..., description="Value of the X-Profile-Id response header")):
+    """
+    🔥 Download the flame graph (pyinstrument HTML).
+    """
+    artifact = await get_request_profile_artifact_controller(profile_id)
+    return FileResponse(artifact, filename=os.path.basename(artifact))
@@ -40,3 +40,9 @@ class AdminDashboardResponse(BaseModel):
 class AdminDashboardListResponse(BaseModel):
     total_candidates: int
     candidates: List[AdminDashboardResponse]
+
+
+class BulkStatusUpdateRequest(BaseModel):
+    match_result_ids: List[str] = Field(..., min_length=1, description="Match results to update")
+    status: str = Field(..., description="Decision: accepted or rejected")
+    personalize: Optional[bool] = Field(None, description="Batched per-candidate note (default: EMAIL_PERSONALIZATION)")
@@ -0,0 +1,169 @@
+import re
+from typing import List, Literal, get_args, get_origin
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+
+# -------------------- BASE --------------------
+
+class LLMOutput(BaseModel):
+    """
+    Base for the JSON shapes the agents ask Gemini for.
+    Lenient on the usual model slips: null fields fall back to defaults,
+    numbers are accepted for text fields and "a, b, c" for lists.
+    Unknown keys are kept since the full dict is stored downstream.
+    """
+    model_config = ConfigDict(extra="allow")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _coerce_loose_values(cls, data):
+        if not isinstance(data, dict):
+            return data
+        cleaned = {}
+        for key, value in data.items():
+            if value is None:
+                continue
+            field = cls.model_fields.get(key)
+            if field is not None:
+                if field.annotation is str and isinstance(value, (int, float)):
+                    value = str(value)
+                elif get_origin(field.annotation) is list and isinstance(value, str):
+                    value = [part.strip() for part in re.split(r"[,\n;]", value) if part.strip()]
+                elif get_origin(field.annotation) is list and get_args(field.annotation) == (str,):
+                    value = [str(item) for item in value if item is not None] if isinstance(value, list) else value
+            cleaned[key] = value
+        return cleaned
+
+
+# -------------------- RESUME PARSE --------------------
+
+class EducationEntry(LLMOutput):
+    degree: str = ""
+    institute: str = ""
+    year: str = ""
+
+
+class ExperienceEntry(LLMOutput):
+    company: str = ""
+    role: str = ""
+    duration: str = ""
+    responsibilities: List[str] = []
+
+
+class ProjectEntry(LLMOutput):
+    title: str = ""
+    description: str = ""
+
+
+class ParsedResumeOutput(LLMOutput):
+    name: str = ""
+    email: str = ""
+    phone: str = ""
+    linkedin: str = ""
+    skills: List[str] = []
+    education: List[EducationEntry] = []
+    experience: List[ExperienceEntry] = []
+    certifications: List[str] = []
+    projects: List[ProjectEntry] = []
+    summary: str = ""
+
+
+# -------------------- MATCH RESULT --------------------
+
+class DetailedComparison(LLMOutput):
+    skills_match: str = ""
+    experience_match: str = ""
+    education_match: str = ""
+    project_relevance: str = ""
+
+
+class MatchResultOutput(LLMOutput):
+    status: Literal["pass", "fail"]
+    accuracy_score: int = Field(..., ge=0, le=100)
+    reason: str = ""
+    strengths: List[str] = []
+    weaknesses: List[str] = []
+    linked_profile_verified: bool = False
+    detailed_comparison: DetailedComparison = DetailedComparison()
+    recommendation: str = ""
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def normalize_status(cls, value):
+        return str(value).strip().lower()
+
+    @field_validator("accuracy_score", mode="before")
+    @classmethod
+    def parse_score(cls, value):
+        # "85%", "85/100", 85.4 -> 85
+        if isinstance(value, str):
+            match = re.search(r"\d+(\.\d+)?", value)
+            value = match.group(0) if match else value
+        try:
+            return int(round(float(value)))
+        except (TypeError, ValueError):
+            return value
+
+
+class ParseAndMatchOutput(LLMOutput):
+    """Combined single-call reply: parsed resume plus its match evaluation."""
+    parsed_resume: ParsedResumeOutput
+    match_result: MatchResultOutput
+
+
+# -------------------- JOB GENERATION --------------------
+
+class JobDetailsOutput(LLMOutput):
+    title: str
+    description: str
+    responsibilities: List[str] = []
+    requirements: List[str] = []
+    skills: List[str] = []
+    qualifications: List[str] = []
+    location: str = ""
+    employment_type: str = ""
+    experience: str = ""
+
+
+class SearchKeywordsOutput(LLMOutput):
+    search_query: str
+    related_titles: List[str] = []
+    recommended_skills: List[str] = []
+
+
+# -------------------- EMAIL PERSONALIZATION --------------------
+
+class PersonalNote(LLMOutput):
+    id: str
+    note: str = ""
+
+
+class EmailPersonalizationOutput(LLMOutput):
+    notes: List[PersonalNote] = []
+
+
+# -------------------- GEMINI RESPONSE SCHEMA --------------------
+
+def response_schema_for(model: type) -> dict:
+    """
+    Converts an output model to the OpenAPI subset accepted by Gemini's
+    `response_schema` (refs inlined; titles, defaults and bounds dropped).
+    """
+    schema = model.model_json_schema()
+    definitions = schema.pop("$defs", {})
+
+    def resolve(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return resolve(definitions[node["$ref"].split("/")[-1]])
+            return {
+                key: resolve(value)
+                for key, value in node.items()
+                if key not in ("title", "default", "additionalProperties", "minimum", "maximum")
+            }
+        if isinstance(node, list):
+            return [resolve(item) for item in node]
+        return node
+
+    return resolve(schema)
@@ -3,8 +3,10 @@
 from .resume_parser_agent import (
     extract_text_from_docx,
     extract_text_from_pdf,
+    extract_resume_text,
     parse_resume_with_gemini,
-    check_match
+    check_match,
+    parse_and_match_with_gemini
 )
 from .job_generator_agent import generate_job_details, generate_search_keywords
 from .candidate_finder_agent import find_candidates_via_apollo
@@ -12,8 +14,10 @@ from .candidate_finder_agent import find_candidates_via_apollo
 __all__ = [
     "extract_text_from_docx",
     "extract_text_from_pdf",
+    "extract_resume_text",
     "parse_resume_with_gemini",
     "check_match",
+    "parse_and_match_with_gemini",
     "generate_job_details",
     "generate_search_keywords",
     "find_candidates_via_apollo"
@@ -1,12 +1,12 @@
+import asyncio
 import os
-import requests
 from app.config.config import settings
 from app.services.agent.resume_parser_agent import (
     parse_resume_with_gemini,
     check_match,
-    extract_text_from_pdf,
-    extract_text_from_docx,
+    extract_resume_text,
 )
+from app.services.utils.apollo_client import get_apollo_client
 from app.services.utils.log import logger
 
 
@@ -26,7 +26,7 @@ def find_local_candidates(job_details: dict, resumes_folder: str = "uploads/resu
     matched = []
 
     if not os.path.exists(resumes_folder):
-        logger.warning(f"⚠️ Resumes folder not found: {resumes_folder}")
+        logger.warning("⚠️ Resumes folder not found: %s", resumes_folder)
         return matched
 
     for file_name in os.listdir(resumes_folder):
@@ -37,11 +37,7 @@ def find_local_candidates(job_details: dict, resumes_folder: str = "uploads/resu
 
         try:
             # Extract resume text
-            text = (
-                extract_text_from_pdf(file_path)
-                if file_name.lower().endswith(".pdf")
-                else extract_text_from_docx(file_path)
-            )
+            text = extract_resume_text(file_path)
 
             # Parse and match
             parsed_resume = parse_resume_with_gemini(text)
@@ -54,20 +50,21 @@ def find_local_candidates(job_details: dict, resumes_folder: str = "uploads/resu
                 "match_result": match_result
             })
 
-            logger.info(f"✅ Local resume processed successfully: {file_name}")
+            logger.info("✅ Local resume processed successfully: %s", file_name)
 
         except Exception as e:
-            logger.error(f"❌ Error processing local resume {file_name}: {e}")
+            logger.error("❌ Error processing local resume %s: %s", file_name, e)
 
     return matched
 
 
 # -------------------- GLOBAL CANDIDATE SEARCH (Apollo.io) --------------------
 
-def find_candidates_via_apollo(job_details: dict, top_n: int = 5) -> list:
+async def find_candidates_via_apollo(job_details: dict, top_n: int = 5) -> list:
     """
     Fetches global candidates from Apollo.io Contact Search API (Free Tier compatible).
     Returns dynamic search results — does not save anything locally.
+    Uses the shared pooled client; repeated queries are served from its cache.
 
     Args:
         job_details (dict): Must contain 'title', 'skills', or 'description'.
@@ -76,17 +73,12 @@ def find_candidates_via_apollo(job_details: dict, top_n: int = 5) -> list:
     Returns:
         list: Candidate profiles from Apollo (LinkedIn, email, title, etc.)
     """
-    api_key = settings.APOLLO_API_KEY
-    if not api_key:
+    import httpx
+
+    if not settings.APOLLO_API_KEY:
         logger.error("⚠️ Apollo API key missing in environment (.env)")
         return []
 
-    search_url = "https://api.apollo.io/v1/contacts/search"
-    headers = {
-        "Content-Type": "application/json",
-        "x-api-key": api_key,
-    }
-
     title = job_details.get("title", "")
     location = job_details.get("location", "")
     skills = ", ".join(job_details.get("skills", []))
@@ -95,47 +87,40 @@ def find_candidates_via_apollo(job_details: dict, top_n: int = 5) -> list:
     # Build query for Apollo free-tier search
     query_text = f"{title} {skills} {description}".strip()
 
-    payload = {
-        "q_keywords": query_text,
-        "person_locations": [location] if location else [],
-        "page": 1,
-        "limit": top_n,
-    }
-
     try:
-        response = requests.post(search_url, headers=headers, json=payload, timeout=20)
-        response.raise_for_status()
-        data = response.json()
+        contacts = await get_apollo_client().search_contacts(
+            query_text, [location] if location else [], limit=top_n
+        )
 
         results = []
-        for contact in data.get("contacts", []):
+        for contact in contacts:
             results.append({
                 "source": "global",
                 "name": contact.get("name"),
                 "title": contact.get("title"),
                 "linkedin_url": contact.get("linkedin_url"),
                 "email": contact.get("email"),
-                "organization": contact.get("organization", {}).get("name"),
+                "organization": (contact.get("organization") or {}).get("name"),
                 "location": contact.get("city") or contact.get("state") or "N/A",
             })
 
-        logger.info(f"🌍 Apollo global candidates fetched: {len(results)} found.")
+        logger.info("🌍 Apollo global candidates fetched: %s found.", len(results))
         return results
 
-    except requests.exceptions.HTTPError as e:
-        logger.error(f"❌ Apollo API HTTP error {e.response.status_code}: {e.response.text}")
+    except httpx.HTTPStatusError as e:
+        logger.error("❌ Apollo API HTTP error %s: %s", e.response.status_code, e.response.text)
         return []
-    except requests.exceptions.RequestException as e:
-        logger.error(f"❌ Apollo network error: {e}")
+    except httpx.HTTPError as e:
+        logger.error("❌ Apollo network error: %s", e)
         return []
     except Exception as e:
-        logger.error(f"❌ Unexpected Apollo processing error: {e}")
+        logger.error("❌ Unexpected Apollo processing error: %s", e)
         return []
 
 
 # -------------------- MAIN CANDIDATE FINDER PIPELINE --------------------
 
-def find_candidates(
+async def find_candidates(
     job_details: dict,
     resumes_folder: str = "uploads/resumes",
     global_search: bool = False,
@@ -143,6 +128,7 @@ def find_candidates(
 ) -> list:
     """
     Finds top candidates for a given job — locally and optionally via Apollo API.
+    Local matching runs in a worker thread while the Apollo search is in flight.
 
     Args:
         job_details (dict): Job description, title, or skill-based details.
@@ -155,14 +141,16 @@ def find_candidates(
     """
     all_candidates = []
 
-    # ✅ Local Matches
-    local_matches = find_local_candidates(job_details, resumes_folder)
-    all_candidates.extend(local_matches)
-
-    # ✅ Global Matches (Dynamic API — not stored)
+    # ✅ Local Matches, and Global Matches (Dynamic API — not stored) concurrently
+    local_task = asyncio.to_thread(find_local_candidates, job_details, resumes_folder)
     if global_search:
-        apollo_matches = find_candidates_via_apollo(job_details, top_n)
-        all_candidates.extend(apollo_matches)
+        local_matches, apollo_matches = await asyncio.gather(
+            local_task, find_candidates_via_apollo(job_details, top_n)
+        )
+    else:
+        local_matches, apollo_matches = await local_task, []
+    all_candidates.extend(local_matches)
+    all_candidates.extend(apollo_matches)
 
     # ✅ Sort by match quality for local resumes only
     all_candidates.sort(
@@ -174,5 +162,5 @@ def find_candidates(
         reverse=True
     )
 
-    logger.debug(f"🎯 Total candidates retrieved: {len(all_candidates)}")
+    logger.debug("🎯 Total candidates retrieved: %s", len(all_candidates))
     return all_candidates[:top_n]
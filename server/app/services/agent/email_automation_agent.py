@@ -1,96 +1,247 @@
+import asyncio
+import json
 import os
 from app.config.config import settings
 from app.repository.match_result_repository import MatchResultRepository
 from app.repository.resume_repository import ResumeRepository
 from app.repository.job_repository import JobRepository
-from app.services.utils.email_utils import send_email_smtp
+from app.schemas.llm_output_schema import EmailPersonalizationOutput
+from app.services.utils.email_utils import send_bulk_emails_smtp, send_email_smtp
+from app.services.utils.llm_client import invoke_llm, invoke_llm_json
+from app.services.utils.llm_metrics import llm_metrics
 from app.services.utils.log import logger
+from app.services.utils.ttl_cache import TTLCache
+
+# -------------------- TEMPLATE SLOTS --------------------
+# Filled locally per candidate; the LLM writes everything else once per (status, job).
+NAME_SLOT = "{{candidate_name}}"
+LINK_SLOT = "{{match_link}}"
+NOTE_SLOT = "{{personal_note}}"
+
+# Bump when the template prompt changes so cached templates are not reused
+EMAIL_TEMPLATE_VERSION = "1"
+
+FALLBACK_TEMPLATE = (
+    f"Dear {NAME_SLOT},\n\n"
+    f"{NOTE_SLOT}\n"
+    "We wanted to inform you about your {status} status for {job_title}.\n"
+    f"Please check your match details here: {LINK_SLOT}.\n\n"
+    "Best regards,\nHR Team"
+)
+
+_template_cache = TTLCache(maxsize=512, ttl=settings.EMAIL_TEMPLATE_CACHE_TTL_SECONDS)
+
+
+def render_email(template: str, candidate_name: str, match_link: str, personal_note: str = "") -> str:
+    """
+    Fills the candidate-specific slots of a cached template.
+    The personal-note line is dropped entirely when there is no note.
+    """
+    body = template.replace(NAME_SLOT, candidate_name).replace(LINK_SLOT, match_link)
+    if personal_note:
+        return body.replace(NOTE_SLOT, personal_note.strip())
+    return "\n".join(line for line in body.split("\n") if line.strip() != NOTE_SLOT).replace(NOTE_SLOT, "")
 
 
 class EmailAutomationService:
 
+    # -------------------- TEMPLATE (ONE LLM CALL PER STATUS + JOB) --------------------
     @staticmethod
-    async def generate_email_draft(status: str, candidate_name: str, job_title: str, match_link: str):
-        """
-        Uses configured Gemini model from settings to generate a personalized email draft.
-        """
+    def _generate_template(status: str, job_title: str) -> str:
         prompt = f"""
         You are an HR assistant writing professional emails.
-        Generate an email for candidate **{candidate_name}** regarding the job **{job_title}**.
+        Write an email template regarding the job **{job_title}**.
         The hiring decision is **{status}**.
+        The template is sent to many candidates, so use these placeholders exactly:
+        - {NAME_SLOT} wherever the candidate's name belongs.
+        - {LINK_SLOT} for the link to their match analysis.
+        - {NOTE_SLOT} alone on the line after the greeting (an optional candidate-specific sentence).
         Include:
-        - A warm, personalized message.
-        - Mention the candidate's name and job title.
-        - Add a link to view their match analysis: {match_link}.
+        - A warm, professional message.
+        - Mention the job title.
         - Keep it under 200 words.
+        Return only the email body.
         """
+        template = invoke_llm(prompt, call_site="generate_email_template")
+        if NAME_SLOT not in template or LINK_SLOT not in template:
+            raise ValueError("Email template is missing required placeholders")
+        return template
 
+    @staticmethod
+    async def get_email_template(status: str, job_title: str, job_id: str = None) -> str:
+        """
+        Returns the base email for (status, job), generating it with Gemini on a cache miss.
+        Falls back to a static template (not cached) when generation fails.
+        """
+        key = (EMAIL_TEMPLATE_VERSION, status, str(job_id) if job_id else job_title)
+        template = _template_cache.get(key)
+        llm_metrics.record_cache_lookup("email_template", hit=template is not None)
+        if template is not None:
+            return template
         try:
-            # ✅ Use globally configured Gemini model from settings
-            response = settings.llm.invoke(prompt)
-            return response.content.strip()
+            template = await asyncio.to_thread(EmailAutomationService._generate_template, status, job_title)
+            _template_cache.set(key, template)
+            return template
         except Exception as e:
-            logger.error(f"Gemini email draft generation failed: {str(e)}")
-            return (
-                f"Dear {candidate_name},\n\n"
-                f"We wanted to inform you about your {status} status for {job_title}.\n"
-                f"Please check your match details here: {match_link}.\n\n"
-                f"Best regards,\nHR Team"
-            )
+            logger.error("Gemini email template generation failed: %s", e)
+            return FALLBACK_TEMPLATE.replace("{status}", status).replace("{job_title}", job_title)
+
+    @staticmethod
+    async def generate_email_draft(
+        status: str, candidate_name: str, job_title: str, match_link: str, job_id: str = None
+    ):
+        """
+        Builds the email from the cached (status, job) template, filling in the
+        candidate's name and match link locally (no per-candidate LLM call).
+        """
+        template = await EmailAutomationService.get_email_template(status, job_title, job_id)
+        return render_email(template, candidate_name, match_link)
+
+    # -------------------- BATCHED PERSONALIZATION --------------------
+    @staticmethod
+    def _personalize_batch(status: str, job_title: str, candidates: list) -> dict:
+        """
+        One LLM call for a batch of candidates: returns {id: personal note}.
+        """
+        profiles = [
+            {
+                "id": c["id"],
+                "name": c["candidate_name"],
+                "strengths": (c.get("strengths") or [])[:3],
+                "weaknesses": (c.get("weaknesses") or [])[:3],
+            }
+            for c in candidates
+        ]
+        prompt = f"""
+        You are an HR assistant personalizing candidate emails.
+        The hiring decision for the job **{job_title}** is **{status}** for every candidate below.
+        For each candidate write ONE short, kind sentence (max 30 words) referring to
+        their profile. Do not repeat the decision, the job title or any link.
+
+        Candidates:
+        {json.dumps(profiles, separators=(",", ":"), ensure_ascii=False)}
+
+        Respond strictly in this JSON format:
+        {{"notes": [{{"id": "candidate id", "note": "sentence"}}]}}
+        """
+        result = invoke_llm_json(prompt, call_site="personalize_emails", schema=EmailPersonalizationOutput)
+        return {str(n.get("id")): n.get("note", "") for n in result.get("notes", []) if isinstance(n, dict)}
+
+    @staticmethod
+    async def personalize_notes(status: str, job_title: str, candidates: list) -> dict:
+        """
+        Personal notes for many candidates in batches of EMAIL_PERSONALIZATION_BATCH_SIZE.
+        Failed batches simply get no note.
+        """
+        notes = {}
+        size = max(1, settings.EMAIL_PERSONALIZATION_BATCH_SIZE)
+        for start in range(0, len(candidates), size):
+            batch = candidates[start:start + size]
+            try:
+                notes.update(await asyncio.to_thread(
+                    EmailAutomationService._personalize_batch, status, job_title, batch
+                ))
+            except Exception as e:
+                logger.error("Email personalization failed for %s candidates: %s", len(batch), e)
+        return notes
 
     # --------------------------------------------------------------------
     @staticmethod
-    async def send_candidate_status_email(match_result_id: str, status: str):
+    async def _load_candidate(match_result_id: str) -> dict:
         """
-        Generates and sends AI-drafted emails to candidates based on status update.
+        Fetches match result, resume and job; returns the email context or an error dict.
         """
-        # ✅ Step 1: Fetch match result from DB
         match_result = await MatchResultRepository.find_by_id(match_result_id)
         if not match_result:
-            logger.error(f"No match result found for ID: {match_result_id}")
-            return {"success": False, "message": "Match result not found"}
+            logger.error("No match result found for ID: %s", match_result_id)
+            return {"error": "Match result not found"}
 
-        # ✅ Step 2: Fetch related resume and job details
         resume = await ResumeRepository.find_by_id(match_result.get("resume_id"))
         job = await JobRepository.find_by_id(match_result.get("job_id"))
 
         if not resume:
-            logger.error(f"Resume not found for match result ID {match_result_id}")
-            return {"success": False, "message": "Resume not found"}
+            logger.error("Resume not found for match result ID %s", match_result_id)
+            return {"error": "Resume not found"}
         if not job:
-            logger.error(f"Job not found for match result ID {match_result_id}")
-            return {"success": False, "message": "Job not found"}
-
-        # ✅ Extract candidate info
-        candidate_email = (
-            resume.get("parsed_data", {}).get("email")
-            or resume.get("email")
-            or None
-        )
-        candidate_name = (
-            resume.get("parsed_data", {}).get("name")
-            or resume.get("file_name", "Candidate")
-        )
-        job_title = job.get("title", "the applied position")
+            logger.error("Job not found for match result ID %s", match_result_id)
+            return {"error": "Job not found"}
 
-        if not candidate_email:
-            logger.warning(f"No candidate email found in resume for match result ID {match_result_id}")
-            return {"success": False, "message": "Candidate email not found"}
+        parsed = resume.get("parsed_data", {}) or {}
+        raw_match = match_result.get("raw_response") or {}
+        return {
+            "id": match_result_id,
+            "candidate_email": parsed.get("email") or resume.get("email") or None,
+            "candidate_name": parsed.get("name") or resume.get("file_name", "Candidate"),
+            "job_id": str(job.get("_id")),
+            "job_title": job.get("title", "the applied position"),
+            "match_link": f"{settings.FRONTEND_URL}/candidate/match/{match_result_id}",
+            "strengths": raw_match.get("strengths", []) if isinstance(raw_match, dict) else [],
+            "weaknesses": raw_match.get("weaknesses", []) if isinstance(raw_match, dict) else [],
+        }
+
+    @staticmethod
+    async def send_candidate_status_email(match_result_id: str, status: str):
+        """
+        Generates and sends AI-drafted emails to candidates based on status update.
+        """
+        # ✅ Step 1-2: Fetch match result, resume and job details
+        candidate = await EmailAutomationService._load_candidate(match_result_id)
+        if "error" in candidate:
+            return {"success": False, "message": candidate["error"]}
 
-        # ✅ Step 3: Build match result link (frontend)
-        match_link = f"{settings.FRONTEND_URL}/candidate/match/{match_result_id}"
+        if not candidate["candidate_email"]:
+            logger.warning("No candidate email found in resume for match result ID %s", match_result_id)
+            return {"success": False, "message": "Candidate email not found"}
 
-        # ✅ Step 4: Generate email content using Gemini
+        # ✅ Step 3-4: Fill the (status, job) template for this candidate
         email_body = await EmailAutomationService.generate_email_draft(
             status=status,
-            candidate_name=candidate_name,
-            job_title=job_title,
-            match_link=match_link
+            candidate_name=candidate["candidate_name"],
+            job_title=candidate["job_title"],
+            match_link=candidate["match_link"],
+            job_id=candidate["job_id"],
         )
 
         # ✅ Step 5: Send the email
-        subject = f"Your Application Update for {job_title}"
-        send_email_smtp(to_email=candidate_email, subject=subject, body=email_body)
+        subject = f"Your Application Update for {candidate['job_title']}"
+        send_email_smtp(to_email=candidate["candidate_email"], subject=subject, body=email_body)
+
+        logger.info("✅ Email sent to %s for status: %s", candidate["candidate_email"], status)
+        return {"success": True, "message": f"Email sent to {candidate['candidate_email']} for status '{status}'"}
+
+    @staticmethod
+    async def send_bulk_status_emails(match_result_ids: list, status: str, personalize: bool = None):
+        """
+        Emails many candidates about the same decision: one template per job,
+        optional batched personalization, one SMTP connection.
+        Returns {match_result_id: message}.
+        """
+        personalize = settings.EMAIL_PERSONALIZATION if personalize is None else personalize
+        report = {}
+        by_job = {}
+        for match_result_id in match_result_ids:
+            try:
+                candidate = await EmailAutomationService._load_candidate(match_result_id)
+            except Exception as e:
+                candidate = {"error": str(e)}
+            if "error" in candidate:
+                report[match_result_id] = candidate["error"]
+            elif not candidate["candidate_email"]:
+                report[match_result_id] = "Candidate email not found"
+            else:
+                by_job.setdefault(candidate["job_id"], []).append(candidate)
+
+        outgoing = []
+        for job_id, candidates in by_job.items():
+            job_title = candidates[0]["job_title"]
+            template = await EmailAutomationService.get_email_template(status, job_title, job_id)
+            notes = await EmailAutomationService.personalize_notes(status, job_title, candidates) if personalize else {}
+            subject = f"Your Application Update for {job_title}"
+            for c in candidates:
+                body = render_email(template, c["candidate_name"], c["match_link"], notes.get(c["id"], ""))
+                outgoing.append((c["id"], c["candidate_email"], subject, body))
 
-        logger.info(f"✅ Email sent to {candidate_email} for status: {status}")
-        return {"success": True, "message": f"Email sent to {candidate_email} for status '{status}'"}
+        sent = set(await asyncio.to_thread(send_bulk_emails_smtp, [o[1:] for o in outgoing]))
+        for index, (match_result_id, email, _, _) in enumerate(outgoing):
+            report[match_result_id] = f"Email sent to {email}" if index in sent else f"Failed to send email to {email}"
+        return report
@@ -1,5 +1,6 @@
-import json
-from app.config.config import settings  # Centralized LLM and keys
+from app.schemas.llm_output_schema import JobDetailsOutput, SearchKeywordsOutput
+from app.services.utils.llm_client import invoke_llm_json  # Shared, metered LLM client
+from app.services.utils.prompt_builder import build_json_context
 
 
 # -------------------- JOB DETAIL GENERATION --------------------
@@ -32,17 +33,7 @@ def generate_job_details(summary_text: str, title: str, experience: str, locatio
     }}
     """
 
-    response = settings.llm.invoke(prompt)
-    text = response.content.strip()
-
-    # Clean Gemini output if wrapped in code fences
-    if text.startswith("```"):
-        text = text.replace("```json", "").replace("```", "").strip()
-
-    try:
-        return json.loads(text)
-    except Exception:
-        return {"raw_response": text}
+    return invoke_llm_json(prompt, call_site="generate_job_details", schema=JobDetailsOutput)
 
 
 # -------------------- SEARCH KEYWORD GENERATION --------------------
@@ -51,13 +42,15 @@ def generate_search_keywords(job_details: dict) -> dict:
     """
     Generate LinkedIn or resume search queries & related titles using Gemini.
     """
+    job_context = build_json_context(job_details, token_budget=0, call_site="generate_search_keywords")
+
     prompt = f"""
     You are a recruitment sourcing assistant.
     Based on the job details below, generate a professional LinkedIn search query,
     along with related job titles and recommended skills.
 
     Job Details:
-    {json.dumps(job_details, indent=2)}
+    {job_context}
 
     Respond strictly in this JSON format:
     {{
@@ -67,13 +60,4 @@ def generate_search_keywords(job_details: dict) -> dict:
     }}
     """
 
-    response = settings.llm.invoke(prompt)
-    text = response.content.strip()
-
-    if text.startswith("```"):
-        text = text.replace("```json", "").replace("```", "").strip()
-
-    try:
-        return json.loads(text)
-    except Exception:
-        return {"raw_response": text}
+    return invoke_llm_json(prompt, call_site="generate_search_keywords", schema=SearchKeywordsOutput)
@@ -1,20 +1,27 @@
-import json
 import os
-import pymupdf
-from docx import Document
 from app.config.config import settings
+from app.schemas.llm_output_schema import MatchResultOutput, ParseAndMatchOutput, ParsedResumeOutput
+from app.services.utils.llm_client import invoke_llm_json
+from app.services.utils.llm_metrics import llm_metrics
+from app.services.utils.text_cache import get_text_cache
+from app.services.utils.upload_utils import hash_file
+from app.services.utils.prompt_builder import build_json_context, build_text_context
 
 
 # -------------------- TEXT EXTRACTION --------------------
 
 def extract_text_from_docx(file_path: str) -> str:
     """Extract text from DOCX resume."""
+    from docx import Document  # deferred: heavy import only needed for DOCX uploads
+
     doc = Document(file_path)
     return "\n".join([p.text for p in doc.paragraphs if p.text.strip()])
 
 
 def extract_text_from_pdf(file_path: str) -> str:
     """Extract text from PDF resume using PyMuPDF."""
+    import pymupdf  # deferred: heavy import only needed for PDF uploads
+
     text = ""
     pdf = pymupdf.open(file_path)
     for page in pdf:
@@ -23,47 +30,101 @@ def extract_text_from_pdf(file_path: str) -> str:
     return text.strip()
 
 
-# -------------------- GEMINI AI RESUME PARSING --------------------
-
-def parse_resume_with_gemini(resume_text: str) -> dict:
+def extract_resume_text(file_path: str, content_hash: str = None) -> str:
     """
-    Parse raw resume text into detailed structured JSON using Gemini.
+    Text of a .pdf/.docx resume, extracted at most once per file content:
+    later calls read the compressed copy from the text cache.
     """
-    prompt = f"""
-    You are an expert Resume Parsing AI.
-    Analyze the resume text carefully and extract detailed structured information.
+    if content_hash is None:
+        content_hash, _ = hash_file(file_path)
+    cache = get_text_cache()
+    text = cache.get(content_hash)
+    llm_metrics.record_cache_lookup("extracted_text", hit=text is not None)
+    if text is not None:
+        return text
+
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext == ".pdf":
+        text = extract_text_from_pdf(file_path)
+    elif ext == ".docx":
+        text = extract_text_from_docx(file_path)
+    else:
+        raise ValueError("Unsupported resume format. Must be .docx or .pdf")
+    cache.set(content_hash, text)
+    return text
 
-    Return STRICTLY in this JSON format:
-    {{
+
+# -------------------- OUTPUT FORMATS --------------------
+# Shared by the separate and the combined prompts (inserted into f-strings).
+
+# Part of the match cache key: bump when the match prompt or MatchResultOutput changes
+MATCH_PROMPT_VERSION = "1"
+
+PARSED_RESUME_FORMAT = """{
       "name": "Full name of the candidate",
       "email": "Primary valid email address",
       "phone": "Primary phone number with country code if available",
       "linkedin": "LinkedIn profile URL if mentioned, else empty string",
       "skills": ["list", "of", "key", "technical and soft skills"],
       "education": [
-        {{
+        {
           "degree": "e.g. B.Tech in Computer Science",
           "institute": "e.g. IIT Delhi",
           "year": "e.g. 2022"
-        }}
+        }
       ],
       "experience": [
-        {{
+        {
           "company": "Company Name",
           "role": "Job Title",
           "duration": "e.g. Jan 2021 - Dec 2023",
           "responsibilities": ["list", "of", "main", "responsibilities"]
-        }}
+        }
       ],
       "certifications": ["List of relevant certifications, if any"],
       "projects": [
-        {{
+        {
           "title": "Project title",
           "description": "Brief description of the project"
-        }}
+        }
       ],
       "summary": "Brief professional summary (if available)"
-    }}
+    }"""
+
+MATCH_RESULT_FORMAT = """{
+      "status": "pass" or "fail",
+      "accuracy_score": 0-100,
+      "reason": "Summary of why candidate passed or failed",
+      "strengths": ["key areas where candidate matches well"],
+      "weaknesses": ["key areas where candidate falls short"],
+      "linked_profile_verified": true or false,
+      "detailed_comparison": {
+        "skills_match": "percentage of matching skills",
+        "experience_match": "evaluation summary",
+        "education_match": "evaluation summary",
+        "project_relevance": "short summary"
+      },
+      "recommendation": "short recruiter recommendation (1-2 sentences)"
+    }"""
+
+
+# -------------------- GEMINI AI RESUME PARSING --------------------
+
+def parse_resume_with_gemini(resume_text: str) -> dict:
+    """
+    Parse raw resume text into detailed structured JSON using Gemini.
+    The resume text is normalized and fitted to RESUME_PROMPT_TOKEN_BUDGET first.
+    """
+    resume_text = build_text_context(
+        resume_text, settings.RESUME_PROMPT_TOKEN_BUDGET, call_site="parse_resume"
+    )
+
+    prompt = f"""
+    You are an expert Resume Parsing AI.
+    Analyze the resume text carefully and extract detailed structured information.
+
+    Return STRICTLY in this JSON format:
+    {PARSED_RESUME_FORMAT}
 
     Ensure output is valid JSON without any commentary or markdown fences.
 
@@ -71,16 +132,7 @@ def parse_resume_with_gemini(resume_text: str) -> dict:
     {resume_text}
     """
 
-    response = settings.llm.invoke(prompt)
-    text = response.content.strip()
-
-    if text.startswith("```"):
-        text = text.replace("```json", "").replace("```", "").strip()
-
-    try:
-        return json.loads(text)
-    except Exception:
-        return {"raw_response": text}
+    return invoke_llm_json(prompt, call_site="parse_resume", schema=ParsedResumeOutput)
 
 
 # -------------------- GEMINI AI MATCHING --------------------
@@ -89,7 +141,15 @@ def check_match(requirement_text: str, parsed_resume: dict) -> dict:
     """
     Compare job requirement with parsed resume using Gemini.
     Returns detailed structured JSON including accuracy score and analysis.
+    The requirement is normalized/truncated and the resume sent as compact JSON.
     """
+    requirement_context = build_text_context(
+        requirement_text, settings.REQUIREMENT_PROMPT_TOKEN_BUDGET, call_site="check_match.requirement"
+    )
+    resume_context = build_json_context(
+        parsed_resume, settings.PARSED_RESUME_PROMPT_TOKEN_BUDGET, call_site="check_match.resume"
+    )
+
     prompt = f"""
     You are a job matching assistant.
     Compare the following job requirement with the parsed resume data and provide
@@ -104,41 +164,71 @@ def check_match(requirement_text: str, parsed_resume: dict) -> dict:
     - Overall match confidence (accuracy score)
 
     Respond STRICTLY in this JSON format:
-    {{
-      "status": "pass" or "fail",
-      "accuracy_score": 0-100,
-      "reason": "Summary of why candidate passed or failed",
-      "strengths": ["key areas where candidate matches well"],
-      "weaknesses": ["key areas where candidate falls short"],
-      "linked_profile_verified": true or false,
-      "detailed_comparison": {{
-        "skills_match": "percentage of matching skills",
-        "experience_match": "evaluation summary",
-        "education_match": "evaluation summary",
-        "project_relevance": "short summary"
-      }},
-      "recommendation": "short recruiter recommendation (1-2 sentences)"
-    }}
+    {MATCH_RESULT_FORMAT}
 
     Job Requirement:
-    {requirement_text}
+    {requirement_context}
 
     Resume Data:
-    {json.dumps(parsed_resume, indent=2)}
+    {resume_context}
 
     Return ONLY the JSON. Do not include any explanations or markdown formatting.
     """
 
-    response = settings.llm.invoke(prompt)
-    text = response.content.strip()
+    return invoke_llm_json(prompt, call_site="check_match", schema=MatchResultOutput)
 
-    if text.startswith("```"):
-        text = text.replace("```json", "").replace("```", "").strip()
 
-    try:
-        return json.loads(text)
-    except Exception:
-        return {"raw_response": text}
+# -------------------- GEMINI AI COMBINED PARSE + MATCH --------------------
+
+def parse_and_match_with_gemini(resume_text: str, requirement_text: str) -> dict:
+    """
+    Parses the resume and scores it against the requirement in a single Gemini call.
+    Returns {"parsed_resume": {...}, "match_result": {...}} in the same shapes as
+    parse_resume_with_gemini and check_match, so callers can store them unchanged.
+    """
+    resume_context = build_text_context(
+        resume_text, settings.RESUME_PROMPT_TOKEN_BUDGET, call_site="parse_and_match.resume"
+    )
+    requirement_context = build_text_context(
+        requirement_text, settings.REQUIREMENT_PROMPT_TOKEN_BUDGET, call_site="parse_and_match.requirement"
+    )
+
+    prompt = f"""
+    You are an expert resume screening AI.
+    First extract structured information from the resume text, then compare the
+    extracted data with the job requirement and provide a structured evaluation.
+
+    For the evaluation consider:
+    - Skill relevance
+    - Experience alignment
+    - Education suitability
+    - Project/Certification relevance
+    - Presence of verified links (e.g. LinkedIn)
+    - Overall match confidence (accuracy score)
+
+    Respond STRICTLY in this JSON format:
+    {{
+      "parsed_resume": {PARSED_RESUME_FORMAT},
+      "match_result": {MATCH_RESULT_FORMAT}
+    }}
+
+    Job Requirement:
+    {requirement_context}
+
+    Resume Text:
+    {resume_context}
+
+    Return ONLY the JSON. Do not include any explanations or markdown formatting.
+    """
+
+    result = invoke_llm_json(prompt, call_site="parse_and_match", schema=ParseAndMatchOutput)
+    if "raw_response" in result and "match_result" not in result:
+        # Unusable reply: keep the raw text where callers look for it
+        return {"parsed_resume": result, "match_result": dict(result)}
+    return {
+        "parsed_resume": result.get("parsed_resume", {}),
+        "match_result": result.get("match_result", {}),
+    }
 
 
 # -------------------- MAIN PIPELINE FUNCTION --------------------
@@ -150,12 +240,7 @@ def process_resume_and_match(resume_path: str, requirement_path: str) -> dict:
       2. Parse resume using Gemini
       3. Compare with requirement text
     """
-    if resume_path.endswith(".docx"):
-        resume_text = extract_text_from_docx(resume_path)
-    elif resume_path.endswith(".pdf"):
-        resume_text = extract_text_from_pdf(resume_path)
-    else:
-        raise ValueError("Unsupported resume format. Must be .docx or .pdf")
+    resume_text = extract_resume_text(resume_path)
 
     parsed_resume = parse_resume_with_gemini(resume_text)
 
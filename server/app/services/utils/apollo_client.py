@@ -0,0 +1,130 @@
+import asyncio
+import math
+import re
+from app.config.config import settings
+from app.services.utils.llm_metrics import llm_metrics
+from app.services.utils.log import logger
+from app.services.utils.ttl_cache import TTLCache
+
+# httpx is imported when the first client is built so importing this module
+# (done by the AI routes) does not slow down startup.
+
+CONTACTS_SEARCH_PATH = "/v1/contacts/search"
+
+
+def normalize_query(text: str) -> str:
+    """
+    Cache key form of a keyword query: lower-cased, punctuation-insensitive,
+    whitespace collapsed.
+    """
+    return " ".join(re.findall(r"[a-z0-9+#.]+", (text or "").lower()))
+
+
+class ApolloClient:
+    """
+    Async Apollo.io client over one pooled keep-alive `httpx.AsyncClient`.
+
+    Searches fetch as many pages as the requested limit needs, at most
+    APOLLO_MAX_PARALLEL_PAGES at a time, and are cached by normalized query.
+    """
+
+    def __init__(
+        self,
+        base_url: str = None,
+        api_key: str = None,
+        timeout: float = None,
+        max_connections: int = None,
+        page_size: int = None,
+        max_parallel_pages: int = None,
+    ):
+        self.base_url = base_url or settings.APOLLO_BASE_URL
+        self.api_key = api_key if api_key is not None else settings.APOLLO_API_KEY
+        self.timeout = timeout or settings.APOLLO_TIMEOUT_SECONDS
+        self.max_connections = max_connections or settings.APOLLO_MAX_CONNECTIONS
+        self.page_size = page_size or settings.APOLLO_PAGE_SIZE
+        self.max_parallel_pages = max(1, max_parallel_pages or settings.APOLLO_MAX_PARALLEL_PAGES)
+        self._cache = TTLCache(maxsize=settings.APOLLO_CACHE_SIZE, ttl=settings.APOLLO_CACHE_TTL_SECONDS)
+        self._client = None
+
+    def _http(self):
+        if self._client is None or self._client.is_closed:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"Content-Type": "application/json", "x-api-key": self.api_key},
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    # -------------------- PAGES --------------------
+    async def fetch_page(self, payload: dict, page: int, per_page: int) -> dict:
+        """
+        One page of contacts search; raises httpx errors to the caller.
+        """
+        response = await self._http().post(
+            CONTACTS_SEARCH_PATH, json={**payload, "page": page, "per_page": per_page}
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def search_contacts(self, keywords: str, locations: list = None, limit: int = 5) -> list:
+        """
+        Up to `limit` contacts for a keyword query. The first page tells how many
+        pages exist; the rest are fetched concurrently (bounded).
+        """
+        key = (normalize_query(keywords), tuple(sorted(normalize_query(l) for l in locations or [])), limit)
+        cached = self._cache.get(key)
+        llm_metrics.record_cache_lookup("apollo_search", hit=cached is not None)
+        if cached is not None:
+            return cached
+
+        payload = {"q_keywords": keywords, "person_locations": locations or []}
+        per_page = max(1, min(limit, self.page_size))
+        first = await self.fetch_page(payload, 1, per_page)
+        contacts = list(first.get("contacts", []))
+        complete = True
+
+        total_pages = (first.get("pagination") or {}).get("total_pages") or 1
+        wanted_pages = min(math.ceil(limit / per_page), total_pages)
+        if wanted_pages > 1 and len(contacts) < limit:
+            semaphore = asyncio.Semaphore(self.max_parallel_pages)
+
+            async def fetch(page):
+                async with semaphore:
+                    return await self.fetch_page(payload, page, per_page)
+
+            pages = await asyncio.gather(*(fetch(p) for p in range(2, wanted_pages + 1)), return_exceptions=True)
+            for page, result in enumerate(pages, start=2):
+                if isinstance(result, Exception):
+                    logger.warning("Apollo page %s failed: %s", page, result)
+                    complete = False
+                    continue
+                contacts.extend(result.get("contacts", []))
+
+        contacts = contacts[:limit]
+        if complete:
+            self._cache.set(key, contacts)
+        return contacts
+
+
+_client = None
+
+
+def get_apollo_client() -> ApolloClient:
+    """
+    Shared client, so every request reuses the same connection pool.
+    """
+    global _client
+    if _client is None:
+        _client = ApolloClient()
+    return _client
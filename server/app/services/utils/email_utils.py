@@ -5,33 +5,75 @@ from app.config.config import settings
 from app.services.utils.log import logger
 
 
+def _build_message(to_email: str, subject: str, body: str) -> MIMEMultipart:
+    message = MIMEMultipart()
+    message["From"] = settings.SMTP_USER
+    message["To"] = to_email
+    message["Subject"] = subject
+    message.attach(MIMEText(body, "plain"))
+    return message
+
+
+def _connect_smtp():
+    if settings.SMTP_TLS:
+        server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT)
+        server.starttls()
+    else:
+        server = smtplib.SMTP_SSL(settings.SMTP_HOST, settings.SMTP_PORT)
+    server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+    return server
+
+
 def send_email_smtp(to_email: str, subject: str, body: str):
     """
     Sends an email using configured SMTP server.
     """
     try:
         # 1️⃣ Build the message
-        message = MIMEMultipart()
-        message["From"] = settings.SMTP_USER
-        message["To"] = to_email
-        message["Subject"] = subject
-        message.attach(MIMEText(body, "plain"))
-
-        # 2️⃣ Connect to SMTP
-        if settings.SMTP_TLS:
-            server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT)
-            server.starttls()
-        else:
-            server = smtplib.SMTP_SSL(settings.SMTP_HOST, settings.SMTP_PORT)
-
-        # 3️⃣ Login & send
-        server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+        message = _build_message(to_email, subject, body)
+
+        # 2️⃣ Connect & login
+        server = _connect_smtp()
+
+        # 3️⃣ Send
         server.send_message(message)
         server.quit()
 
-        logger.info(f"✅ Email sent to {to_email} | Subject: {subject}")
+        logger.info("✅ Email sent to %s | Subject: %s", to_email, subject)
         return True
 
     except Exception as e:
-        logger.error(f"❌ Failed to send email to {to_email}: {e}")
+        logger.error("❌ Failed to send email to %s: %s", to_email, e)
         return False
+
+
+def send_bulk_emails_smtp(emails: list) -> list:
+    """
+    Sends many (to_email, subject, body) emails over a single SMTP connection.
+    Returns the positions in `emails` that were sent successfully, so two
+    entries for the same address are reported separately.
+    """
+    sent = []
+    if not emails:
+        return sent
+    try:
+        server = _connect_smtp()
+    except Exception as e:
+        logger.error("❌ SMTP connection failed for bulk send of %s emails: %s", len(emails), e)
+        return sent
+
+    try:
+        for index, (to_email, subject, body) in enumerate(emails):
+            try:
+                server.send_message(_build_message(to_email, subject, body))
+                sent.append(index)
+            except Exception as e:
+                logger.error("❌ Failed to send email to %s: %s", to_email, e)
+    finally:
+        try:
+            server.quit()
+        except Exception:
+            pass
+
+    logger.info("✅ Bulk email: %s/%s sent", len(sent), len(emails))
+    return sent
@@ -0,0 +1,150 @@
+import asyncio
+import os
+import shutil
+import time
+import uuid
+from fastapi import UploadFile
+from app.config.config import settings
+from app.repository.file_repository import FileRepository
+from app.services.utils.log import logger
+from app.services.utils.upload_utils import discard_upload, hash_file, stream_upload
+
+# -------------------- KINDS --------------------
+RESUME = "resume"
+REQUIREMENT = "requirement"
+
+
+class FileStore:
+    """
+    Content-addressed file storage: each file lives once at
+    <root>/<h[0:2]>/<h[2:4]>/<sha256><ext>, so no directory grows past a few
+    hundred entries and same-named uploads never collide. Metadata (kind,
+    size, original names) is kept in Mongo by FileRepository; existence checks
+    and lookups are O(1) and iteration never lists directories.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.temp_dir = os.path.join(root, ".tmp")
+        # path -> (mtime_ns, size) of loose files already imported by sync_folder
+        self._synced = {}
+
+    def path_for(self, content_hash: str, ext: str) -> str:
+        return os.path.join(self.root, content_hash[:2], content_hash[2:4], f"{content_hash}{ext}")
+
+    def has_file(self, content_hash: str, ext: str) -> bool:
+        return os.path.exists(self.path_for(content_hash, ext))
+
+    async def exists(self, content_hash: str) -> bool:
+        return await FileRepository.exists(content_hash)
+
+    # -------------------- WRITE --------------------
+    async def stream_to_temp(self, upload: UploadFile) -> tuple:
+        """
+        Streams an upload into the store's temp area: (temp_path, sha256, size).
+        Finish with `commit` or drop it with `discard_upload`.
+        """
+        return await stream_upload(upload, self.temp_dir)
+
+    async def commit(
+        self, temp_path: str, content_hash: str, size: int, ext: str, kind: str, original_name: str = None
+    ) -> dict:
+        """
+        Moves a hashed temp file to its content address (atomic rename; if the
+        content is already stored the temp file is dropped) and records metadata.
+        """
+        path = self.path_for(content_hash, ext)
+        if os.path.exists(path):
+            discard_upload(temp_path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(temp_path, path)
+        created = await FileRepository.register(content_hash, kind, ext, size, original_name)
+        return {"content_hash": content_hash, "path": path, "size": size, "ext": ext, "created": created}
+
+    async def save_upload(self, upload: UploadFile, kind: str) -> dict:
+        temp_path, content_hash, size = await self.stream_to_temp(upload)
+        ext = os.path.splitext(upload.filename or "")[1].lower()
+        return await self.commit(temp_path, content_hash, size, ext, kind, os.path.basename(upload.filename or ""))
+
+    async def import_file(self, source_path: str, kind: str, content_hash: str = None, size: int = None) -> dict:
+        """
+        Copies a file from outside the store (e.g. a synced folder) into it.
+        Pass `content_hash` and `size` when the caller already hashed the file.
+        """
+        if content_hash is None or size is None:
+            content_hash, size = await asyncio.to_thread(hash_file, source_path)
+        ext = os.path.splitext(source_path)[1].lower()
+        name = os.path.basename(source_path)
+        if self.has_file(content_hash, ext):
+            created = await FileRepository.register(content_hash, kind, ext, size, name)
+            return {"content_hash": content_hash, "path": self.path_for(content_hash, ext), "size": size, "ext": ext, "created": created}
+        os.makedirs(self.temp_dir, exist_ok=True)
+        # Unique name: two imports of the same content may now overlap
+        temp_path = os.path.join(self.temp_dir, f".import-{uuid.uuid4().hex}.part")
+        await asyncio.to_thread(shutil.copyfile, source_path, temp_path)
+        return await self.commit(temp_path, content_hash, size, ext, kind, name)
+
+    async def sync_folder(self, folder: str, kind: str, extensions: tuple = (".pdf", ".docx")) -> int:
+        """
+        Imports loose files of `folder` (e.g. RESUME_FOLDER fed by SFTP) that this
+        process has not imported yet. Files are re-hashed only when their
+        (mtime, size) changes, so repeat calls cost one directory listing.
+        Files modified in the last INDEXER_SETTLE_SECONDS may still be copying
+        and wait for the next call. Returns the number of newly stored files.
+        """
+        def scan():
+            if not os.path.isdir(folder):
+                return []
+            cutoff = time.time() - settings.INDEXER_SETTLE_SECONDS
+            found = []
+            for entry in os.scandir(folder):
+                if entry.is_file() and entry.name.lower().endswith(extensions):
+                    stat = entry.stat()
+                    if stat.st_mtime <= cutoff:
+                        found.append((entry.path, (stat.st_mtime_ns, stat.st_size)))
+            return found
+
+        imported = 0
+        for path, signature in await asyncio.to_thread(scan):
+            if self._synced.get(path) == signature:
+                continue
+            try:
+                stored = await self.import_file(path, kind)
+                imported += stored["created"]
+                self._synced[path] = signature
+            except Exception as e:
+                logger.error("❌ Failed to import %s into the file store: %s", path, e)
+        return imported
+
+    async def delete(self, content_hash: str):
+        entry = await FileRepository.find(content_hash)
+        if entry:
+            discard_upload(self.path_for(content_hash, entry.get("ext", "")))
+            await FileRepository.delete(content_hash)
+
+    # -------------------- READ --------------------
+    async def iter_files(self, kind: str = None):
+        """
+        Yields {"content_hash", "path", "name", "ext", "size"} for stored files
+        from the metadata index.
+        """
+        async for entry in FileRepository.iter_files(kind):
+            names = entry.get("original_names") or []
+            yield {
+                "content_hash": entry["_id"],
+                "path": self.path_for(entry["_id"], entry.get("ext", "")),
+                "name": names[0] if names else entry["_id"] + entry.get("ext", ""),
+                "ext": entry.get("ext", ""),
+                "size": entry.get("size"),
+            }
+
+
+_store = None
+
+
+def get_file_store() -> FileStore:
+    global _store
+    if _store is None:
+        _store = FileStore(settings.FILE_STORE_FOLDER)
+    return _store
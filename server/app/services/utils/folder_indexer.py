@@ -0,0 +1,300 @@
+import asyncio
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import time
+from datetime import datetime
+from app.config.config import settings
+from app.services.utils.log import logger
+from app.services.utils.resume_ingest import UnreadableResumeError, ingest_resume_file
+from app.services.utils.upload_utils import hash_file
+
+RESUME_EXTENSIONS = (".pdf", ".docx")
+
+
+# -------------------- INOTIFY (LINUX, NO DEPENDENCIES) --------------------
+
+class InotifyWatcher:
+    """
+    Minimal inotify binding over libc: reports names of files finished
+    writing (IN_CLOSE_WRITE) or moved into the folder (IN_MOVED_TO).
+    Raises OSError where inotify is unavailable.
+    """
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_Q_OVERFLOW = 0x00004000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, folder: str):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self.fd, folder.encode(), self.IN_CLOSE_WRITE | self.IN_MOVED_TO) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for {folder}")
+        self.overflowed = False
+
+    def read(self, timeout: float) -> list:
+        """
+        Blocks up to `timeout` seconds; returns the file names that changed.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        names, offset = [], 0
+        while offset + self._EVENT.size <= len(data):
+            _, mask, _, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0").decode("utf-8", "replace")
+            offset += length
+            if mask & self.IN_Q_OVERFLOW:
+                self.overflowed = True
+            elif name:
+                names.append(name)
+        return names
+
+    def close(self):
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+# -------------------- INDEXER --------------------
+
+class FolderIndexer:
+    """
+    Keeps `resumes` in sync with files dropped into a folder (e.g. by SFTP).
+
+    A file is (re)ingested only when its (mtime, size) differs from the
+    checkpoint and its content hash is new. An unreadable file is retried once
+    it changes; transient failures (LLM, database) are retried with backoff and
+    then on the next scan. The checkpoint is persisted as JSON so restarts
+    resume where they stopped. Changes are picked up through
+    inotify when available, with a periodic full rescan as a safety net;
+    otherwise the folder is polled every INDEXER_POLL_SECONDS.
+    """
+
+    def __init__(self, folder: str, checkpoint_path: str):
+        self.folder = folder
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint = self._load_checkpoint()
+        self.mode = None
+        self._task = None
+        self._stop = None
+        self._scan_lock = asyncio.Lock()
+        self._hash_locks = {}
+        self.stats = {"scans": 0, "ingested": 0, "unchanged": 0, "duplicates": 0, "failed": 0, "last_scan_at": None}
+
+    # -------------------- CHECKPOINT --------------------
+    def _load_checkpoint(self) -> dict:
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Indexer checkpoint unreadable, starting fresh: %s", e)
+            return {}
+
+    def _save_checkpoint(self):
+        os.makedirs(os.path.dirname(self.checkpoint_path) or ".", exist_ok=True)
+        tmp = self.checkpoint_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.checkpoint, f)
+        os.replace(tmp, self.checkpoint_path)
+
+    # -------------------- SCAN --------------------
+    def _pending(self, paths: list = None) -> list:
+        """
+        Files whose (mtime, size) differ from the checkpoint. A full scan also
+        skips files modified in the last INDEXER_SETTLE_SECONDS (may still be
+        copying); `paths` come from inotify close/move events and are complete.
+        """
+        if paths is None:
+            if not os.path.isdir(self.folder):
+                return []
+            entries = [e for e in os.scandir(self.folder) if e.is_file()]
+            seen = {e.name for e in entries}
+            for name in [n for n in self.checkpoint if n not in seen]:
+                del self.checkpoint[name]
+            candidates = [(e.name, e.path, e.stat()) for e in entries]
+        else:
+            candidates = []
+            for path in paths:
+                try:
+                    candidates.append((os.path.basename(path), path, os.stat(path)))
+                except FileNotFoundError:
+                    continue
+
+        now = time.time()
+        pending = []
+        for name, path, stat in candidates:
+            if not name.lower().endswith(RESUME_EXTENSIONS):
+                continue
+            known = self.checkpoint.get(name)
+            if known and known["mtime_ns"] == stat.st_mtime_ns and known["size"] == stat.st_size:
+                # Indexed (or failed) in an earlier pass and untouched since
+                continue
+            if paths is None and now - stat.st_mtime < settings.INDEXER_SETTLE_SECONDS:
+                # Possibly still being written; inotify reports it once closed
+                continue
+            pending.append((name, path, stat))
+        return pending
+
+    async def _ingest_once(self, name: str, path: str, stat) -> None:
+        content_hash, size = await asyncio.to_thread(hash_file, path)
+        known = self.checkpoint.get(name)
+        if known and known.get("hash") == content_hash:
+            # Touched but identical content
+            self.stats["unchanged"] += 1
+        else:
+            # Same content under two names in one scan: ingest once, the other is a duplicate.
+            # Entries are [lock, users] and dropped by the last user.
+            entry = self._hash_locks.setdefault(content_hash, [asyncio.Lock(), 0])
+            entry[1] += 1
+            try:
+                async with entry[0]:
+                    result = await ingest_resume_file(path, name, content_hash, size, source="folder")
+            finally:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._hash_locks[content_hash]
+            self.stats["ingested" if result["created"] else "duplicates"] += 1
+        self.checkpoint[name] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "hash": content_hash}
+
+    async def _ingest(self, name: str, path: str, stat) -> None:
+        attempts = max(1, settings.INDEXER_INGEST_ATTEMPTS)
+        for attempt in range(attempts):
+            try:
+                await self._ingest_once(name, path, stat)
+                return
+            except UnreadableResumeError as e:
+                self.stats["failed"] += 1
+                # Remembered with its (mtime, size): retried once the file changes, not on every poll
+                self.checkpoint[name] = {
+                    "mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "hash": None, "failed": str(e)[:200],
+                }
+                logger.error("❌ Folder indexer cannot read %s: %s", path, e)
+                return
+            except Exception as e:
+                if attempt + 1 < attempts:
+                    delay = settings.INDEXER_RETRY_BASE_SECONDS * (2 ** attempt)
+                    logger.warning("Folder indexer failed on %s (%s); retry %s in %.1fs", path, e, attempt + 1, delay)
+                    await asyncio.sleep(delay)
+                    continue
+                # Not checkpointed: the next scan picks the file up again
+                self.stats["failed"] += 1
+                logger.error("❌ Folder indexer failed on %s after %s attempts: %s", path, attempts, e)
+
+    async def scan(self, paths: list = None) -> dict:
+        """
+        Ingests new or changed files (all of the folder, or only `paths`).
+        """
+        async with self._scan_lock:
+            before = dict(self.stats)
+            pending = await asyncio.to_thread(self._pending, paths)
+            semaphore = asyncio.Semaphore(max(1, settings.INDEXER_CONCURRENCY))
+
+            async def run(item):
+                async with semaphore:
+                    await self._ingest(*item)
+
+            await asyncio.gather(*(run(item) for item in pending))
+            await asyncio.to_thread(self._save_checkpoint)
+            self.stats["scans"] += 1
+            self.stats["last_scan_at"] = datetime.utcnow().isoformat()
+            return {k: self.stats[k] - before[k] for k in ("ingested", "duplicates", "unchanged", "failed")}
+
+    # -------------------- BACKGROUND LOOP --------------------
+    async def _run(self):
+        os.makedirs(self.folder, exist_ok=True)
+        watcher = None
+        try:
+            watcher = InotifyWatcher(self.folder)
+            self.mode = "inotify"
+        except (OSError, AttributeError) as e:
+            self.mode = "polling"
+            logger.info("inotify unavailable (%s); polling %s", e, self.folder)
+
+        try:
+            await self.scan()
+            last_full = time.monotonic()
+            while not self._stop.is_set():
+                if watcher:
+                    names = await asyncio.to_thread(watcher.read, 1.0)
+                    if watcher.overflowed:
+                        watcher.overflowed = False
+                        last_full = 0
+                    elif names:
+                        await self.scan([os.path.join(self.folder, n) for n in set(names)])
+                    full_every = settings.INDEXER_RESCAN_SECONDS
+                else:
+                    try:
+                        await asyncio.wait_for(self._stop.wait(), timeout=settings.INDEXER_POLL_SECONDS)
+                    except asyncio.TimeoutError:
+                        pass
+                    full_every = settings.INDEXER_POLL_SECONDS
+                if not self._stop.is_set() and time.monotonic() - last_full >= full_every:
+                    await self.scan()
+                    last_full = time.monotonic()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("❌ Folder indexer stopped: %s", e)
+        finally:
+            if watcher:
+                watcher.close()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info("📂 Folder indexer watching %s", self.folder)
+
+    async def stop(self):
+        if not self.running:
+            return
+        self._stop.set()
+        try:
+            await asyncio.wait_for(self._task, timeout=5)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+        self._task = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def status(self) -> dict:
+        return {
+            "folder": self.folder,
+            "running": self.running,
+            "mode": self.mode,
+            "tracked_files": len(self.checkpoint),
+            "failed_files": sorted(name for name, entry in self.checkpoint.items() if entry.get("failed")),
+            **self.stats,
+        }
+
+
+_indexer = None
+
+
+def get_folder_indexer() -> FolderIndexer:
+    global _indexer
+    if _indexer is None:
+        _indexer = FolderIndexer(settings.RESUME_FOLDER, settings.INDEXER_CHECKPOINT_PATH)
+    return _indexer
@@ -0,0 +1,106 @@
+import json
+import re
+
+_FENCE = re.compile(r"```(?:json|JSON)?\s*(.*?)(?:```|$)", re.DOTALL)
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+_SMART_QUOTES = str.maketrans({"“": '"', "”": '"', "‘": "'", "’": "'"})
+
+
+def extract_json(text: str):
+    """
+    Best-effort recovery of a JSON object/array from an LLM reply.
+
+    Tries, cheapest first:
+      1. the whole reply as JSON (the common case with JSON mode on)
+      2. the contents of a ``` fence
+      3. the first balanced {...} / [...] span in surrounding prose
+      4. the same span with trailing commas / smart quotes fixed and, when the
+         reply was cut off, open strings and brackets closed
+    Returns the decoded value, or None when nothing usable is found.
+    """
+    if not text:
+        return None
+    text = text.strip()
+
+    if text[:1] in "{[":
+        try:
+            return json.loads(text)
+        except ValueError:
+            pass
+
+    fenced = _FENCE.search(text)
+    if fenced:
+        text = fenced.group(1).strip()
+        try:
+            return json.loads(text)
+        except ValueError:
+            pass
+
+    start = _first_container(text)
+    if start < 0:
+        return None
+    span, open_stack, in_string = _scan(text, start)
+    try:
+        return json.loads(span)
+    except ValueError:
+        pass
+
+    repaired = _repair(span, open_stack, in_string)
+    try:
+        return json.loads(repaired)
+    except ValueError:
+        return None
+
+
+def _first_container(text: str) -> int:
+    positions = [p for p in (text.find("{"), text.find("[")) if p >= 0]
+    return min(positions) if positions else -1
+
+
+def _scan(text: str, start: int):
+    """
+    Walks from `start` to the bracket that closes it, string/escape aware.
+    Returns (span, still-open brackets, ended inside a string).
+    """
+    stack = []
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append(ch)
+        elif ch in "}]":
+            if stack:
+                stack.pop()
+            if not stack:
+                return text[start:i + 1], [], False
+    return text[start:], stack, in_string
+
+
+def _repair(span: str, open_stack: list, in_string: bool) -> str:
+    """
+    Fixes common slips and closes a truncated reply so it parses.
+    Anything after the last complete value is dropped.
+    """
+    span = span.translate(_SMART_QUOTES)
+    if in_string:
+        span += '"'
+    if open_stack:
+        span = span.rstrip()
+        if open_stack[-1] == "{":
+            # Drop a dangling `"key":` / `"key"` left by the cut-off
+            span = re.sub(r'(,|(?<=\{))\s*"[^"]*"\s*:?\s*$', "", span)
+            span = re.sub(r':\s*$', ": null", span)
+        span = re.sub(r",\s*$", "", span)
+        span += "".join("}" if ch == "{" else "]" for ch in reversed(open_stack))
+    return _TRAILING_COMMA.sub(r"\1", span)
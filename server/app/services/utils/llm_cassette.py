@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime
+
+from app.services.utils.log import logger
+
+
+class CassetteResponse:
+    """
+    Replayed LLM response exposing the same attributes as langchain's AIMessage.
+    """
+
+    def __init__(self, content: str, usage_metadata: dict = None):
+        self.content = content
+        self.usage_metadata = usage_metadata or {}
+
+
+def prompt_hash(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def prompt_family(prompt: str) -> str:
+    """
+    Identifies the prompt template (resume parse, match, job, email...) from its
+    opening instructions, so replay can fall back to a response of the same shape.
+    """
+    head = re.sub(r"\s+", " ", prompt).strip()[:120]
+    return hashlib.sha1(head.encode("utf-8")).hexdigest()[:12]
+
+
+class LLMCassette:
+    """
+    Record/replay wrapper around the shared LLM client.
+
+    - record: calls the wrapped client and appends prompt hash, prompt family,
+      response text, token usage and observed latency to a JSONL cassette.
+    - replay: serves responses from the cassette without network, sleeping for the
+      recorded latency (times `latency_scale`) to reproduce the latency profile.
+
+    Replay misses are handled by `miss_policy`:
+    - "family": serve a recorded response (and latency) of the same prompt template,
+      calling the wrapped client only for templates never recorded
+    - "passthrough": call the wrapped client
+    - "error": raise LookupError
+
+    Only prompt hashes are stored, never prompt text; responses are stored verbatim.
+    """
+
+    def __init__(
+        self,
+        inner,
+        path: str,
+        mode: str = "replay",
+        miss_policy: str = "family",
+        latency_scale: float = 1.0,
+        seed: int = 0,
+    ):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unsupported cassette mode: {mode}")
+        self.inner = inner
+        self.path = path
+        self.mode = mode
+        self.miss_policy = miss_policy
+        self.latency_scale = latency_scale
+        self.hits = 0
+        self.misses = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._by_hash = {}
+        self._by_family = {}
+        self._cursor = {}
+        self._load()
+
+    # -------------------- STORAGE --------------------
+    def _load(self):
+        if not os.path.exists(self.path):
+            if self.mode == "replay":
+                logger.warning("⚠️ LLM cassette not found, replay will miss: %s", self.path)
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    self._index(json.loads(line))
+        logger.info("📼 Loaded %d LLM cassette entries from %s", len(self._by_hash), self.path)
+
+    def _index(self, entry: dict):
+        self._by_hash.setdefault(entry["prompt_hash"], []).append(entry)
+        self._by_family.setdefault(entry["family"], []).append(entry)
+
+    def _append(self, entry: dict):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+            self._index(entry)
+
+    # -------------------- LANGCHAIN-COMPATIBLE API --------------------
+    def invoke(self, prompt, **kwargs):
+        prompt = prompt if isinstance(prompt, str) else str(prompt)
+        if self.mode == "record":
+            return self._record(prompt, **kwargs)
+        return self._replay(prompt, **kwargs)
+
+    def _record(self, prompt: str, **kwargs):
+        start = time.perf_counter()
+        response = self.inner.invoke(prompt, **kwargs)
+        latency_ms = (time.perf_counter() - start) * 1000
+        self._append({
+            "prompt_hash": prompt_hash(prompt),
+            "family": prompt_family(prompt),
+            "prompt_chars": len(prompt),
+            "content": response.content,
+            "usage_metadata": dict(getattr(response, "usage_metadata", None) or {}),
+            "latency_ms": round(latency_ms, 2),
+            "recorded_at": datetime.utcnow().isoformat(),
+        })
+        return response
+
+    def _replay(self, prompt: str, **kwargs):
+        key = prompt_hash(prompt)
+        with self._lock:
+            entries = self._by_hash.get(key)
+            if entries:
+                self.hits += 1
+                # Cycle through repeated recordings of the same prompt
+                index = self._cursor.get(key, 0)
+                self._cursor[key] = index + 1
+                entry = entries[index % len(entries)]
+            else:
+                self.misses += 1
+                entry = None
+                if self.miss_policy == "family":
+                    family = self._by_family.get(prompt_family(prompt))
+                    entry = self._rng.choice(family) if family else None
+
+        if entry is None:
+            if self.miss_policy in ("passthrough", "family") and self.inner is not None:
+                return self.inner.invoke(prompt, **kwargs)
+            raise LookupError(f"No cassette entry for prompt {key[:12]} in {self.path}")
+
+        time.sleep(entry["latency_ms"] * self.latency_scale / 1000)
+        return CassetteResponse(entry["content"], entry.get("usage_metadata"))
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "path": self.path,
+            "entries": sum(len(v) for v in self._by_hash.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
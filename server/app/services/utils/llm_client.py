@@ -0,0 +1,241 @@
+import time
+
+from pydantic import ValidationError
+
+from app.config.config import settings
+from app.schemas.llm_output_schema import response_schema_for
+from app.services.utils.json_extractor import extract_json
+from app.services.utils.llm_cassette import LLMCassette
+from app.services.utils.llm_metrics import llm_metrics
+from app.services.utils.llm_resilience import (
+    CircuitBreaker,
+    LLMUnavailableError,
+    backoff_delay,
+    call_with_deadline,
+    is_retryable,
+)
+from app.services.utils.log import logger
+from app.services.utils.request_profiler import record_span
+
+_cassette = None
+
+
+def get_llm():
+    """
+    Returns the client used for every LLM call: the shared settings.llm, wrapped
+    in a record/replay cassette when LLM_CASSETTE_MODE is "record" or "replay".
+    """
+    global _cassette
+    if settings.LLM_CASSETTE_MODE not in ("record", "replay"):
+        return settings.llm
+
+    if (
+        _cassette is None
+        or _cassette.inner is not settings.llm
+        or _cassette.mode != settings.LLM_CASSETTE_MODE
+        or _cassette.path != settings.LLM_CASSETTE_PATH
+    ):
+        _cassette = LLMCassette(
+            inner=settings.llm,
+            path=settings.LLM_CASSETTE_PATH,
+            mode=settings.LLM_CASSETTE_MODE,
+            miss_policy=settings.LLM_CASSETTE_MISS_POLICY,
+            latency_scale=settings.LLM_CASSETTE_LATENCY_SCALE,
+        )
+    return _cassette
+
+
+# -------------------- TOKEN COUNTING --------------------
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token estimate (~4 characters per token) used when the provider
+    does not report usage.
+    """
+    return max(1, len(text or "") // 4)
+
+
+def _usage_from_response(response, prompt: str, text: str):
+    """
+    Returns (prompt_tokens, completion_tokens, estimated) for an LLM response.
+    """
+    usage = getattr(response, "usage_metadata", None) or {}
+    prompt_tokens = usage.get("input_tokens")
+    completion_tokens = usage.get("output_tokens")
+    if prompt_tokens is None or completion_tokens is None:
+        return estimate_tokens(prompt), estimate_tokens(text), True
+    return prompt_tokens, completion_tokens, False
+
+
+# -------------------- LLM INVOCATION --------------------
+
+_breaker = CircuitBreaker(settings.LLM_CIRCUIT_FAILURE_THRESHOLD, settings.LLM_CIRCUIT_RESET_SECONDS)
+
+
+def circuit_state() -> dict:
+    return _breaker.snapshot()
+
+
+def _hedge_after(call_site: str) -> float:
+    """
+    Hedge delay for latency-sensitive call sites, 0 (no hedging) for the rest.
+    """
+    sites = {site.strip() for site in settings.LLM_HEDGE_CALL_SITES.split(",")}
+    return settings.LLM_HEDGE_AFTER_SECONDS if call_site in sites else 0
+
+
+def _invoke(prompt: str, call_site: str, **invoke_kwargs):
+    """
+    Calls the shared LLM client and returns (text, usage, latency_ms, retries, hedged)
+    without recording the successful call.
+
+    Each attempt is bounded by LLM_TIMEOUT_SECONDS and all attempts together
+    by LLM_DEADLINE_SECONDS. Rate limits, 5xx and timeouts are retried with
+    jittered exponential backoff up to LLM_MAX_RETRIES times. While the
+    circuit breaker is open, calls fail fast with LLMUnavailableError.
+    Failed attempts are recorded here since no response is returned.
+    """
+    llm = get_llm()
+    hedge_after = _hedge_after(call_site)
+    deadline = time.monotonic() + settings.LLM_DEADLINE_SECONDS
+
+    for attempt in range(settings.LLM_MAX_RETRIES + 1):
+        if not _breaker.allow():
+            raise LLMUnavailableError(f"LLM provider unavailable (circuit open), {call_site} not attempted")
+
+        start = time.perf_counter()
+        try:
+            response, hedged = call_with_deadline(
+                lambda: llm.invoke(prompt, **invoke_kwargs),
+                timeout=min(settings.LLM_TIMEOUT_SECONDS, deadline - time.monotonic()),
+                hedge_after=hedge_after,
+            )
+        except Exception as e:
+            latency_ms = (time.perf_counter() - start) * 1000
+            record_span("llm", call_site, latency_ms)
+            llm_metrics.record_call(
+                call_site=call_site,
+                prompt_tokens=estimate_tokens(prompt),
+                completion_tokens=0,
+                latency_ms=latency_ms,
+                success=False,
+                tokens_estimated=True,
+            )
+            retryable = is_retryable(e)
+            # Only provider-side failures count against the circuit; other
+            # errors neither reset it nor close a half-open breaker
+            if retryable:
+                _breaker.record_failure()
+            else:
+                _breaker.release_trial()
+
+            delay = backoff_delay(attempt)
+            if (
+                not retryable
+                or attempt == settings.LLM_MAX_RETRIES
+                or time.monotonic() + delay >= deadline
+                or _breaker.state == "open"
+            ):
+                raise
+            logger.warning("LLM call %s failed (%s); retry %s in %.2fs", call_site, e, attempt + 1, delay)
+            time.sleep(delay)
+            continue
+
+        _breaker.record_success()
+        latency_ms = (time.perf_counter() - start) * 1000
+        record_span("llm", call_site, latency_ms)
+        text = response.content.strip()
+        return text, _usage_from_response(response, prompt, text), latency_ms, attempt, hedged
+
+
+def invoke_llm(prompt: str, call_site: str) -> str:
+    """
+    Invokes the shared LLM and records latency and token usage for the call.
+    Returns the stripped text content.
+    """
+    text, (prompt_tokens, completion_tokens, estimated), latency_ms, retries, hedged = _invoke(prompt, call_site)
+    llm_metrics.record_call(
+        call_site=call_site,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        latency_ms=latency_ms,
+        retry_count=retries,
+        hedged=hedged,
+        tokens_estimated=estimated,
+    )
+    return text
+
+
+def _structured_output_kwargs(schema) -> dict:
+    """
+    Gemini JSON-mode arguments for `invoke`, empty when disabled.
+    """
+    if not settings.LLM_STRUCTURED_OUTPUT:
+        return {}
+    kwargs = {"response_mime_type": "application/json"}
+    if schema is not None:
+        kwargs["response_schema"] = response_schema_for(schema)
+    return kwargs
+
+
+def _validate(data, schema):
+    """
+    Returns (validated dict, None) or (None, error message for the re-ask).
+    """
+    if data is None:
+        return None, "the reply was not valid JSON"
+    if schema is None:
+        return (data, None) if isinstance(data, dict) else (None, "expected a JSON object")
+    try:
+        return schema.model_validate(data).model_dump(), None
+    except ValidationError as e:
+        problems = "; ".join(
+            f"{'.'.join(str(p) for p in err['loc']) or 'root'}: {err['msg']}" for err in e.errors()[:5]
+        )
+        return None, f"the JSON did not match the required structure ({problems})"
+
+
+def invoke_llm_json(prompt: str, call_site: str, schema=None) -> dict:
+    """
+    Invokes the shared LLM expecting a JSON object.
+
+    With `schema` (an LLMOutput model) the reply is requested in JSON mode
+    constrained to that schema and validated against it; the returned dict is
+    the normalized model dump. Unusable replies are re-asked up to
+    LLM_MAX_REASKS times with the validation error appended to the prompt.
+    If every attempt fails, the last salvaged JSON object is returned as is,
+    or {"raw_response": text} when none could be extracted.
+    """
+    invoke_kwargs = _structured_output_kwargs(schema)
+    attempt_prompt = prompt
+    salvaged = None
+
+    for attempt in range(settings.LLM_MAX_REASKS + 1):
+        text, (prompt_tokens, completion_tokens, estimated), latency_ms, retries, hedged = _invoke(
+            attempt_prompt, call_site, **invoke_kwargs
+        )
+        data = extract_json(text)
+        result, error = _validate(data, schema)
+
+        llm_metrics.record_call(
+            call_site=call_site,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            latency_ms=latency_ms,
+            retry_count=retries + (1 if attempt else 0),
+            hedged=hedged,
+            parse_success=error is None,
+            tokens_estimated=estimated,
+        )
+        if error is None:
+            return result
+
+        logger.warning("LLM output rejected for %s (attempt %s): %s", call_site, attempt + 1, error)
+        if isinstance(data, dict):
+            salvaged = data
+        attempt_prompt = (
+            f"{prompt}\n\nYour previous reply could not be used: {error}. "
+            "Reply again with ONLY the JSON object in the requested format."
+        )
+
+    return salvaged if salvaged is not None else {"raw_response": text}
@@ -0,0 +1,240 @@
+import json
+import logging
+import threading
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+
+from app.config.config import settings
+from app.services.utils.log import logger
+
+
+# -------------------- REQUEST CONTEXT --------------------
+# Endpoint and job are attached to every LLM call made while they are set.
+_llm_endpoint: ContextVar = ContextVar("llm_endpoint", default=None)
+_llm_job_id: ContextVar = ContextVar("llm_job_id", default=None)
+_llm_request_scope: ContextVar = ContextVar("llm_request_scope", default=None)
+
+
+def set_llm_endpoint(endpoint: str):
+    """
+    Marks `endpoint` as the endpoint for subsequent LLM calls.
+    """
+    _llm_endpoint.set(endpoint)
+
+
+def set_llm_request(scope: dict):
+    """
+    Attaches the current request's ASGI scope; LLM calls are accounted under
+    its route template ("POST /api/v1/ai/details/{job_id}"), resolved once the
+    router has matched it, so object ids never become separate endpoints.
+    Called by the auth middleware for every request.
+    """
+    _llm_request_scope.set(scope)
+
+
+def _current_endpoint() -> str:
+    endpoint = _llm_endpoint.get()
+    if endpoint:
+        return endpoint
+    scope = _llm_request_scope.get()
+    if not scope:
+        return "unscoped"
+    if scope.get("route") is None:
+        return f"{scope.get('method', '')} unrouted"
+    # Path segments holding a path parameter go back to "{name}" (the matched
+    # route's own path lacks the prefixes of the routers it was included in)
+    params = {str(value): name for name, value in (scope.get("path_params") or {}).items()}
+    template = "/".join(
+        f"{{{params[segment]}}}" if segment in params else segment
+        for segment in scope.get("path", "").split("/")
+    )
+    return f"{scope.get('method', '')} {template}"
+
+
+@contextmanager
+def llm_context(endpoint: str = None, job_id: str = None):
+    """
+    Scopes LLM calls to an endpoint and/or job id for accounting.
+    """
+    endpoint_token = _llm_endpoint.set(endpoint) if endpoint is not None else None
+    job_token = _llm_job_id.set(str(job_id)) if job_id is not None else None
+    try:
+        yield
+    finally:
+        if job_token is not None:
+            _llm_job_id.reset(job_token)
+        if endpoint_token is not None:
+            _llm_endpoint.reset(endpoint_token)
+
+
+# -------------------- AGGREGATION --------------------
+
+def _empty_bucket() -> dict:
+    return {
+        "calls": 0,
+        "errors": 0,
+        "parse_failures": 0,
+        "retries": 0,
+        "hedged": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "latency_ms_total": 0.0,
+        "latency_ms_max": 0.0,
+        "cost_usd": 0.0,
+    }
+
+
+def _add_to_bucket(bucket: dict, record: dict):
+    bucket["calls"] += 1
+    bucket["errors"] += 0 if record["success"] else 1
+    bucket["parse_failures"] += 1 if record["parse_success"] is False else 0
+    bucket["retries"] += record["retry_count"]
+    bucket["hedged"] += 1 if record["hedged"] else 0
+    bucket["prompt_tokens"] += record["prompt_tokens"]
+    bucket["completion_tokens"] += record["completion_tokens"]
+    bucket["latency_ms_total"] += record["latency_ms"]
+    bucket["latency_ms_max"] = max(bucket["latency_ms_max"], record["latency_ms"])
+    bucket["cost_usd"] += record["cost_usd"]
+
+
+def _summarize_bucket(bucket: dict) -> dict:
+    summary = dict(bucket)
+    calls = bucket["calls"] or 1
+    summary["latency_ms_avg"] = round(bucket["latency_ms_total"] / calls, 2)
+    summary["latency_ms_total"] = round(bucket["latency_ms_total"], 2)
+    summary["latency_ms_max"] = round(bucket["latency_ms_max"], 2)
+    summary["cost_usd"] = round(bucket["cost_usd"], 6)
+    return summary
+
+
+class LLMMetrics:
+    """
+    Thread-safe, in-process accounting of LLM calls.
+    Aggregates per call site, per endpoint and per job.
+    """
+
+    def __init__(self, recent_limit: int = 200):
+        self._lock = threading.Lock()
+        self._recent = deque(maxlen=recent_limit)
+        self._started_at = datetime.utcnow()
+        self._totals = _empty_bucket()
+        self._by_call_site = {}
+        self._by_endpoint = {}
+        self._by_job = OrderedDict()
+        self._prompt_savings = {}
+        self._caches = {}
+
+    @staticmethod
+    def estimate_cost(prompt_tokens: int, completion_tokens: int) -> float:
+        return (
+            prompt_tokens * settings.LLM_INPUT_COST_PER_1M
+            + completion_tokens * settings.LLM_OUTPUT_COST_PER_1M
+        ) / 1_000_000
+
+    def record_call(
+        self,
+        call_site: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        latency_ms: float,
+        retry_count: int = 0,
+        hedged: bool = False,
+        success: bool = True,
+        parse_success: bool = None,
+        tokens_estimated: bool = False,
+    ) -> dict:
+        """
+        Records a single LLM call and emits a structured log line for it.
+        """
+        record = {
+            "call_site": call_site,
+            "endpoint": _current_endpoint(),
+            "job_id": _llm_job_id.get(),
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "tokens_estimated": tokens_estimated,
+            "latency_ms": round(latency_ms, 2),
+            "retry_count": retry_count,
+            "hedged": hedged,
+            "success": success,
+            "parse_success": parse_success,
+            "cost_usd": self.estimate_cost(prompt_tokens, completion_tokens),
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+        with self._lock:
+            _add_to_bucket(self._totals, record)
+            _add_to_bucket(self._by_call_site.setdefault(call_site, _empty_bucket()), record)
+            _add_to_bucket(self._by_endpoint.setdefault(record["endpoint"], _empty_bucket()), record)
+            if record["job_id"]:
+                # Least recently used jobs are evicted past LLM_METRICS_MAX_JOBS
+                bucket = self._by_job.pop(record["job_id"], None) or _empty_bucket()
+                _add_to_bucket(bucket, record)
+                self._by_job[record["job_id"]] = bucket
+                while len(self._by_job) > settings.LLM_METRICS_MAX_JOBS:
+                    self._by_job.popitem(last=False)
+            self._recent.append(record)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("llm_call %s", json.dumps(record))
+        return record
+
+    def record_prompt_savings(self, call_site: str, tokens_before: int, tokens_after: int):
+        """
+        Records how many prompt tokens the prompt builder saved for one call.
+        """
+        with self._lock:
+            savings = self._prompt_savings.setdefault(
+                call_site, {"calls": 0, "tokens_before": 0, "tokens_after": 0, "tokens_saved": 0}
+            )
+            savings["calls"] += 1
+            savings["tokens_before"] += tokens_before
+            savings["tokens_after"] += tokens_after
+            savings["tokens_saved"] += tokens_before - tokens_after
+        logger.debug("prompt_savings %s: %s -> %s tokens", call_site, tokens_before, tokens_after)
+
+    def record_cache_lookup(self, cache: str, hit: bool):
+        """
+        Counts a hit or miss for a cache that saves LLM calls (e.g. "match").
+        """
+        with self._lock:
+            counts = self._caches.setdefault(cache, {"hits": 0, "misses": 0})
+            counts["hits" if hit else "misses"] += 1
+
+    def snapshot(self, include_recent: bool = False) -> dict:
+        """
+        Returns aggregated statistics suitable for the admin stats endpoint.
+        """
+        with self._lock:
+            data = {
+                "since": self._started_at.isoformat(),
+                "totals": _summarize_bucket(self._totals),
+                "by_call_site": {k: _summarize_bucket(v) for k, v in self._by_call_site.items()},
+                "by_endpoint": {k: _summarize_bucket(v) for k, v in self._by_endpoint.items()},
+                "by_job": {k: _summarize_bucket(v) for k, v in self._by_job.items()},
+                "prompt_savings": {k: dict(v) for k, v in self._prompt_savings.items()},
+                "caches": {
+                    k: {**v, "hit_rate": round(v["hits"] / ((v["hits"] + v["misses"]) or 1), 4)}
+                    for k, v in self._caches.items()
+                },
+            }
+            if include_recent:
+                data["recent_calls"] = list(self._recent)
+        return data
+
+    def reset(self):
+        with self._lock:
+            self._recent.clear()
+            self._started_at = datetime.utcnow()
+            self._totals = _empty_bucket()
+            self._by_call_site = {}
+            self._by_endpoint = {}
+            self._by_job = OrderedDict()
+            self._prompt_savings = {}
+            self._caches = {}
+
+
+# Global instance
+llm_metrics = LLMMetrics(recent_limit=settings.LLM_RECENT_CALLS_KEPT)
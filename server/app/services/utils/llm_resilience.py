@@ -0,0 +1,188 @@
+import random
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from app.config.config import settings
+from app.services.utils.log import logger
+
+
+class LLMTimeoutError(TimeoutError):
+    """An LLM call did not answer within its deadline."""
+
+
+class LLMUnavailableError(RuntimeError):
+    """The circuit breaker is open: the provider is failing, calls fail fast."""
+
+
+# -------------------- RETRY CLASSIFICATION --------------------
+
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+RETRYABLE_ERROR_NAMES = {
+    "ResourceExhausted",
+    "TooManyRequests",
+    "ServiceUnavailable",
+    "InternalServerError",
+    "DeadlineExceeded",
+    "GatewayTimeout",
+    "ServerError",
+}
+_STATUS_IN_MESSAGE = re.compile(r"\b(408|429|500|502|503|504)\b|RESOURCE_EXHAUSTED|UNAVAILABLE|DEADLINE_EXCEEDED")
+
+
+def is_retryable(exc: Exception) -> bool:
+    """
+    True for rate limits, provider 5xx, timeouts and connection errors.
+    Works across google-api-core, google-genai and langchain wrappers by
+    looking at the status code, the exception class chain and the message.
+    """
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    for attr in ("code", "status_code"):
+        code = getattr(exc, attr, None)
+        code = code() if callable(code) else code
+        if isinstance(code, int) and code in RETRYABLE_STATUS_CODES:
+            return True
+    if any(cls.__name__ in RETRYABLE_ERROR_NAMES for cls in type(exc).__mro__):
+        return True
+    cause = exc.__cause__ or exc.__context__
+    if cause is not None and cause is not exc and is_retryable(cause):
+        return True
+    return bool(_STATUS_IN_MESSAGE.search(str(exc)))
+
+
+def backoff_delay(attempt: int) -> float:
+    """
+    Exponential backoff with full jitter: uniform(0, min(max, base * 2^attempt)).
+    """
+    ceiling = min(settings.LLM_BACKOFF_MAX_SECONDS, settings.LLM_BACKOFF_BASE_SECONDS * (2 ** attempt))
+    return random.uniform(0, ceiling)
+
+
+# -------------------- CIRCUIT BREAKER --------------------
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failed calls and rejects calls
+    for `reset_seconds`; then lets a single trial call through (half-open).
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def release_trial(self):
+        """
+        For calls that say nothing about provider health (e.g. a 4xx or a bad
+        prompt): frees the half-open trial slot, counts neither way.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                if self._opened_at is None or self._trial_in_flight:
+                    logger.warning("LLM circuit opened after %s consecutive failures", self._failures)
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"state": self._state(), "consecutive_failures": self._failures}
+
+
+# -------------------- DEADLINES AND HEDGING --------------------
+
+# LLM calls run on this pool so the caller can stop waiting at the deadline.
+# A call that times out keeps its worker until the provider answers; the pool
+# size bounds how many such calls can pile up.
+_executor = ThreadPoolExecutor(max_workers=settings.LLM_MAX_CONCURRENCY, thread_name_prefix="llm")
+_in_flight = 0
+_in_flight_lock = threading.Lock()
+
+
+def _submit(fn):
+    global _in_flight
+    with _in_flight_lock:
+        _in_flight += 1
+    future = _executor.submit(fn)
+    future.add_done_callback(_release)
+    return future
+
+
+def _release(_future):
+    global _in_flight
+    with _in_flight_lock:
+        _in_flight -= 1
+
+
+def call_with_deadline(fn, timeout: float, hedge_after: float = 0):
+    """
+    Runs `fn()` on the LLM pool and returns (result, hedged) within `timeout` seconds.
+
+    With `hedge_after` > 0, a second identical call is started if the first
+    has not answered after that many seconds; the first answer wins. A hedge
+    is only fired while the pool has a free worker for it.
+    """
+    deadline = time.monotonic() + timeout
+    pending = {_submit(fn)}
+    hedged = False
+    # Checked once: a full pool skips the hedge without counting one
+    hedge_tried = False
+    first_error = None
+
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise LLMTimeoutError(f"LLM call exceeded its {timeout:.1f}s deadline")
+        wait_for = min(remaining, hedge_after) if hedge_after > 0 and not hedge_tried else remaining
+        done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            if future.exception() is None:
+                return future.result(), hedged
+            first_error = first_error or future.exception()
+
+        if not done and hedge_after > 0 and not hedge_tried:
+            hedge_tried = True
+            if _in_flight < settings.LLM_MAX_CONCURRENCY:
+                logger.debug("Hedging slow LLM call after %.1fs", hedge_after)
+                pending.add(_submit(fn))
+                hedged = True
+
+    raise first_error
@@ -1,10 +1,32 @@
+import atexit
+import copy
 import logging
+import os
+import queue
+import threading
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 
 import pytz
 
 IST = pytz.timezone("Asia/Kolkata")
 
+# -------------------- LOGGING CONFIG (env driven) --------------------
+# LOG_LEVEL: minimum level emitted (DEBUG / INFO / WARNING / ERROR)
+# LOG_SAMPLE_RATE_<LEVEL>: fraction of messages kept per message template, e.g.
+#   LOG_SAMPLE_RATE_DEBUG=0.01 keeps 1 in 100 of each distinct debug message
+# LOG_QUEUE_SIZE: records buffered for the writer thread before new ones are dropped
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", 10000))
+LOG_SAMPLE_RATES = {
+    level: float(os.getenv(f"LOG_SAMPLE_RATE_{name}", 1.0))
+    for level, name in (
+        (logging.DEBUG, "DEBUG"),
+        (logging.INFO, "INFO"),
+        (logging.WARNING, "WARNING"),
+    )
+}
+
 
 class ISTFormatter(logging.Formatter):
     def formatTime(self, record, datefmt=None):
@@ -14,20 +36,82 @@ class ISTFormatter(logging.Formatter):
         return dt.isoformat()
 
 
+class SamplingFilter(logging.Filter):
+    """
+    Keeps 1 in N records per (level, message template), N = 1 / sample rate.
+    Errors are never sampled. Runs before the record is queued, so dropped
+    messages are never formatted or written.
+    """
+
+    def __init__(self, rates: dict):
+        super().__init__()
+        self.every = {level: max(1, round(1 / rate)) for level, rate in rates.items() if 0 < rate < 1}
+        self.drop_all = {level for level, rate in rates.items() if rate <= 0}
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno in self.drop_all:
+            return False
+        every = self.every.get(record.levelno)
+        if every is None:
+            return True
+        key = (record.levelno, record.msg)
+        with self._lock:
+            count = self._counts.get(key, 0)
+            self._counts[key] = count + 1
+        return count % every == 0
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Hands records to the writer thread; the formatter (timestamps, layout) runs there,
+    not on the request path.
+    Drops records (and counts them) instead of blocking when the queue is full.
+    """
+
+    dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge msg % args now: mutable args (dicts, Mongo documents) may change
+        # before the writer thread gets to them. Tracebacks are rendered now too,
+        # before the frames go away. Only the final layout runs on the writer.
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        message = record.getMessage()
+        record = copy.copy(record)
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            NonBlockingQueueHandler.dropped += 1
+
+
 logger = logging.getLogger("Master")
-logger.setLevel(logging.DEBUG)
+logger.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
 
 logger.propagate = False
 logger.handlers.clear()
-
-handler = logging.StreamHandler()
-handler.setLevel(logging.DEBUG)
+logger.filters.clear()
 
 formatter = ISTFormatter(
     "%(asctime)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
 )
 
-handler.setFormatter(formatter)
+# Background writer: the StreamHandler runs on the listener thread only
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(formatter)
+
+log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+handler = NonBlockingQueueHandler(log_queue)
+listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+listener.start()
+atexit.register(listener.stop)
 
-if not logger.hasHandlers():
-    logger.addHandler(handler)
+logger.addFilter(SamplingFilter(LOG_SAMPLE_RATES))
+logger.addHandler(handler)
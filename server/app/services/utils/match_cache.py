@@ -0,0 +1,96 @@
+import asyncio
+import hashlib
+
+from app.config.config import settings
+from app.repository.match_cache_repository import MatchCacheRepository
+from app.services.agent.resume_parser_agent import MATCH_PROMPT_VERSION, check_match
+from app.services.utils.llm_metrics import llm_metrics
+from app.services.utils.prompt_builder import normalize_text
+
+# Cache entries for requirements uploaded ad hoc (/ai/candidates/find) have no job
+ADHOC_JOB = "adhoc"
+
+
+def content_hash(text: str) -> str:
+    """
+    SHA-256 of the normalized text, so whitespace/header noise does not change the key.
+    """
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+# Prompt variants that produce match verdicts; each is cached separately
+SEPARATE = "separate"
+COMBINED = "combined"
+
+
+def match_cache_key(
+    resume_key: str, resume_text: str, requirement_text: str, job_id: str = None, variant: str = SEPARATE
+):
+    """
+    `resume_key` identifies the resume file (its content hash, or the resume id
+    for records stored without one); the text alone does not, as every resume
+    without extractable text (image-only PDFs, legacy docs) reads as "".
+    Such resumes are never cached: returns None, which lookups and saves skip.
+
+    `variant` is the prompt that scored the match (check_match or the combined
+    parse+match prompt); their verdicts are not interchangeable.
+    """
+    if not resume_key or not (resume_text or "").strip():
+        return None
+    return (
+        str(resume_key),
+        str(job_id) if job_id else ADHOC_JOB,
+        content_hash(requirement_text),
+        f"{MATCH_PROMPT_VERSION}:{variant}:{settings.GEMINI_MODEL}",
+    )
+
+
+def resume_cache_key(resume: dict) -> str:
+    """
+    Cache identity of a stored resume record (see match_cache_key).
+    """
+    return resume.get("content_hash") or str(resume["_id"])
+
+
+def is_cacheable(match_result: dict) -> bool:
+    """
+    Only well-formed verdicts are cached; salvaged/raw replies are retried next time.
+    """
+    return (
+        isinstance(match_result, dict)
+        and "raw_response" not in match_result
+        and match_result.get("status") in ("pass", "fail")
+    )
+
+
+async def get_cached_match(key: tuple):
+    """
+    Returns the cached match result for `key` (see match_cache_key) or None,
+    counting the lookup in the "match" cache hit rate.
+    """
+    if key is None or not settings.MATCH_CACHE_ENABLED:
+        return None
+    cached = await MatchCacheRepository.find(*key)
+    llm_metrics.record_cache_lookup("match", hit=cached is not None)
+    return cached
+
+
+async def save_match(key: tuple, match_result: dict):
+    if key is not None and settings.MATCH_CACHE_ENABLED and is_cacheable(match_result):
+        await MatchCacheRepository.save(*key, match_result)
+
+
+async def cached_check_match(
+    requirement_text: str, parsed_resume: dict, resume_key: str, resume_text: str, job_id: str = None
+) -> dict:
+    """
+    check_match, served from the match cache when the same resume file was
+    already scored against the same requirement with the current prompt version.
+    """
+    key = match_cache_key(resume_key, resume_text, requirement_text, job_id)
+    cached = await get_cached_match(key)
+    if cached is not None:
+        return cached
+    match_result = await asyncio.to_thread(check_match, requirement_text, parsed_resume)
+    await save_match(key, match_result)
+    return match_result
@@ -0,0 +1,206 @@
+import json
+import re
+
+from app.services.utils.llm_client import estimate_tokens
+from app.services.utils.llm_metrics import llm_metrics
+
+
+# -------------------- NORMALIZATION --------------------
+
+# Lines that carry no signal for parsing or matching
+BOILERPLATE_PATTERNS = [
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"^page\s*\d+(\s*(of|/)\s*\d+)?$",
+        r"^\d+\s*(/|of)\s*\d+$",
+        r"^(curriculum vitae|resume|résumé|cv)$",
+        r"^references?\s+(are\s+)?available\s+(up)?on\s+request\.?$",
+        r"^i\s+hereby\s+declare\b.*",
+        r"^declaration:?$",
+        r"^(this|the)\s+(e-?mail|document)\s+(is\s+)?confidential\b.*",
+        r"^confidential(ity)?\b.*",
+    )
+]
+
+_SPACES = re.compile(r"[ \t\u00a0\u2000-\u200b]+")
+_CONTROL = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Collapses whitespace, drops boilerplate lines and lines repeated on every page
+    (headers / footers), keeping the original line order.
+    """
+    lines = []
+    counts = {}
+    for raw in _CONTROL.sub("", text or "").splitlines():
+        line = _SPACES.sub(" ", raw).strip()
+        if not line or any(p.match(line) for p in BOILERPLATE_PATTERNS):
+            continue
+        lines.append(line)
+        counts[line] = counts.get(line, 0) + 1
+
+    seen = set()
+    kept = []
+    for line in lines:
+        # A short non-bullet line seen 3+ times is a running header/footer: keep its first copy
+        if counts[line] >= 3 and len(line) < 80 and not line.startswith(("-", "•", "*")):
+            if line in seen:
+                continue
+            seen.add(line)
+        kept.append(line)
+    return "\n".join(kept)
+
+
+def compact_json(data) -> str:
+    """
+    Minified JSON without empty values (no indentation, no null/""/[]/{} fields).
+    """
+    return json.dumps(_drop_empty(data), separators=(",", ":"), ensure_ascii=False)
+
+
+def _drop_empty(value):
+    if isinstance(value, dict):
+        cleaned = {k: _drop_empty(v) for k, v in value.items()}
+        return {k: v for k, v in cleaned.items() if v not in (None, "", [], {})}
+    if isinstance(value, list):
+        cleaned = [_drop_empty(v) for v in value]
+        return [v for v in cleaned if v not in (None, "", [], {})]
+    return value
+
+
+# -------------------- SECTION-AWARE TRUNCATION --------------------
+
+# Lower number = kept first when the budget is tight
+SECTION_PRIORITY = {
+    "header": 0,
+    "skills": 1,
+    "experience": 2,
+    "summary": 3,
+    "education": 4,
+    "projects": 5,
+    "certifications": 6,
+    "requirements": 1,
+    "responsibilities": 2,
+    "qualifications": 3,
+    "description": 2,
+    "other": 8,
+}
+
+SECTION_ALIASES = {
+    "skills": ("skills", "technical skills", "key skills", "core competencies", "technologies", "tech stack"),
+    "experience": ("experience", "work experience", "professional experience", "employment history", "work history"),
+    "summary": ("summary", "profile", "professional summary", "objective", "about me", "career objective"),
+    "education": ("education", "academic", "academics", "qualifications and education"),
+    "projects": ("projects", "personal projects", "academic projects", "key projects"),
+    "certifications": ("certifications", "certificates", "licenses", "courses", "training"),
+    "requirements": ("requirements", "must have", "what we need"),
+    "responsibilities": ("responsibilities", "what you will do", "role"),
+    "qualifications": ("qualifications",),
+    "description": ("description", "about the role", "overview"),
+}
+
+_HEADING_CLEAN = re.compile(r"[^a-z ]")
+
+
+def _section_of(line: str):
+    """
+    Returns the section name if the line looks like a heading, else None.
+    Handles "SKILLS", "Skills:" and "Skills: Python, Go" (inline content).
+    """
+    head = line.split(":", 1)[0] if ":" in line else line
+    if len(head) > 40:
+        return None
+    key = _HEADING_CLEAN.sub("", head.lower()).strip()
+    for section, aliases in SECTION_ALIASES.items():
+        if key in aliases:
+            return section
+    if line.isupper() and len(line.split()) <= 4:
+        return "other"
+    return None
+
+
+def split_sections(text: str) -> list:
+    """
+    Splits normalized text into [(section, [lines])] in document order.
+    Lines before the first heading form the "header" (name, contact details).
+    """
+    sections = [("header", [])]
+    for line in text.splitlines():
+        section = _section_of(line)
+        if section:
+            sections.append((section, [line]))
+        else:
+            sections[-1][1].append(line)
+    return [(name, lines) for name, lines in sections if lines]
+
+
+def truncate_to_budget(text: str, token_budget: int) -> str:
+    """
+    Fits text into `token_budget` tokens, dropping the least important sections first
+    and cutting the last admitted section at a line boundary. Document order is kept.
+    """
+    if estimate_tokens(text) <= token_budget:
+        return text
+
+    sections = split_sections(text)
+    order = sorted(range(len(sections)), key=lambda i: SECTION_PRIORITY.get(sections[i][0], 8))
+    kept = {}
+    remaining = token_budget
+    for i in order:
+        lines = sections[i][1]
+        cost = estimate_tokens("\n".join(lines))
+        if cost <= remaining:
+            kept[i] = lines
+            remaining -= cost
+            continue
+        partial = []
+        for line in lines:
+            line_cost = estimate_tokens(line + "\n")
+            if line_cost > remaining:
+                break
+            partial.append(line)
+            remaining -= line_cost
+        # Keep a cut section only if more than its heading fits
+        if len(partial) > 1:
+            kept[i] = partial + ["[...]"]
+        if remaining <= 0:
+            break
+
+    return "\n".join("\n".join(kept[i]) for i in sorted(kept))
+
+
+# -------------------- PROMPT CONTEXT BUILDERS --------------------
+
+def build_text_context(text: str, token_budget: int, call_site: str) -> str:
+    """
+    Normalizes and truncates free text for a prompt, recording tokens saved.
+    """
+    normalized = normalize_text(text)
+    fitted = truncate_to_budget(normalized, token_budget) if token_budget > 0 else normalized
+    llm_metrics.record_prompt_savings(call_site, estimate_tokens(text), estimate_tokens(fitted))
+    return fitted
+
+
+def build_json_context(data, token_budget: int, call_site: str) -> str:
+    """
+    Compact JSON for a prompt, recording tokens saved versus indented JSON.
+    Oversized payloads have their long string values (e.g. an unparsed
+    raw_response) shortened so the JSON stays valid.
+    """
+    original_tokens = estimate_tokens(json.dumps(data, indent=2))
+    compact = compact_json(data)
+    if token_budget > 0 and estimate_tokens(compact) > token_budget:
+        compact = compact_json(_shorten_strings(data, max_chars=token_budget * 2))
+    llm_metrics.record_prompt_savings(call_site, original_tokens, estimate_tokens(compact))
+    return compact
+
+
+def _shorten_strings(value, max_chars: int):
+    if isinstance(value, dict):
+        return {k: _shorten_strings(v, max_chars) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_shorten_strings(v, max_chars) for v in value]
+    if isinstance(value, str) and len(value) > max_chars:
+        return value[:max_chars] + " [...]"
+    return value
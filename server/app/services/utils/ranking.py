@@ -0,0 +1,61 @@
+import heapq
+import itertools
+import re
+
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+
+
+def match_score(match_result) -> float:
+    """
+    Numeric 0-100 score of a match result. Accepts ints, floats and strings
+    such as "85%"; anything unusable (including unparsed raw_response
+    fallbacks) scores 0.
+    """
+    if not isinstance(match_result, dict):
+        return 0.0
+    value = match_result.get("accuracy_score", match_result.get("accuracy"))
+    if isinstance(value, str):
+        found = _NUMBER.search(value)
+        value = found.group() if found else None
+    try:
+        return max(0.0, min(100.0, float(value)))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def is_pass(match_result) -> bool:
+    return isinstance(match_result, dict) and str(match_result.get("status", "")).lower() == "pass"
+
+
+class TopCandidates:
+    """
+    Bounded min-heap of the best `n` candidates by (accuracy score, pass).
+    Memory is O(n) however many candidates are pushed; on equal keys the
+    earlier push (better pre-ranking) wins.
+    """
+
+    def __init__(self, n: int):
+        self.n = max(1, n)
+        self.seen = 0
+        self._heap = []
+        self._order = itertools.count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, candidate: dict, match_result: dict):
+        self.seen += 1
+        entry = ((match_score(match_result), is_pass(match_result)), -next(self._order), candidate)
+        if len(self._heap) < self.n:
+            heapq.heappush(self._heap, entry)
+        elif entry > self._heap[0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def full_above(self, threshold: float) -> bool:
+        """
+        True once the heap holds `n` candidates that all score at least `threshold`.
+        """
+        return bool(threshold) and len(self._heap) == self.n and self._heap[0][0][0] >= threshold
+
+    def results(self) -> list:
+        return [candidate for _, _, candidate in sorted(self._heap, reverse=True)]
@@ -0,0 +1,166 @@
+import functools
+import inspect
+import json
+import os
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import datetime
+
+from app.config.config import settings
+from app.services.utils.log import logger
+
+# Set only while an admin-requested profile is running; None otherwise.
+_active_profile: ContextVar = ContextVar("active_profile", default=None)
+
+
+# -------------------- SPAN RECORDING --------------------
+
+class RequestProfile:
+    """
+    Await time spent in repository and LLM calls during one profiled request.
+    """
+
+    def __init__(self, method: str, path: str):
+        self.id = f"{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        self.method = method
+        self.path = path
+        self.spans = []
+
+    def add_span(self, category: str, name: str, duration_ms: float):
+        self.spans.append({"category": category, "name": name, "ms": round(duration_ms, 3)})
+
+    def summary(self, total_ms: float, artifact: str) -> dict:
+        by_name = {}
+        by_category = {}
+        for span in self.spans:
+            entry = by_name.setdefault(span["name"], {"category": span["category"], "calls": 0, "ms": 0.0})
+            entry["calls"] += 1
+            entry["ms"] = round(entry["ms"] + span["ms"], 3)
+            by_category[span["category"]] = round(by_category.get(span["category"], 0.0) + span["ms"], 3)
+        return {
+            "profile_id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "total_ms": round(total_ms, 3),
+            "await_ms_by_category": by_category,
+            "await_ms_by_call": dict(sorted(by_name.items(), key=lambda kv: kv[1]["ms"], reverse=True)),
+            "spans": self.spans,
+            "artifact": artifact,
+        }
+
+
+def record_span(category: str, name: str, duration_ms: float):
+    """
+    Adds a span to the active profile, if any. Used by synchronous call sites (LLM).
+    """
+    profile = _active_profile.get()
+    if profile is not None:
+        profile.add_span(category, name, duration_ms)
+
+
+def profiled(category: str):
+    """
+    Class decorator: times every async static method while a request profile is active.
+    When profiling is off the wrapper only performs a ContextVar lookup.
+    """
+
+    def decorate(cls):
+        for attr, value in list(vars(cls).items()):
+            if isinstance(value, staticmethod) and inspect.iscoroutinefunction(value.__func__):
+                setattr(cls, attr, staticmethod(_timed(value.__func__, f"{cls.__name__}.{attr}", category)))
+        return cls
+
+    return decorate
+
+
+def _timed(func, name: str, category: str):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        profile = _active_profile.get()
+        if profile is None:
+            return await func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            profile.add_span(category, name, (time.perf_counter() - start) * 1000)
+
+    return wrapper
+
+
+# -------------------- REQUEST PROFILING --------------------
+
+def wants_profile(request) -> bool:
+    """
+    Profiling is requested with the `X-Profile: 1` header or `?profile=1`.
+    """
+    flag = request.headers.get("x-profile") or request.query_params.get("profile")
+    return str(flag).lower() in ("1", "true", "yes")
+
+
+async def profile_request(request, handler):
+    """
+    Runs `handler()` under the pyinstrument sampling profiler, stores the flame
+    graph plus a JSON span summary in PROFILE_FOLDER, and tags the response
+    with the profile id.
+    """
+    os.makedirs(settings.PROFILE_FOLDER, exist_ok=True)
+    profile = RequestProfile(request.method, request.url.path)
+    token = _active_profile.set(profile)
+
+    # Low-overhead statistical sampling; async_mode follows only this request's
+    # await chain, not every coroutine running on the loop.
+    try:
+        from pyinstrument import Profiler
+        sampler = Profiler(interval=0.001, async_mode="enabled")
+        sampler.start()
+    except ImportError:
+        logger.warning("⚠️ pyinstrument is not installed; %s keeps span timings only", request.url.path)
+        sampler = None
+    except (RuntimeError, ValueError) as e:
+        # Only one profiler per thread: concurrent profiled requests keep span timings only
+        logger.warning("⚠️ Sampling profiler unavailable for %s: %s", request.url.path, e)
+        sampler = None
+
+    start = time.perf_counter()
+    try:
+        response = await handler()
+    finally:
+        total_ms = (time.perf_counter() - start) * 1000
+        if sampler is not None:
+            sampler.stop()
+        _active_profile.reset(token)
+
+    base = os.path.join(settings.PROFILE_FOLDER, profile.id)
+    artifact = None
+    if sampler is not None:
+        artifact = f"{base}.html"
+        with open(artifact, "w", encoding="utf-8") as f:
+            f.write(sampler.output_html())
+
+    summary = profile.summary(total_ms, artifact)
+    with open(f"{base}.json", "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+
+    logger.info(
+        "🔬 Profiled %s %s in %.1f ms -> %s", request.method, request.url.path, total_ms, artifact
+    )
+    response.headers["X-Profile-Id"] = profile.id
+    response.headers["X-Profile-Await-Ms"] = ";".join(
+        f"{k}={v}" for k, v in summary["await_ms_by_category"].items()
+    )
+    return response
+
+
+def load_profile(profile_id: str):
+    """
+    Returns (summary, artifact_path) for a stored profile, or (None, None).
+    """
+    safe_id = os.path.basename(profile_id)
+    path = os.path.join(settings.PROFILE_FOLDER, f"{safe_id}.json")
+    if not os.path.exists(path):
+        return None, None
+    with open(path, "r", encoding="utf-8") as f:
+        summary = json.load(f)
+    return summary, summary.get("artifact")
@@ -0,0 +1,130 @@
+import asyncio
+import os
+from datetime import datetime
+from app.repository.file_repository import FileRepository
+from app.repository.resume_repository import ResumeRepository
+from app.services.agent.resume_parser_agent import extract_resume_text, parse_resume_with_gemini
+from app.services.utils.file_store import RESUME, get_file_store
+from app.services.utils.llm_metrics import llm_context
+from app.services.utils.log import logger
+from app.services.utils.skill_vocabulary import normalize_skills
+from app.services.utils.vector_index import embed_text, get_vector_index, index_resume, resume_embedding_text
+
+RESUME_EXTENSIONS = (".pdf", ".docx")
+
+# One index sync at a time; concurrent searches wait and then find it done
+_sync_lock = asyncio.Lock()
+
+
+class UnreadableResumeError(ValueError):
+    """The file cannot be read as a resume (unsupported or corrupt); retrying will not help."""
+
+
+def build_resume_record(file_name: str, stored: dict, parsed_resume: dict, resume_text: str) -> dict:
+    """
+    The 'resumes' document for a file in the file store and its parse.
+    """
+    skills = parsed_resume.get("skills", [])
+    return {
+        "file_name": file_name,
+        "file_path": stored["path"],
+        "file_type": stored["ext"].lstrip("."),
+        "content_hash": stored["content_hash"],
+        "file_size": stored["size"],
+        "parsed_data": parsed_resume,
+        "skills": skills,
+        "skills_normalized": normalize_skills(skills),
+        "raw_text": resume_text,
+        "uploaded_at": datetime.utcnow(),
+    }
+
+
+async def ingest_resume_file(
+    path: str, file_name: str = None, content_hash: str = None, size: int = None, source: str = "folder"
+) -> dict:
+    """
+    Stores, extracts, parses and indexes one resume file that arrived outside the
+    upload API. Content already in `resumes` is not parsed again.
+    Returns {"resume_id", "created"}; raises UnreadableResumeError when no text
+    can be extracted from the file.
+    """
+    file_name = file_name or os.path.basename(path)
+    stored = await get_file_store().import_file(path, RESUME, content_hash, size)
+    existing = await ResumeRepository.find_by_content_hash(stored["content_hash"])
+    if existing:
+        return {"resume_id": existing["_id"], "created": False}
+
+    try:
+        resume_text = await asyncio.to_thread(extract_resume_text, stored["path"], stored["content_hash"])
+    except OSError:
+        raise
+    except Exception as e:
+        raise UnreadableResumeError(str(e)) from e
+    with llm_context(endpoint=f"ingest_{source}"):
+        parsed_resume = await asyncio.to_thread(parse_resume_with_gemini, resume_text)
+
+    record = build_resume_record(file_name, stored, parsed_resume, resume_text)
+    record["source"] = source
+    resume_id, created = await ResumeRepository.create_unique_resume(record)
+    if created:
+        await asyncio.to_thread(index_resume, resume_id, record)
+    return {"resume_id": resume_id, "created": created}
+
+
+async def _index_covers_corpus() -> bool:
+    """
+    Every stored resume file has a 'resumes' record and every record has a row
+    in the vector index (by count: both only ever grow together).
+    """
+    files = await FileRepository.count(RESUME, RESUME_EXTENSIONS)
+    recorded = await ResumeRepository.count({"content_hash": {"$exists": True}})
+    total = await ResumeRepository.count()
+    return files <= recorded and len(get_vector_index()) >= total
+
+
+async def sync_resume_index(folder: str, batch_size: int = 500) -> bool:
+    """
+    Brings the vector index up to the whole resume corpus before an indexed
+    search: loose files of `folder` are imported into the file store, stored
+    resume files without a record are ingested, and records missing from the
+    index (stored before indexing existed) are embedded.
+    Returns True when the index then covers every resume.
+    """
+    async with _sync_lock:
+        store = get_file_store()
+        imported = await store.sync_folder(folder, RESUME, RESUME_EXTENSIONS)
+        if imported:
+            logger.info("📥 Imported %s new resume file(s) from %s", imported, folder)
+        if await _index_covers_corpus():
+            return True
+
+        known = set()
+        async for resume in ResumeRepository.iter_all({"content_hash": 1}, batch_size):
+            if resume.get("content_hash"):
+                known.add(resume["content_hash"])
+        async for stored in store.iter_files(RESUME):
+            if stored["ext"] not in RESUME_EXTENSIONS or stored["content_hash"] in known:
+                continue
+            try:
+                await ingest_resume_file(
+                    stored["path"], stored["name"], stored["content_hash"], stored["size"], source="store"
+                )
+            except Exception as e:
+                logger.error("❌ Failed to ingest stored resume %s: %s", stored["name"], e)
+
+        index = get_vector_index()
+
+        def embed_batch(batch):
+            return [(r["_id"], embed_text(resume_embedding_text(r))) for r in batch]
+
+        batch = []
+        async for resume in ResumeRepository.iter_all({"raw_text": 1, "skills": 1, "parsed_data": 1}, batch_size):
+            if resume["_id"] not in index:
+                batch.append(resume)
+            if len(batch) >= batch_size:
+                await asyncio.to_thread(index.add_many, await asyncio.to_thread(embed_batch, batch))
+                batch = []
+        if batch:
+            await asyncio.to_thread(index.add_many, await asyncio.to_thread(embed_batch, batch))
+
+        return await _index_covers_corpus()
@@ -0,0 +1,136 @@
+import re
+
+# -------------------- VOCABULARY --------------------
+# canonical skill -> aliases (all lower-case). Canonical keys are what gets stored
+# in `skills_normalized` and what the skill search matches on.
+SKILL_SYNONYMS = {
+    "kubernetes": ["k8s", "kube", "kubernetes (k8s)"],
+    "go": ["golang", "go lang", "go language"],
+    "javascript": ["js", "java script", "ecmascript", "es6"],
+    "typescript": ["ts"],
+    "python": ["python3", "python 3", "py"],
+    "c++": ["cpp", "c plus plus"],
+    "c#": ["csharp", "c sharp"],
+    ".net": ["dotnet", "dot net", ".net core", "asp.net"],
+    "node.js": ["node", "nodejs", "node js"],
+    "react": ["reactjs", "react.js", "react js"],
+    "angular": ["angularjs", "angular.js"],
+    "vue": ["vuejs", "vue.js"],
+    "next.js": ["nextjs", "next js"],
+    "express": ["expressjs", "express.js"],
+    "django": ["django rest framework", "drf"],
+    "fastapi": ["fast api"],
+    "spring boot": ["springboot", "spring-boot"],
+    "postgresql": ["postgres", "postgre sql", "psql"],
+    "mysql": ["my sql"],
+    "mongodb": ["mongo", "mongo db"],
+    "sql": ["structured query language"],
+    "nosql": ["no sql", "no-sql"],
+    "redis": ["redis cache"],
+    "elasticsearch": ["elastic search", "elastic"],
+    "aws": ["amazon web services", "amazon aws"],
+    "gcp": ["google cloud", "google cloud platform"],
+    "azure": ["microsoft azure", "ms azure"],
+    "docker": ["docker containers", "containerization"],
+    "terraform": ["hashicorp terraform"],
+    "ci/cd": ["cicd", "ci cd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "git": ["github", "gitlab", "version control"],
+    "linux": ["unix", "gnu/linux"],
+    "rest api": ["rest", "restful", "restful api", "rest apis", "restful apis"],
+    "graphql": ["graph ql"],
+    "microservices": ["micro services", "microservice architecture"],
+    "machine learning": ["ml"],
+    "deep learning": ["dl"],
+    "artificial intelligence": ["ai"],
+    "natural language processing": ["nlp"],
+    "computer vision": ["opencv image processing"],
+    "tensorflow": ["tensor flow", "tf2"],
+    "pytorch": ["torch", "py torch"],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "pandas": ["pandas library"],
+    "numpy": ["num py"],
+    "data analysis": ["data analytics"],
+    "power bi": ["powerbi"],
+    "excel": ["ms excel", "microsoft excel"],
+    "microsoft 365": ["office 365", "ms office 365", "o365"],
+    "html": ["html5"],
+    "css": ["css3"],
+    "tailwind css": ["tailwind", "tailwindcss"],
+    "java": ["core java", "java 8", "java8"],
+    "kotlin": ["kotlin lang"],
+    "swift": ["swift ui", "swiftui"],
+    "react native": ["react-native"],
+    "flutter": ["flutter sdk"],
+    "communication": ["communication skills", "verbal communication", "written communication"],
+    "leadership": ["team leadership", "leading teams"],
+    "project management": ["pm", "project planning"],
+    "agile": ["scrum", "agile methodology", "agile/scrum"],
+    "problem solving": ["problem-solving", "problem solving skills"],
+}
+
+# alias or canonical -> canonical
+_LOOKUP = {}
+for _canonical, _aliases in SKILL_SYNONYMS.items():
+    _LOOKUP[_canonical] = _canonical
+    for _alias in _aliases:
+        _LOOKUP[_alias] = _canonical
+
+_SPLIT = re.compile(r"\s*(?:[,;|]|\band\b)\s*")
+# "/" and "&" also join single tokens ("TCP/IP", "R&D", "UI/UX"); see _split_joined
+_JOINED = re.compile(r"\s*[/&]\s*")
+# Only a separate version token: "Python 3.11", "Angular v15" (not "S3", "EC2", "Web3")
+_VERSION = re.compile(r"\s+v?\d+(?:\.\d+)*\+?$")
+_NOISE = re.compile(r"^[\s\-•*:]+|[\s\-•*:.]+$")
+_PAREN = re.compile(r"\s*[(\[][^)\]]*[)\]]")
+
+
+def _clean(skill: str) -> str:
+    skill = _NOISE.sub("", str(skill).lower())
+    return re.sub(r"\s+", " ", skill)
+
+
+def _split_joined(entry: str) -> list:
+    """
+    Splits "Python/Django" or "AWS & GCP", but keeps "TCP/IP" or "R&D" whole:
+    a piece of one or two characters must itself be a known skill ("AI/ML").
+    """
+    pieces = [p for p in _JOINED.split(entry) if p.strip()]
+    if len(pieces) > 1 and all(len(_clean(p)) > 2 or _clean(p) in _LOOKUP for p in pieces):
+        return pieces
+    return [entry]
+
+
+def normalize_skill(skill: str) -> str:
+    """
+    Canonical form of one skill: "K8s" -> "kubernetes", "ReactJS" -> "react",
+    "Python 3.11" -> "python". Unknown skills are returned cleaned and lower-cased.
+    """
+    cleaned = _clean(skill)
+    if cleaned in _LOOKUP:
+        return _LOOKUP[cleaned]
+    # "Machine Learning (ML)" -> "machine learning", "Python 3.11" -> "python"
+    bare = _VERSION.sub("", _PAREN.sub("", cleaned)).strip()
+    return _LOOKUP.get(bare, bare or cleaned)
+
+
+def normalize_skills(skills) -> list:
+    """
+    Normalized, de-duplicated skills (order of first appearance kept).
+    Compound entries such as "Python/Django, AWS" are split unless the whole
+    entry is a known skill (e.g. "CI/CD").
+    """
+    if isinstance(skills, str):
+        skills = [skills]
+    result = []
+    for entry in skills or []:
+        if not isinstance(entry, str):
+            continue
+        if _clean(entry) in _LOOKUP:
+            parts = [entry]
+        else:
+            parts = [piece for part in _SPLIT.split(entry) for piece in _split_joined(part)]
+        for part in parts:
+            canonical = normalize_skill(part)
+            if canonical and len(canonical) <= 60 and canonical not in result:
+                result.append(canonical)
+    return result
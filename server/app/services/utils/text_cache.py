@@ -0,0 +1,57 @@
+import gzip
+import os
+import uuid
+from app.config.config import settings
+from app.services.utils.log import logger
+
+
+class TextCache:
+    """
+    Extracted document text stored once per file content hash as gzip sidecars
+    (<folder>/<h[0:2]>/<h[2:4]>/<sha256>.v<version>.txt.gz). Bumping the version
+    (e.g. after changing the extractor) makes old entries unreachable.
+    """
+
+    def __init__(self, folder: str, version: str = "1"):
+        self.folder = folder
+        self.version = version
+
+    def path_for(self, content_hash: str) -> str:
+        return os.path.join(
+            self.folder, content_hash[:2], content_hash[2:4], f"{content_hash}.v{self.version}.txt.gz"
+        )
+
+    def get(self, content_hash: str):
+        try:
+            with gzip.open(self.path_for(content_hash), "rt", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, UnicodeDecodeError) as e:
+            logger.warning("Corrupt text cache entry %s: %s", content_hash, e)
+            return None
+
+    def set(self, content_hash: str, text: str):
+        path = self.path_for(content_hash)
+        tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=6) as f:
+                f.write(text)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("Text cache write failed for %s: %s", content_hash, e)
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+
+_cache = None
+
+
+def get_text_cache() -> TextCache:
+    global _cache
+    if _cache is None:
+        _cache = TextCache(settings.TEXT_CACHE_FOLDER, settings.TEXT_EXTRACTOR_VERSION)
+    return _cache
@@ -0,0 +1,89 @@
+import asyncio
+import hashlib
+import os
+import uuid
+from fastapi import HTTPException, UploadFile
+from app.config.config import settings
+
+# Headroom for form fields and part headers around the file in one request
+MULTIPART_OVERHEAD_BYTES = 1024 * 1024
+
+
+def max_upload_bytes() -> int:
+    return int(settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024)
+
+
+def max_request_bytes() -> int:
+    """
+    Largest multipart request accepted: one file at the limit plus the form
+    fields and multipart framing around it.
+    """
+    return max_upload_bytes() + MULTIPART_OVERHEAD_BYTES
+
+
+class UploadTooLargeError(HTTPException):
+    def __init__(self, limit: int):
+        super().__init__(status_code=413, detail=f"File exceeds the {limit / (1024 * 1024):g} MB upload limit")
+
+
+async def stream_upload(upload: UploadFile, folder: str, max_bytes: int = None) -> tuple:
+    """
+    Copies an upload to a temporary file in `folder` in UPLOAD_CHUNK_SIZE chunks,
+    hashing it on the way, so memory stays at one chunk whatever the file size.
+    The copy and fsync run in a worker thread, off the event loop.
+
+    By now Starlette has already spooled the multipart body; oversized requests
+    are refused before that by UploadLimitMiddleware. This per-file check
+    (413 above `max_bytes`, default MAX_UPLOAD_SIZE_MB) covers files sent
+    without a Content-Length.
+    Returns (temp_path, sha256 hex digest, size in bytes); the caller either
+    commits the file or drops it with `discard_upload`.
+    """
+    limit = max_bytes or max_upload_bytes()
+    if upload.size is not None and upload.size > limit:
+        raise UploadTooLargeError(limit)
+
+    os.makedirs(folder, exist_ok=True)
+    temp_path = os.path.join(folder, f".upload-{uuid.uuid4().hex}.part")
+    try:
+        digest, size = await asyncio.to_thread(_copy_to_file, upload.file, temp_path, limit)
+    except BaseException:
+        discard_upload(temp_path)
+        raise
+    return temp_path, digest, size
+
+
+def _copy_to_file(source, temp_path: str, limit: int) -> tuple:
+    digest = hashlib.sha256()
+    size = 0
+    source.seek(0)
+    with open(temp_path, "wb") as buffer:
+        for chunk in iter(lambda: source.read(settings.UPLOAD_CHUNK_SIZE), b""):
+            size += len(chunk)
+            if size > limit:
+                raise UploadTooLargeError(limit)
+            digest.update(chunk)
+            buffer.write(chunk)
+        buffer.flush()
+        os.fsync(buffer.fileno())
+    return digest.hexdigest(), size
+
+
+def hash_file(path: str) -> tuple:
+    """
+    (sha256 hex digest, size) of a file on disk, read in UPLOAD_CHUNK_SIZE chunks.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(settings.UPLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def discard_upload(temp_path: str):
+    try:
+        os.remove(temp_path)
+    except FileNotFoundError:
+        pass
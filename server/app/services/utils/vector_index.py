@@ -0,0 +1,277 @@
+import json
+import math
+import os
+import re
+import shutil
+import threading
+import zlib
+
+from app.config.config import settings
+from app.services.utils.log import logger
+
+# numpy is imported inside the functions that need it so importing this module
+# (done by the AI routes) does not slow down startup.
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+
+# -------------------- HASHING-TRICK EMBEDDING --------------------
+
+def tokenize(text: str) -> list:
+    """
+    Lower-cased word tokens (keeps "c++", "c#", "node.js") plus adjacent bigrams.
+    """
+    words = _TOKEN.findall((text or "").lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def embed_text(text: str, dim: int = None):
+    """
+    Signed hashing-trick vector with log-scaled term counts, L2-normalized.
+    Deterministic and offline: no model download, no network.
+    """
+    import numpy as np
+
+    dim = dim or settings.VECTOR_INDEX_DIM
+    counts = {}
+    for token in tokenize(text):
+        h = zlib.crc32(token.encode("utf-8"))
+        counts[h] = counts.get(h, 0) + 1
+
+    vector = np.zeros(dim, dtype=np.float32)
+    for h, count in counts.items():
+        sign = 1.0 if (h >> 31) & 1 else -1.0
+        vector[h % dim] += sign * (1.0 + math.log(count))
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else vector
+
+
+# -------------------- MEMORY-MAPPED INDEX --------------------
+
+class VectorIndex:
+    """
+    Append-only float32 matrix on disk (vectors.f32, memory-mapped), an
+    append-only ids.txt (row -> resume id) and a small meta.json committing the
+    row count, written last so readers never see a partially added row.
+    Search is a single matrix-vector product over the used rows, so 100k
+    resumes stay in the tens of milliseconds.
+
+    One process writes the index; readers pick up new rows when meta.json changes.
+    """
+
+    def __init__(self, folder: str, dim: int):
+        self.folder = folder
+        self.dim = dim
+        self._lock = threading.RLock()
+        self._vectors = None
+        self._ids = []
+        self._rows = {}
+        self._meta_mtime = None
+        os.makedirs(folder, exist_ok=True)
+        self._load()
+
+    @property
+    def _vectors_path(self):
+        return os.path.join(self.folder, "vectors.f32")
+
+    @property
+    def _meta_path(self):
+        return os.path.join(self.folder, "meta.json")
+
+    @property
+    def _ids_path(self):
+        return os.path.join(self.folder, "ids.txt")
+
+    def __len__(self):
+        with self._lock:
+            self._reload_if_changed()
+            return len(self._ids)
+
+    def __contains__(self, resume_id: str):
+        with self._lock:
+            self._reload_if_changed()
+            return resume_id in self._rows
+
+    # -------------------- STORAGE --------------------
+    def _load(self):
+        import numpy as np
+
+        if not os.path.exists(self._meta_path):
+            self._ids, self._rows, self._vectors = [], {}, None
+            return
+        with open(self._meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("dim") != self.dim:
+            logger.warning("Vector index dim %s != configured %s; index must be rebuilt", meta.get("dim"), self.dim)
+            self._ids, self._rows, self._vectors = [], {}, None
+            return
+        with open(self._ids_path, "r", encoding="utf-8") as f:
+            self._ids = [line.rstrip("\n") for _, line in zip(range(meta["count"]), f)]
+        self._rows = {resume_id: row for row, resume_id in enumerate(self._ids)}
+        self._vectors = np.memmap(self._vectors_path, dtype=np.float32, mode="r+", shape=(meta["capacity"], self.dim))
+        self._meta_mtime = os.path.getmtime(self._meta_path)
+
+    def _reload_if_changed(self):
+        if os.path.exists(self._meta_path) and os.path.getmtime(self._meta_path) != self._meta_mtime:
+            self._load()
+
+    def _save_meta(self):
+        tmp = self._meta_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"dim": self.dim, "capacity": self._capacity(), "count": len(self._ids)}, f)
+        os.replace(tmp, self._meta_path)
+        self._meta_mtime = os.path.getmtime(self._meta_path)
+
+    def _capacity(self) -> int:
+        return 0 if self._vectors is None else self._vectors.shape[0]
+
+    def _grow(self, needed: int):
+        import numpy as np
+
+        capacity = max(1024, self._capacity())
+        while capacity < needed:
+            capacity *= 2
+        if self._vectors is not None:
+            self._vectors.flush()
+        # Extending the file keeps existing rows; the new tail reads as zeros
+        with open(self._vectors_path, "ab") as f:
+            f.truncate(capacity * self.dim * 4)
+        self._vectors = np.memmap(self._vectors_path, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+
+    # -------------------- WRITE --------------------
+    def add(self, resume_id: str, vector):
+        """
+        Inserts or replaces the vector of one resume.
+        """
+        self.add_many([(resume_id, vector)])
+
+    def add_many(self, items: list):
+        with self._lock:
+            self._reload_if_changed()
+            new_ids = []
+            for resume_id, _ in items:
+                if resume_id not in self._rows and resume_id not in new_ids:
+                    new_ids.append(resume_id)
+            if len(self._ids) + len(new_ids) > self._capacity():
+                self._grow(len(self._ids) + len(new_ids))
+            if new_ids:
+                # Rewrite from the committed count so a crashed earlier write leaves no stray ids
+                with open(self._ids_path, "a+", encoding="utf-8") as f:
+                    f.truncate(self._committed_ids_size())
+                    f.write("".join(f"{resume_id}\n" for resume_id in new_ids))
+            for resume_id in new_ids:
+                self._rows[resume_id] = len(self._ids)
+                self._ids.append(resume_id)
+            for resume_id, vector in items:
+                self._vectors[self._rows[resume_id]] = vector
+            self._vectors.flush()
+            self._save_meta()
+
+    def _committed_ids_size(self) -> int:
+        return sum(len(resume_id.encode("utf-8")) + 1 for resume_id in self._ids)
+
+    def swap_in(self, staging: "VectorIndex", since_row: int = None):
+        """
+        Replaces this index with `staging` (built in another folder) in one step:
+        searches see the old or the new index, never a partial one. Rows added
+        here from `since_row` on (uploads during the rebuild) are carried over.
+        """
+        import numpy as np
+
+        with self._lock, staging._lock:
+            self._reload_if_changed()
+            if since_row is not None and self._vectors is not None:
+                carried = [
+                    (resume_id, np.array(self._vectors[row]))
+                    for row, resume_id in enumerate(self._ids[since_row:], start=since_row)
+                    if resume_id not in staging._rows
+                ]
+                if carried:
+                    staging.add_many(carried)
+            if staging._vectors is not None:
+                staging._vectors.flush()
+            staging._vectors = None
+            self._vectors = None
+            # meta.json last: other readers reload only once it changes
+            for name in ("vectors.f32", "ids.txt", "meta.json"):
+                source = os.path.join(staging.folder, name)
+                if os.path.exists(source):
+                    os.replace(source, os.path.join(self.folder, name))
+            self._load()
+            shutil.rmtree(staging.folder, ignore_errors=True)
+
+    def clear(self):
+        with self._lock:
+            self._ids, self._rows = [], {}
+            self._vectors = None
+            for path in (self._vectors_path, self._meta_path, self._ids_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            self._meta_mtime = None
+
+    # -------------------- READ --------------------
+    def search(self, query_vector, top_k: int = 10) -> list:
+        """
+        Returns [(resume_id, cosine similarity)] for the `top_k` nearest resumes.
+        """
+        import numpy as np
+
+        with self._lock:
+            self._reload_if_changed()
+            count = len(self._ids)
+            if not count or top_k <= 0:
+                return []
+            scores = self._vectors[:count] @ query_vector
+            k = min(top_k, count)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            return [(self._ids[i], float(scores[i])) for i in top]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_vector_index() -> VectorIndex:
+    """
+    Shared index under VECTOR_INDEX_FOLDER, opened on first use.
+    """
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = VectorIndex(settings.VECTOR_INDEX_FOLDER, settings.VECTOR_INDEX_DIM)
+    return _index
+
+
+def resume_embedding_text(resume: dict) -> str:
+    """
+    Text embedded for a resume document: parsed skills and titles weigh in
+    alongside the raw text.
+    """
+    parsed = resume.get("parsed_data") or {}
+    roles = [e.get("role", "") for e in parsed.get("experience", []) if isinstance(e, dict)]
+    parts = [
+        " ".join(str(s) for s in resume.get("skills") or parsed.get("skills") or []),
+        " ".join(roles),
+        parsed.get("summary", "") if isinstance(parsed.get("summary"), str) else "",
+        resume.get("raw_text", ""),
+    ]
+    return "\n".join(p for p in parts if p)
+
+
+def index_resume(resume_id: str, resume: dict):
+    """
+    Embeds and stores one resume; failures are logged, never raised to the upload.
+    """
+    try:
+        get_vector_index().add(str(resume_id), embed_text(resume_embedding_text(resume)))
+    except Exception as e:
+        logger.error("Vector indexing failed for resume %s: %s", resume_id, e)
+
+
+def search_resumes(query_text: str, top_k: int = 10) -> list:
+    """
+    Nearest resumes for a job description: [(resume_id, score)].
+    """
+    return get_vector_index().search(embed_text(query_text), top_k)
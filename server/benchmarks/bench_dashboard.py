@@ -0,0 +1,116 @@
+"""
+Dashboard query benchmark across dataset volume tiers.
+
+Times AdminDashboardRepository.get_dashboard_data, get_all_candidates_controller,
+get_candidate_detail_controller and JobRepository.find_all at each tier, so their
+scaling curves can be tracked between commits.
+
+    cd server
+    python -m benchmarks.bench_dashboard --tiers small medium large --mongo-uri mongodb://localhost:27017
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SERVER_DIR not in sys.path:
+    sys.path.insert(0, SERVER_DIR)
+
+
+async def _time(fn, repeats: int) -> dict:
+    from benchmarks.harness import summarize
+
+    latencies, errors = [], 0
+    wall_start = time.perf_counter()
+    for i in range(repeats):
+        start = time.perf_counter()
+        try:
+            await fn(i)
+            latencies.append((time.perf_counter() - start) * 1000)
+        except Exception as e:
+            errors += 1
+            print(f"❌ {getattr(fn, '__name__', fn)} failed: {e}")
+    return summarize(latencies, errors, time.perf_counter() - wall_start)
+
+
+async def bench_tier(db, tier: str, repeats: int, seed: int) -> dict:
+    from app.controllers.hr_admin_dashboard_controller import (
+        get_all_candidates_controller,
+        get_candidate_detail_controller,
+    )
+    from app.repository.admin_dashboard_repository import AdminDashboardRepository
+    from app.repository.job_repository import JobRepository
+
+    sample = await db.match_results.find({}, {"_id": 1}).limit(1000).to_list(length=1000)
+    match_ids = [str(doc["_id"]) for doc in sample]
+    rng = random.Random(seed)
+
+    async def dashboard_data(i):
+        return await AdminDashboardRepository.get_dashboard_data()
+
+    async def all_candidates(i):
+        return await get_all_candidates_controller()
+
+    async def candidate_detail(i):
+        return await get_candidate_detail_controller(rng.choice(match_ids))
+
+    async def jobs_find_all(i):
+        return await JobRepository.find_all()
+
+    results = {}
+    for name, fn in (
+        ("get_dashboard_data", dashboard_data),
+        ("get_all_candidates_controller", all_candidates),
+        ("get_candidate_detail_controller", candidate_detail),
+        ("JobRepository.find_all", jobs_find_all),
+    ):
+        results[f"{tier}/{name}"] = await _time(fn, repeats)
+        print(f"⏱️  {tier}/{name}: p50 {results[f'{tier}/{name}']['p50_ms']} ms")
+    return results
+
+
+async def main_async(args):
+    from benchmarks import fake_mongo, harness
+    from benchmarks.dashboard_dataset import TIERS, generate
+
+    results = {}
+    for tier in args.tiers:
+        db = fake_mongo.install_database(
+            fake_mongo.create_database(args.mongo_uri, f"{args.db_name}_{tier}")
+        )
+        if not args.reuse or await db.match_results.estimated_document_count() == 0:
+            await generate(db, tier, seed=args.seed, drop=True)
+        tier_results = await bench_tier(db, tier, args.repeats, args.seed)
+        for stats in tier_results.values():
+            stats["volume"] = dict(zip(("jobs", "resumes", "match_results"), TIERS[tier]))
+        results.update(tier_results)
+
+    config = {"tiers": args.tiers, "repeats": args.repeats, "mongo": "local" if args.mongo_uri else "mongomock"}
+    previous = harness.load_previous("dashboard")
+    if not args.no_save:
+        print(f"💾 Results saved to {harness.save_results('dashboard', config, results)}")
+    harness.print_report(results, previous)
+    return results
+
+
+def main(argv=None):
+    from benchmarks.dashboard_dataset import TIERS
+
+    parser = argparse.ArgumentParser(description="Dashboard query benchmark")
+    parser.add_argument("--tiers", nargs="+", choices=list(TIERS), default=["tiny", "small"])
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--mongo-uri", default=None, help="Local MongoDB (mongomock if omitted; use for small tiers only)")
+    parser.add_argument("--db-name", default="resume_benchmark")
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--reuse", action="store_true", help="Reuse an already generated tier database")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args(argv)
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
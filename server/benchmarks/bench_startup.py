@@ -0,0 +1,157 @@
+"""
+Startup-time benchmark.
+
+Measures, in fresh interpreter processes, the import time of the API modules and
+the time to the first /auth/login response (fake Mongo, seeded user).
+
+    cd server
+    python -m benchmarks.bench_startup --runs 5 --importtime
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SERVER_DIR not in sys.path:
+    sys.path.insert(0, SERVER_DIR)
+
+APP_MODULES = [
+    "app.middleware.auth_agent_middleware",
+    "app.routes.auth.auth_routes",
+    "app.routes.ai_routes",
+    "app.routes.hr_admin_dashboard_routes",
+]
+
+
+def child():
+    """
+    Runs inside the measured process: import, build the app, serve one login.
+    """
+    t0 = time.perf_counter()
+    import importlib
+
+    for name in APP_MODULES:
+        importlib.import_module(name)
+    t_import = time.perf_counter()
+
+    import asyncio
+
+    from benchmarks import fake_mongo, harness
+
+    async def first_login():
+        from app.services.auth.auth_service import AuthService
+
+        db = fake_mongo.install_database(fake_mongo.create_database())
+        await db.users.insert_one({
+            "email": "bench@example.com",
+            "hashed_password": AuthService.hash_password("Bench@123"),
+            "is_email_verified": True,
+        })
+        t_ready = time.perf_counter()
+        async with harness.create_client(harness.create_app()) as client:
+            response = await client.post(
+                "/api/v1/auth/login", json={"email": "bench@example.com", "password": "Bench@123"}
+            )
+        return t_ready, response.status_code
+
+    t_ready, status = asyncio.run(first_login())
+    t_login = time.perf_counter()
+    langchain_loaded = "langchain_google_genai" in sys.modules
+    print(json.dumps({
+        "import_ms": (t_import - t0) * 1000,
+        # Excludes seeding the user (bcrypt hashing is not part of startup)
+        "first_login_ms": (t_import - t0 + t_login - t_ready) * 1000,
+        "login_status": status,
+        "langchain_imported": langchain_loaded,
+        "pymupdf_imported": "pymupdf" in sys.modules,
+    }))
+
+
+def run_once(env: dict) -> dict:
+    start = time.perf_counter()
+    out = subprocess.check_output(
+        [sys.executable, "-m", "benchmarks.bench_startup", "--child"],
+        cwd=SERVER_DIR,
+        env=env,
+        text=True,
+    )
+    result = json.loads(out.strip().splitlines()[-1])
+    result["process_ms"] = (time.perf_counter() - start) * 1000
+    return result
+
+
+def top_imports(env: dict, limit: int = 15) -> list:
+    """
+    Slowest cumulative imports reported by `python -X importtime`.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + ", ".join(APP_MODULES)],
+        cwd=SERVER_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = [p.strip() for p in line.replace("import time:", "").split("|")]
+        rows.append((int(cumulative_us), name))
+    rows.sort(reverse=True)
+    return [{"module": name, "cumulative_ms": round(us / 1000, 1)} for us, name in rows[:limit]]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Startup-time benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--importtime", action="store_true", help="Also list the slowest imports")
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        return child()
+
+    from benchmarks import harness
+
+    workdir = tempfile.mkdtemp(prefix="resume_startup_")
+    env = dict(os.environ)
+    env.setdefault("LOG_LEVEL", "WARNING")
+    env["UPLOAD_FOLDER"] = os.path.join(workdir, "uploads")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SERVER_DIR, env.get("PYTHONPATH")]))
+
+    runs = [run_once(env) for _ in range(args.runs)]
+    results = {}
+    for key in ("import_ms", "first_login_ms", "process_ms"):
+        values = sorted(r[key] for r in runs)
+        results[key] = {
+            "requests": len(values),
+            "errors": sum(1 for r in runs if r["login_status"] != 200),
+            "throughput_rps": 0.0,
+            "mean_ms": round(statistics.mean(values), 2),
+            "p50_ms": round(harness.percentile(values, 50), 2),
+            "p95_ms": round(harness.percentile(values, 95), 2),
+            "p99_ms": round(harness.percentile(values, 99), 2),
+            "max_ms": round(values[-1], 2),
+        }
+    print(f"langchain imported at startup: {runs[0]['langchain_imported']}, pymupdf: {runs[0]['pymupdf_imported']}")
+
+    previous = harness.load_previous("startup")
+    if not args.no_save:
+        print(f"💾 Results saved to {harness.save_results('startup', {'runs': args.runs}, results)}")
+    harness.print_report(results, previous)
+
+    if args.importtime:
+        print("\nSlowest imports (cumulative):")
+        for row in top_imports(env):
+            print(f"  {row['cumulative_ms']:>8.1f} ms  {row['module']}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
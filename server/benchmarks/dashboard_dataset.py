@@ -0,0 +1,188 @@
+"""
+Synthetic dashboard dataset generator.
+
+Populates `jobs`, `resumes` and `match_results` with documents shaped like the ones
+the API writes (including `parsed_data` and `raw_response`) at a chosen volume tier.
+
+    cd server
+    python -m benchmarks.dashboard_dataset --tier large --mongo-uri mongodb://localhost:27017 --drop
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SERVER_DIR not in sys.path:
+    sys.path.insert(0, SERVER_DIR)
+
+from benchmarks.synthetic_docs import FIRST_NAMES, LAST_NAMES, SKILLS, TITLES  # noqa: E402
+
+# jobs, resumes, match results
+TIERS = {
+    "tiny": (10, 500, 2_000),
+    "small": (50, 5_000, 20_000),
+    "medium": (200, 50_000, 200_000),
+    "large": (1_000, 200_000, 1_000_000),
+}
+
+BATCH_SIZE = 5_000
+EPOCH = datetime(2024, 1, 1)
+
+
+def _job(rng: random.Random, index: int) -> dict:
+    title = rng.choice(TITLES)
+    return {
+        "_id": ObjectId(),
+        "title": f"{title} {index}",
+        "description": f"We are hiring a {title} to build and scale our platform. " * 4,
+        "responsibilities": ["Design APIs", "Own services end to end", "Mentor engineers", "Review code"],
+        "requirements": [f"{rng.randint(2, 8)}+ years of experience", "Strong CS fundamentals"],
+        "skills": rng.sample(SKILLS, 6),
+        "qualifications": ["B.Tech or equivalent"],
+        "location": rng.choice(["Bengaluru", "Pune", "Hyderabad", "Remote"]),
+        "employment_type": rng.choice(["Full-time", "Contract"]),
+        "experience": f"{rng.randint(1, 5)}-{rng.randint(6, 12)} years",
+        "file_path": f"uploads/requirements/{title.replace(' ', '_')}_{index}.txt",
+        "created_at": EPOCH + timedelta(minutes=index * 37),
+        "is_active": rng.random() < 0.8,
+        "search_query": f"{title} {' '.join(rng.sample(SKILLS, 3))}",
+        "related_titles": rng.sample(TITLES, 2),
+        "recommended_skills": rng.sample(SKILLS, 4),
+    }
+
+
+def _resume(rng: random.Random, index: int) -> dict:
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    name = f"{first} {last}"
+    skills = rng.sample(SKILLS, rng.randint(4, 10))
+    experience = [
+        {
+            "company": f"Company {rng.randint(1, 5000)}",
+            "role": rng.choice(TITLES),
+            "duration": f"Jan {2010 + j} - Dec {2012 + j}",
+            "responsibilities": [
+                "Designed and shipped services handling millions of requests per day",
+                "Led migrations and mentored engineers",
+            ],
+        }
+        for j in range(rng.randint(1, 5))
+    ]
+    file_type = rng.choice(["pdf", "docx"])
+    return {
+        "_id": ObjectId(),
+        "file_name": f"{first.lower()}_{last.lower()}_{index}.{file_type}",
+        "file_path": f"uploads/resumes/{first.lower()}_{last.lower()}_{index}.{file_type}",
+        "file_type": file_type,
+        "parsed_data": {
+            "name": name,
+            "email": f"{first.lower()}.{last.lower()}{index}@example.com",
+            "phone": f"+91 9{rng.randint(100000000, 999999999)}",
+            "linkedin": f"https://linkedin.com/in/{first.lower()}-{index}" if rng.random() < 0.6 else "",
+            "skills": skills,
+            "education": [{"degree": "B.Tech in Computer Science", "institute": f"Institute {rng.randint(1, 80)}", "year": str(rng.randint(2005, 2023))}],
+            "experience": experience,
+            "certifications": rng.sample(["AWS SAA", "CKA", "GCP ACE", "PMP"], rng.randint(0, 2)),
+            "projects": [{"title": f"Project {p}", "description": "Built an internal platform component."} for p in range(rng.randint(0, 3))],
+            "summary": f"{rng.choice(TITLES)} with {rng.randint(1, 15)} years of experience.",
+        },
+        "skills": skills,
+        "raw_text": (f"{name}\n" + "Experienced engineer building distributed systems. " * rng.randint(20, 60)),
+        "uploaded_at": EPOCH + timedelta(seconds=index * 53),
+    }
+
+
+def _match(rng: random.Random, resume_id: str, job_id: str, index: int) -> dict:
+    score = rng.randint(5, 99)
+    # A small share of LLM outputs fail to parse and are stored as raw text
+    if rng.random() < 0.03:
+        raw_response = {"raw_response": "```json\n{\"status\": \"pass\", \"accuracy_score\": " + str(score)}
+    else:
+        raw_response = {
+            "status": "pass" if score >= 60 else "fail",
+            "accuracy_score": score,
+            "reason": "Candidate skills and experience compared against the requirement.",
+            "strengths": ["Relevant skills", "Solid experience"],
+            "weaknesses": ["Limited domain exposure"],
+            "linked_profile_verified": rng.random() < 0.5,
+            "detailed_comparison": {
+                "skills_match": f"{score}%",
+                "experience_match": "Adequate",
+                "education_match": "Suitable",
+                "project_relevance": "Relevant",
+            },
+            "recommendation": "Proceed to interview." if score >= 60 else "Do not proceed.",
+        }
+    return {
+        "resume_id": resume_id,
+        "job_id": job_id,
+        "status": rng.choice(["unknown", "unknown", "unknown", "accepted", "rejected"]),
+        "reason": raw_response.get("reason", ""),
+        "accuracy": 0,
+        "raw_response": raw_response,
+        "linked_verified": rng.random() < 0.5,
+        "created_at": EPOCH + timedelta(seconds=index * 11),
+    }
+
+
+async def _insert(collection, docs: list):
+    if docs:
+        await collection.insert_many(docs, ordered=False)
+
+
+async def generate(db, tier: str, seed: int = 11, drop: bool = False) -> dict:
+    """
+    Generates the dataset for `tier` into `db` and returns the counts written.
+    """
+    jobs_n, resumes_n, matches_n = TIERS[tier]
+    rng = random.Random(f"{seed}-{tier}")
+
+    if drop:
+        for name in ("jobs", "resumes", "match_results"):
+            await db[name].drop()
+
+    start = time.perf_counter()
+    jobs = [_job(rng, i) for i in range(jobs_n)]
+    await _insert(db.jobs, jobs)
+    job_ids = [str(j["_id"]) for j in jobs]
+
+    resume_ids = []
+    for offset in range(0, resumes_n, BATCH_SIZE):
+        batch = [_resume(rng, i) for i in range(offset, min(offset + BATCH_SIZE, resumes_n))]
+        await _insert(db.resumes, batch)
+        resume_ids.extend(str(r["_id"]) for r in batch)
+
+    for offset in range(0, matches_n, BATCH_SIZE):
+        batch = [
+            _match(rng, rng.choice(resume_ids), rng.choice(job_ids), i)
+            for i in range(offset, min(offset + BATCH_SIZE, matches_n))
+        ]
+        await _insert(db.match_results, batch)
+
+    counts = {"jobs": jobs_n, "resumes": resumes_n, "match_results": matches_n}
+    print(f"📦 Generated tier '{tier}' {counts} in {time.perf_counter() - start:.1f}s")
+    return counts
+
+
+def main(argv=None):
+    from benchmarks import fake_mongo
+
+    parser = argparse.ArgumentParser(description="Generate a synthetic dashboard dataset")
+    parser.add_argument("--tier", choices=list(TIERS), default="small")
+    parser.add_argument("--mongo-uri", default=None, help="Local MongoDB (mongomock if omitted)")
+    parser.add_argument("--db-name", default="resume_benchmark")
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--drop", action="store_true", help="Drop existing collections first")
+    args = parser.parse_args(argv)
+
+    db = fake_mongo.create_database(args.mongo_uri, args.db_name)
+    return asyncio.run(generate(db, args.tier, seed=args.seed, drop=args.drop))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeApolloServer:
+    """
+    Local HTTP stand-in for Apollo's /v1/contacts/search.
+
+    Serves deterministic paginated contacts after `latency_ms` per request over
+    HTTP/1.1 keep-alive, and counts requests and TCP connections so benchmarks
+    can show connection reuse and cache hits.
+    """
+
+    def __init__(self, latency_ms: float = 300.0, total_contacts: int = 200, seed: int = 42):
+        self.latency_ms = latency_ms
+        self.total_contacts = total_contacts
+        self.seed = seed
+        self.requests = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeApolloServer":
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with fake._lock:
+                    fake.connections += 1
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                with fake._lock:
+                    fake.requests += 1
+                time.sleep(fake.latency_ms / 1000)
+                payload = json.dumps(fake.page(body)).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def page(self, body: dict) -> dict:
+        page = max(1, int(body.get("page", 1)))
+        per_page = max(1, int(body.get("per_page", 25)))
+        rng = random.Random(f"{self.seed}:{body.get('q_keywords', '')}")
+        start = (page - 1) * per_page
+        contacts = []
+        for i in range(start, min(start + per_page, self.total_contacts)):
+            contacts.append({
+                "name": f"Contact {i}",
+                "title": rng.choice(["Software Engineer", "Data Scientist", "DevOps Engineer"]),
+                "linkedin_url": f"https://www.linkedin.com/in/contact-{i}",
+                "email": f"contact{i}@example.com",
+                "organization": {"name": f"Company {rng.randint(1, 50)}"},
+                "city": rng.choice(["Berlin", "Pune", "Austin"]),
+            })
+        return {
+            "contacts": contacts,
+            "pagination": {
+                "page": page,
+                "per_page": per_page,
+                "total_entries": self.total_contacts,
+                "total_pages": -(-self.total_contacts // per_page),
+            },
+        }
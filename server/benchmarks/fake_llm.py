@@ -0,0 +1,141 @@
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+
+
+class FakeLLMResponse:
+    """
+    Mimics the parts of langchain's AIMessage the agents rely on.
+    """
+
+    def __init__(self, content: str, prompt: str):
+        self.content = content
+        self.usage_metadata = {
+            "input_tokens": max(1, len(prompt) // 4),
+            "output_tokens": max(1, len(content) // 4),
+        }
+
+
+class FakeChatGoogleGenerativeAI:
+    """
+    Deterministic stand-in for ChatGoogleGenerativeAI.
+
+    Responses depend only on the prompt (same prompt -> same answer), so runs are
+    reproducible. Latency is `latency_ms` plus uniform jitter in [0, jitter_ms],
+    drawn from a seeded RNG, and is spent with a blocking sleep just like the real
+    synchronous client.
+    """
+
+    SKILLS = [
+        "Python", "FastAPI", "MongoDB", "Docker", "Kubernetes", "AWS", "React",
+        "SQL", "Go", "Java", "Machine Learning", "Communication", "Leadership",
+    ]
+
+    def __init__(self, latency_ms: float = 800.0, jitter_ms: float = 400.0, seed: int = 42, failure_rate: float = 0.0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.calls = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    # -------------------- LANGCHAIN-COMPATIBLE API --------------------
+    def invoke(self, prompt, **kwargs):
+        prompt = prompt if isinstance(prompt, str) else str(prompt)
+        with self._lock:
+            self.calls += 1
+            delay = self.latency_ms + self._rng.uniform(0, self.jitter_ms)
+            fail = self._rng.random() < self.failure_rate
+        time.sleep(delay / 1000)
+        if fail:
+            raise RuntimeError("503 Service Unavailable (fake LLM)")
+        return FakeLLMResponse(self._answer(prompt), prompt)
+
+    # -------------------- CANNED ANSWERS --------------------
+    def _answer(self, prompt: str) -> str:
+        rng = random.Random(hashlib.sha256(prompt.encode("utf-8")).hexdigest())
+
+        if "resume screening AI" in prompt:
+            return json.dumps({
+                "parsed_resume": json.loads(self._parsed_resume(prompt, rng).strip("`json\n")),
+                "match_result": json.loads(self._match_result(rng)),
+            })
+        if "Resume Parsing AI" in prompt:
+            return self._parsed_resume(prompt, rng)
+        if "job matching assistant" in prompt:
+            return self._match_result(rng)
+        if "recruitment sourcing assistant" in prompt:
+            return json.dumps({
+                "search_query": "software engineer python",
+                "related_titles": ["Backend Engineer", "Platform Engineer"],
+                "recommended_skills": rng.sample(self.SKILLS, 4),
+            })
+        if "HR recruitment assistant" in prompt:
+            return "```json\n" + json.dumps({
+                "title": "Software Engineer",
+                "description": "Build and operate backend services. " * 5,
+                "responsibilities": ["Design APIs", "Write tests", "Review code"],
+                "requirements": ["3+ years Python", "Cloud experience"],
+                "skills": rng.sample(self.SKILLS, 5),
+                "qualifications": ["B.Tech or equivalent"],
+                "location": "Remote",
+                "employment_type": "Full-time",
+                "experience": "3-5 years",
+            }) + "\n```"
+        if "personalizing candidate emails" in prompt:
+            ids = re.findall(r'"id":"([^"]+)"', prompt)
+            return json.dumps({"notes": [{"id": i, "note": "Your project work stood out to us."} for i in ids]})
+        if "email template" in prompt:
+            return (
+                "Dear {{candidate_name}},\n\n{{personal_note}}\nThank you for your interest. "
+                "Please review your match analysis here: {{match_link}}\n\nBest regards,\nHR Team"
+            )
+        return (
+            "Dear Candidate,\n\nThank you for your interest. "
+            "Please review your match analysis via the link provided.\n\nBest regards,\nHR Team"
+        )
+
+    def _parsed_resume(self, prompt: str, rng: random.Random) -> str:
+        email = re.search(r"[\w.+-]+@[\w-]+\.[\w.]+", prompt.split("Resume Text:")[-1])
+        name = re.search(r"Resume Text:\s*\n\s*([^\n]+)", prompt)
+        return "```json\n" + json.dumps({
+            "name": name.group(1).strip() if name else "Candidate",
+            "email": email.group(0) if email else "",
+            "phone": "+91 90000 00000",
+            "linkedin": "https://linkedin.com/in/candidate" if rng.random() < 0.6 else "",
+            "skills": rng.sample(self.SKILLS, rng.randint(3, 8)),
+            "education": [{"degree": "B.Tech in Computer Science", "institute": "IIT Delhi", "year": "2020"}],
+            "experience": [
+                {
+                    "company": f"Company {rng.randint(1, 500)}",
+                    "role": "Software Engineer",
+                    "duration": "Jan 2021 - Dec 2023",
+                    "responsibilities": ["Built services", "Mentored juniors"],
+                }
+                for _ in range(rng.randint(1, 4))
+            ],
+            "certifications": [],
+            "projects": [{"title": "Resume Matcher", "description": "Matching engine"}],
+            "summary": "Engineer with backend experience.",
+        }, indent=2) + "\n```"
+
+    def _match_result(self, rng: random.Random) -> str:
+        score = rng.randint(20, 98)
+        return json.dumps({
+            "status": "pass" if score >= 60 else "fail",
+            "accuracy_score": score,
+            "reason": "Synthetic evaluation",
+            "strengths": ["Relevant skills"],
+            "weaknesses": ["Limited domain exposure"],
+            "linked_profile_verified": rng.random() < 0.5,
+            "detailed_comparison": {
+                "skills_match": f"{score}%",
+                "experience_match": "Adequate",
+                "education_match": "Suitable",
+                "project_relevance": "Relevant",
+            },
+            "recommendation": "Proceed to interview." if score >= 60 else "Do not proceed.",
+        }, indent=2)
@@ -0,0 +1,52 @@
+import importlib
+import pkgutil
+import sys
+
+
+def _import_app_modules():
+    """
+    Imports every app module so repository modules holding a `db` reference
+    exist before the database is swapped.
+    """
+    import app
+
+    for module_info in pkgutil.walk_packages(app.__path__, prefix="app."):
+        if module_info.name.endswith(("main", "test_smtp")):
+            continue
+        try:
+            importlib.import_module(module_info.name)
+        except Exception:
+            # Optional modules may need extra dependencies — they cannot hold a db then.
+            pass
+
+
+def create_database(mongo_uri: str = None, db_name: str = "resume_benchmark"):
+    """
+    Returns a Motor-compatible database.
+
+    - With `mongo_uri`: a real (local) MongoDB, using a throwaway database name.
+    - Without: an in-process mongomock-motor database (pip install mongomock-motor).
+    """
+    if mongo_uri:
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        return AsyncIOMotorClient(mongo_uri)[db_name]
+
+    from mongomock_motor import AsyncMongoMockClient
+
+    return AsyncMongoMockClient()[db_name]
+
+
+def install_database(database):
+    """
+    Points `app.config.database.db` and every module that imported it by name
+    at the given database.
+    """
+    import app.config.database as app_database
+
+    _import_app_modules()
+    original = app_database.db
+    for name, module in list(sys.modules.items()):
+        if name.startswith("app") and getattr(module, "db", None) is original:
+            module.db = database
+    return database
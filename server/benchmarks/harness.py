@@ -0,0 +1,169 @@
+import asyncio
+import json
+import os
+import subprocess
+import time
+from datetime import datetime
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+# -------------------- APP UNDER TEST --------------------
+
+def create_app():
+    """
+    Assembles the API the same way production mounts it (/api/v1 prefix,
+    upload limit and auth middleware in front of every router).
+    """
+    from fastapi import FastAPI
+
+    from app.middleware.auth_agent_middleware import AuthAgentMiddleware
+    from app.middleware.upload_limit_middleware import UploadLimitMiddleware
+    from app.routes import ai_routes, hr_admin_dashboard_routes
+    from app.routes.auth import auth_routes
+
+    api = FastAPI()
+    api.add_middleware(AuthAgentMiddleware)
+    # Added last = outermost: oversized uploads never reach auth or form parsing
+    api.add_middleware(UploadLimitMiddleware)
+    api.include_router(auth_routes.router, prefix="/api/v1/auth")
+    api.include_router(ai_routes.router, prefix="/api/v1/ai")
+    api.include_router(hr_admin_dashboard_routes.router, prefix="/api/v1")
+    return api
+
+
+def create_client(api):
+    import httpx
+
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=api),
+        base_url="http://benchmark",
+        timeout=None,
+    )
+
+
+# -------------------- LOAD GENERATION --------------------
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(latencies_ms: list, errors: int, wall_seconds: float) -> dict:
+    ordered = sorted(latencies_ms)
+    total = len(latencies_ms) + errors
+    return {
+        "requests": total,
+        "errors": errors,
+        "throughput_rps": round(total / wall_seconds, 3) if wall_seconds else 0.0,
+        "mean_ms": round(sum(ordered) / len(ordered), 2) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 50), 2),
+        "p95_ms": round(percentile(ordered, 95), 2),
+        "p99_ms": round(percentile(ordered, 99), 2),
+        "max_ms": round(ordered[-1], 2) if ordered else 0.0,
+    }
+
+
+async def run_load(send, total: int, concurrency: int) -> dict:
+    """
+    Calls `send(i)` (an async function returning an httpx.Response) `total` times
+    with at most `concurrency` requests in flight.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, errors = [], 0
+
+    async def one(i: int):
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await send(i)
+                ok = response.status_code < 400 and response.json().get("status", "success") == "success"
+            except Exception:
+                ok = False
+            elapsed = (time.perf_counter() - start) * 1000
+            if ok:
+                latencies.append(elapsed)
+            else:
+                errors += 1
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return summarize(latencies, errors, time.perf_counter() - wall_start)
+
+
+# -------------------- RESULT STORAGE --------------------
+
+def current_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(RESULTS_DIR),
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except Exception:
+        return "unknown"
+
+
+def save_results(suite: str, config: dict, endpoints: dict, results_dir: str = RESULTS_DIR) -> str:
+    """
+    Writes results to results/<suite>_<timestamp>_<commit>.json and returns the path.
+    """
+    os.makedirs(results_dir, exist_ok=True)
+    commit = current_commit()
+    stamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    path = os.path.join(results_dir, f"{suite}_{stamp}_{commit}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"suite": suite, "commit": commit, "timestamp": stamp, "config": config, "endpoints": endpoints},
+            f,
+            indent=2,
+        )
+    return path
+
+
+def load_previous(suite: str, exclude: str = None, results_dir: str = RESULTS_DIR):
+    if not os.path.isdir(results_dir):
+        return None
+    candidates = sorted(
+        name for name in os.listdir(results_dir)
+        if name.startswith(f"{suite}_") and name.endswith(".json")
+        and os.path.join(results_dir, name) != exclude
+    )
+    if not candidates:
+        return None
+    with open(os.path.join(results_dir, candidates[-1]), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def print_report(endpoints: dict, previous: dict = None):
+    """
+    Prints a per-endpoint table, with p95 and throughput deltas against the previous run.
+    """
+    header = f"{'endpoint':<40}{'req':>6}{'err':>5}{'rps':>9}{'p50':>10}{'p95':>10}{'p99':>10}"
+    if previous:
+        header += f"{'Δp95':>9}{'Δrps':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, stats in endpoints.items():
+        line = (
+            f"{name:<40}{stats['requests']:>6}{stats['errors']:>5}{stats['throughput_rps']:>9.2f}"
+            f"{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}"
+        )
+        before = (previous or {}).get("endpoints", {}).get(name)
+        if before:
+            line += f"{_delta(before['p95_ms'], stats['p95_ms']):>9}"
+            line += f"{_delta(before['throughput_rps'], stats['throughput_rps']):>9}"
+        print(line)
+    if previous:
+        print(f"(deltas vs commit {previous.get('commit')} @ {previous.get('timestamp')})")
+
+
+def _delta(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
@@ -0,0 +1,202 @@
+"""
+Offline end-to-end benchmark.
+
+Drives the real FastAPI routes with a fake Gemini client and an in-process
+Mongo stand-in, then reports throughput and p50/p95/p99 latency per endpoint.
+
+    cd server
+    python -m benchmarks.run_e2e --requests 40 --concurrency 8 --latency-ms 800 --jitter-ms 400
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SERVER_DIR not in sys.path:
+    sys.path.insert(0, SERVER_DIR)
+
+ENDPOINTS = ["auth_login", "resume_parse", "candidates_find", "candidates_find_global", "hr_candidates"]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Offline end-to-end API benchmark")
+    parser.add_argument("--requests", type=int, default=40, help="Requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=800.0, help="Fake LLM base latency")
+    parser.add_argument("--jitter-ms", type=float, default=400.0, help="Fake LLM uniform jitter")
+    parser.add_argument("--llm-failure-rate", type=float, default=0.0)
+    parser.add_argument("--cassette", default=None, help="Replay LLM responses from this JSONL cassette")
+    parser.add_argument("--cassette-mode", default="replay", choices=["replay", "record"])
+    parser.add_argument("--cassette-latency-scale", type=float, default=1.0)
+    parser.add_argument("--combined", action="store_true", help="Parse and match uploads in one LLM call")
+    parser.add_argument("--apollo-latency-ms", type=float, default=300.0, help="Fake Apollo API latency per page")
+    parser.add_argument("--resumes", type=int, default=5, help="Resumes in the folder scanned by /candidates/find")
+    parser.add_argument("--jobs", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--endpoints", nargs="*", default=ENDPOINTS, choices=ENDPOINTS)
+    parser.add_argument("--mongo-uri", default=None, help="Use a local MongoDB instead of mongomock")
+    parser.add_argument("--workdir", default=None, help="Scratch directory (defaults to a temp dir)")
+    parser.add_argument("--no-save", action="store_true", help="Do not write results/")
+    return parser.parse_args(argv)
+
+
+async def seed(args, corpus, settings):
+    """
+    Creates jobs, a verified user, an upload pool and the resumes folder contents.
+    """
+    from app.config import database
+    from app.repository.job_repository import JobRepository
+    from app.services.auth.auth_service import AuthService
+
+    job_ids = []
+    for i in range(args.jobs):
+        path = corpus.write_requirement(settings.REQUIREMENT_FOLDER, i)
+        job_ids.append(await JobRepository.create_job(corpus.job_record(i, path)))
+
+    await database.db.users.insert_one({
+        "full_name": "Benchmark User",
+        "email": "bench@example.com",
+        "hashed_password": AuthService.hash_password("Bench@123"),
+        "is_email_verified": True,
+    })
+
+    from app.services.utils.file_store import RESUME, get_file_store
+
+    for i in range(args.resumes):
+        path = corpus.write_resume(settings.RESUME_FOLDER, i, fmt="pdf" if i % 2 == 0 else "docx")
+        await get_file_store().import_file(path, RESUME)
+
+    pool_dir = os.path.join(args.workdir, "pool")
+    pool = []
+    for i in range(16):
+        fmt = "pdf" if i % 2 == 0 else "docx"
+        path = corpus.write_resume(pool_dir, 1000 + i, fmt=fmt, pages=1 + i % 3)
+        with open(path, "rb") as f:
+            pool.append((os.path.basename(path), f.read(), fmt))
+
+    return job_ids, pool
+
+
+def build_senders(client, job_ids, pool, corpus, admin_token, combined=False):
+    mime = {
+        "pdf": "application/pdf",
+        "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    }
+    requirement = corpus.requirement_text(0).encode("utf-8")
+
+    async def auth_login(i):
+        return await client.post(
+            "/api/v1/auth/login", json={"email": "bench@example.com", "password": "Bench@123"}
+        )
+
+    async def resume_parse(i):
+        name, content, fmt = pool[i % len(pool)]
+        return await client.post(
+            "/api/v1/ai/resume/parse",
+            files={"resume": (f"{i}_{name}", content, mime[fmt])},
+            data={"job_id": job_ids[i % len(job_ids)], "combined": str(combined).lower()},
+        )
+
+    async def candidates_find(i):
+        return await client.post(
+            "/api/v1/ai/candidates/find",
+            files={"requirement_file": (f"requirement_{i}.txt", requirement, "text/plain")},
+            data={"top_n": "5"},
+        )
+
+    async def candidates_find_global(i):
+        return await client.post(
+            "/api/v1/ai/candidates/find",
+            files={"requirement_file": (f"requirement_{i}.txt", requirement, "text/plain")},
+            data={"top_n": "5", "global_search": "true"},
+        )
+
+    async def hr_candidates(i):
+        return await client.get(
+            "/api/v1/hr-admin/candidates", headers={"Authorization": f"Bearer {admin_token}"}
+        )
+
+    return {
+        "auth_login": auth_login,
+        "resume_parse": resume_parse,
+        "candidates_find": candidates_find,
+        "candidates_find_global": candidates_find_global,
+        "hr_candidates": hr_candidates,
+    }
+
+
+async def main_async(args):
+    from app.config.config import settings
+    from app.services.auth.auth_service import AuthService
+    from app.services.utils.llm_client import get_llm
+    from benchmarks import fake_mongo, harness
+    from benchmarks.fake_apollo import FakeApolloServer
+    from benchmarks.fake_llm import FakeChatGoogleGenerativeAI
+    from benchmarks.synthetic_docs import SyntheticCorpus
+
+    fake_llm = FakeChatGoogleGenerativeAI(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        seed=args.seed,
+        failure_rate=args.llm_failure_rate,
+    )
+    settings.llm = fake_llm
+    if args.cassette:
+        # Production-shaped responses and latencies; the fake LLM only answers
+        # prompt templates the cassette has never seen.
+        settings.LLM_CASSETTE_MODE = args.cassette_mode
+        settings.LLM_CASSETTE_PATH = os.path.abspath(args.cassette)
+        settings.LLM_CASSETTE_LATENCY_SCALE = args.cassette_latency_scale
+    fake_mongo.install_database(fake_mongo.create_database(args.mongo_uri))
+    fake_apollo = FakeApolloServer(latency_ms=args.apollo_latency_ms, seed=args.seed).start()
+    settings.APOLLO_BASE_URL = fake_apollo.base_url
+    settings.APOLLO_API_KEY = "benchmark"
+
+    corpus = SyntheticCorpus(seed=args.seed)
+    job_ids, pool = await seed(args, corpus, settings)
+    admin_token = AuthService.create_token({"sub": settings.ADMIN_EMAIL, "type": "admin"})
+
+    api = harness.create_app()
+    results = {}
+    async with harness.create_client(api) as client:
+        senders = build_senders(client, job_ids, pool, corpus, admin_token, combined=args.combined)
+        for name in args.endpoints:
+            calls_before = fake_llm.calls
+            stats = await harness.run_load(senders[name], args.requests, args.concurrency)
+            stats["llm_calls"] = fake_llm.calls - calls_before
+            if name == "candidates_find_global":
+                stats["apollo"] = {"requests": fake_apollo.requests, "connections": fake_apollo.connections}
+            if args.cassette:
+                stats["cassette"] = get_llm().stats()
+            results[name] = stats
+            print(f"✅ {name}: {stats['requests']} requests, p95 {stats['p95_ms']} ms")
+
+    config = {k: v for k, v in vars(args).items() if k not in ("workdir", "mongo_uri")}
+    config["mongo"] = "local" if args.mongo_uri else "mongomock"
+    previous = harness.load_previous("e2e")
+    if not args.no_save:
+        path = harness.save_results("e2e", config, results)
+        print(f"💾 Results saved to {path}")
+    harness.print_report(results, previous)
+    return results
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    args.workdir = os.path.abspath(args.workdir or tempfile.mkdtemp(prefix="resume_bench_"))
+    if args.cassette:
+        args.cassette = os.path.abspath(args.cassette)
+    os.makedirs(args.workdir, exist_ok=True)
+
+    # Uploads (and the middleware's relative "uploads" folders) live in the scratch dir.
+    os.chdir(args.workdir)
+    os.environ["UPLOAD_FOLDER"] = os.path.join(args.workdir, "uploads")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import os
+import random
+
+
+FIRST_NAMES = ["Aarav", "Diya", "Vihaan", "Ananya", "Arjun", "Isha", "Kabir", "Meera", "Rohan", "Sara"]
+LAST_NAMES = ["Sharma", "Patel", "Iyer", "Reddy", "Gupta", "Khan", "Nair", "Das", "Mehta", "Singh"]
+SKILLS = [
+    "Python", "FastAPI", "Django", "MongoDB", "PostgreSQL", "Docker", "Kubernetes", "AWS",
+    "GCP", "React", "TypeScript", "Go", "Java", "Spark", "Machine Learning", "CI/CD",
+]
+TITLES = ["Backend Engineer", "Data Engineer", "Full Stack Developer", "ML Engineer", "DevOps Engineer"]
+
+
+class SyntheticCorpus:
+    """
+    Generates reproducible resumes (PDF/DOCX) and job requirements for benchmarks.
+    """
+
+    def __init__(self, seed: int = 7):
+        self.seed = seed
+
+    # -------------------- TEXT --------------------
+    def resume_text(self, index: int, pages: int = 1) -> str:
+        rng = random.Random(f"{self.seed}-resume-{index}")
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        lines = [
+            f"{first} {last}",
+            f"{first.lower()}.{last.lower()}{index}@example.com | +91 9{rng.randint(100000000, 999999999)}",
+            f"linkedin.com/in/{first.lower()}-{last.lower()}-{index}",
+            "",
+            "SUMMARY",
+            f"{rng.choice(TITLES)} with {rng.randint(1, 12)} years of experience building production systems.",
+            "",
+            "SKILLS",
+            ", ".join(rng.sample(SKILLS, rng.randint(4, 9))),
+            "",
+            "EXPERIENCE",
+        ]
+        for job in range(rng.randint(2, 4) * pages):
+            lines += [
+                f"{rng.choice(TITLES)} - Company {rng.randint(1, 900)} ({2012 + job} - {2014 + job})",
+                "- Designed and shipped services handling millions of requests per day.",
+                "- Led migrations, reviewed code and mentored engineers.",
+                "- Improved latency and reliability through profiling and caching.",
+            ]
+        lines += [
+            "",
+            "EDUCATION",
+            f"B.Tech in Computer Science - Institute {rng.randint(1, 50)} ({rng.randint(2005, 2022)})",
+            "",
+            "References available on request.",
+        ]
+        return "\n".join(lines)
+
+    def requirement_text(self, index: int) -> str:
+        rng = random.Random(f"{self.seed}-job-{index}")
+        title = rng.choice(TITLES)
+        skills = rng.sample(SKILLS, 6)
+        return (
+            f"Title: {title}\n"
+            f"Description: We are hiring a {title} to build and scale our hiring platform.\n"
+            f"Responsibilities: Design APIs, Own services end to end, Mentor engineers\n"
+            f"Requirements: {rng.randint(2, 6)}+ years of experience, Strong fundamentals\n"
+            f"Skills: {', '.join(skills)}\n"
+            f"Qualifications: B.Tech or equivalent\n"
+            f"Location: {rng.choice(['Bengaluru', 'Pune', 'Remote'])}\n"
+            f"Employment Type: Full-time\n"
+            f"Experience: {rng.randint(2, 6)}-{rng.randint(7, 10)} years\n"
+        )
+
+    def job_record(self, index: int, file_path: str) -> dict:
+        rng = random.Random(f"{self.seed}-job-{index}")
+        title = rng.choice(TITLES)
+        return {
+            "title": title,
+            "description": f"We are hiring a {title} to build and scale our hiring platform.",
+            "responsibilities": ["Design APIs", "Own services end to end", "Mentor engineers"],
+            "requirements": [f"{rng.randint(2, 6)}+ years of experience"],
+            "skills": rng.sample(SKILLS, 6),
+            "qualifications": ["B.Tech or equivalent"],
+            "location": rng.choice(["Bengaluru", "Pune", "Remote"]),
+            "employment_type": "Full-time",
+            "experience": "3-5 years",
+            "file_path": file_path,
+        }
+
+    # -------------------- FILES --------------------
+    @staticmethod
+    def write_pdf(path: str, text: str) -> str:
+        import pymupdf
+
+        doc = pymupdf.open()
+        lines = text.splitlines()
+        per_page = 60
+        for start in range(0, max(len(lines), 1), per_page):
+            page = doc.new_page()
+            y = 50
+            for line in lines[start:start + per_page]:
+                page.insert_text((50, y), line, fontsize=10)
+                y += 12
+        doc.save(path)
+        doc.close()
+        return path
+
+    @staticmethod
+    def write_docx(path: str, text: str) -> str:
+        from docx import Document
+
+        doc = Document()
+        for line in text.splitlines():
+            doc.add_paragraph(line)
+        doc.save(path)
+        return path
+
+    def write_resume(self, folder: str, index: int, fmt: str = "pdf", pages: int = 1) -> str:
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"candidate_{index:05d}.{fmt}")
+        text = self.resume_text(index, pages=pages)
+        return self.write_pdf(path, text) if fmt == "pdf" else self.write_docx(path, text)
+
+    def write_requirement(self, folder: str, index: int) -> str:
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"requirement_{index:05d}.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.requirement_text(index))
+        return path